@@ -24,7 +24,7 @@ import matplotlib.pyplot as pyplot
 
 NUM_SIGMAS = 1
 
-class Height(thinkbayes2.Suite, thinkbayes2.Joint):
+class Height(thinkbayes2.Suite, thinkbayes2.GridJoint):
     """Hypotheses about parameters of the distribution of height."""
 
     def __init__(self, mus, sigmas, label=None):
@@ -34,11 +34,8 @@ class Height(thinkbayes2.Suite, thinkbayes2.Joint):
         sigmas: sequence of possible sigmas
         label: string label for the Suite
         """
-        pairs = [(mu, sigma) 
-                 for mu in mus
-                 for sigma in sigmas]
-
-        thinkbayes2.Suite.__init__(self, pairs, label=label)
+        thinkbayes2.GridJoint.__init__(self, [mus, sigmas],
+                                       names=['mu', 'sigma'], label=label)
 
     def Likelihood(self, data, hypo):
         """Computes the likelihood of the data under the hypothesis.
@@ -55,6 +52,19 @@ class Height(thinkbayes2.Suite, thinkbayes2.Joint):
         like = scipy.stats.norm.pdf(x, mu, sigma)
         return like
 
+    def Likelihoods(self, data, hypos):
+        """Computes the likelihood of the data under all hypotheses at once.
+
+        Args:
+            data: float sample
+            hypos: array with one row of mu and sigma per hypothesis
+
+        Returns:
+            array of likelihoods
+        """
+        mus, sigmas = hypos.T
+        return scipy.stats.norm.pdf(data, mus, sigmas)
+
     def LogLikelihood(self, data, hypo):
         """Computes the log likelihood of the data under the hypothesis.
 
@@ -70,6 +80,19 @@ class Height(thinkbayes2.Suite, thinkbayes2.Joint):
         loglike = EvalNormalLogPdf(x, mu, sigma)
         return loglike
 
+    def LogLikelihoods(self, data, hypos):
+        """Computes the log likelihood of the data under all hypotheses.
+
+        Args:
+            data: float sample
+            hypos: array with one row of mu and sigma per hypothesis
+
+        Returns:
+            array of log likelihoods
+        """
+        mus, sigmas = hypos.T
+        return EvalNormalLogPdf(data, mus, sigmas)
+
     def LogUpdateSetFast(self, data):
         """Updates the suite using a faster implementation.
 
@@ -78,14 +101,16 @@ class Height(thinkbayes2.Suite, thinkbayes2.Joint):
         Args:
             data: sequence of values
         """
-        xs = tuple(data)
+        xs = numpy.asarray(data)
         n = len(xs)
 
-        for hypo in self.Values():
-            mu, sigma = hypo
-            total = Summation(xs, mu)
-            loglike = -n * math.log(sigma) - total / 2 / sigma**2
-            self.Incr(hypo, loglike)
+        hypos, _ = self.GetArrays()
+        mus, sigmas = hypos.T
+
+        # sum of (x-mu)**2 for each mu, from the mean and sum of squares
+        m = xs.mean()
+        total = n * (mus - m)**2 + ((xs - m)**2).sum()
+        self._AddProbs(-n * numpy.log(sigmas) - total / 2 / sigmas**2)
 
     def LogUpdateSetMeanVar(self, data):
         """Updates the suite using ABC and mean/var.
@@ -123,18 +148,18 @@ class Height(thinkbayes2.Suite, thinkbayes2.Joint):
         m: estimated central tendency
         s: estimated spread
         """
-        for hypo in sorted(self.Values()):
-            mu, sigma = hypo
+        hypos, _ = self.GetArrays()
+        mus, sigmas = hypos.T
 
-            # compute log likelihood of m, given hypo
-            stderr_m = sigma / math.sqrt(n)
-            loglike = EvalNormalLogPdf(m, mu, stderr_m)
+        # compute log likelihood of m, given each hypo
+        stderr_m = sigmas / math.sqrt(n)
+        loglike = EvalNormalLogPdf(m, mus, stderr_m)
 
-            #compute log likelihood of s, given hypo
-            stderr_s = sigma / math.sqrt(2 * (n-1))
-            loglike += EvalNormalLogPdf(s, sigma, stderr_s)
+        #compute log likelihood of s, given each hypo
+        stderr_s = sigmas / math.sqrt(2 * (n-1))
+        loglike += EvalNormalLogPdf(s, sigmas, stderr_s)
 
-            self.Incr(hypo, loglike)
+        self._AddProbs(loglike)
 
 
 def EvalNormalLogPdf(x, mu, sigma):
@@ -189,24 +214,6 @@ def FindPriorRanges(xs, num_points, num_stderrs=3.0, median_flag=False):
     return mus, sigmas
 
 
-def Summation(xs, mu, cache={}):
-    """Computes the sum of (x-mu)**2 for x in t.
-
-    Caches previous results.
-
-    xs: tuple of values
-    mu: hypothetical mean
-    cache: cache of previous results
-    """
-    try:
-        return cache[xs, mu]
-    except KeyError:
-        ds = [(x-mu)**2 for x in xs]
-        total = sum(ds)
-        cache[xs, mu] = total
-        return total
-
-
 def CoefVariation(suite):
     """Computes the distribution of CV.
 
@@ -0,0 +1,456 @@
+"""Tests for thinkbayes2.
+
+The distributions can be stored as a dict or as sorted arrays; most
+tests build the same distribution both ways and check that they agree.
+
+Run with: python -m pytest test_thinkbayes2.py
+"""
+
+from __future__ import print_function, division
+
+import math
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+import thinkbayes2
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'Ch10'))
+import variability  # noqa: E402
+
+
+VALUES = [5, 1, 3, 3, 8, 2, 3, 8]
+
+
+def MakeBoth(values=VALUES, cls=thinkbayes2.Pmf):
+    """Makes the same distribution with dict and with array storage."""
+    by_dict = cls(list(values))
+    by_array = cls(np.array(values))
+    assert by_dict._d is not None
+    assert by_array._d is None
+    return by_dict, by_array
+
+
+def AssertSameItems(dist1, dist2):
+    items1 = sorted(dist1.Items())
+    items2 = sorted(dist2.Items())
+    assert [x for x, _ in items1] == [x for x, _ in items2]
+    np.testing.assert_allclose([p for _, p in items1], [p for _, p in items2])
+
+
+def test_storage_modes_agree():
+    by_dict, by_array = MakeBoth()
+    AssertSameItems(by_dict, by_array)
+    assert by_dict == by_array
+    assert len(by_dict) == len(by_array)
+    assert sorted(by_dict) == list(by_array)
+    assert 3 in by_array and 4 not in by_array
+
+    for method in ['Total', 'MaxLike', 'Mean', 'Var', 'Mode', 'Std']:
+        assert getattr(by_dict, method)() == pytest.approx(
+            getattr(by_array, method)()), method
+
+    for x in [0, 2, 3, 9]:
+        assert by_dict.Prob(x) == pytest.approx(by_array.Prob(x))
+        assert by_dict.ProbGreater(x) == pytest.approx(by_array.ProbGreater(x))
+        assert by_dict.ProbLess(x) == pytest.approx(by_array.ProbLess(x))
+    np.testing.assert_allclose(by_dict.Probs([1, 4, 8]), by_array.Probs([1, 4, 8]))
+
+    for percentage in [0, 10, 50, 90, 100]:
+        assert by_dict.Percentile(percentage) == by_array.Percentile(percentage)
+    assert by_dict.Largest(2) == by_array.Largest(2)
+    assert by_dict.Smallest(2) == by_array.Smallest(2)
+
+    xs, ps = by_array.Render()
+    assert list(xs) == [1, 2, 3, 5, 8]
+    np.testing.assert_allclose(ps, [by_dict[x] for x in xs])
+
+
+def test_hist_storage_modes_agree():
+    by_dict, by_array = MakeBoth(cls=thinkbayes2.Hist)
+    AssertSameItems(by_dict, by_array)
+    assert by_dict.Freq(3) == by_array.Freq(3) == 3
+    assert by_array.Freq(4) == 0
+    assert by_array.Freqs([3, 8]) == [3, 2]
+
+
+def test_transforms_agree():
+    by_dict, by_array = MakeBoth()
+    for dist in [by_dict, by_array]:
+        dist.Log()
+    AssertSameItems(by_dict, by_array)
+    for dist in [by_dict, by_array]:
+        dist.Exp()
+        dist.Normalize(fraction=2)
+    AssertSameItems(by_dict, by_array)
+
+    scaled = [dist.Scale(2) for dist in [by_dict, by_array]]
+    AssertSameItems(*scaled)
+    assert by_array._d is None and scaled[1]._d is None
+
+    # Mult and Incr go through the dict
+    for dist in [by_dict, by_array]:
+        dist.Mult(8, 0.5)
+        dist.Incr(6, 0.25)
+    AssertSameItems(by_dict, by_array)
+
+
+@pytest.mark.parametrize('arrays', [False, True])
+def test_log_removes_zeros_and_keeps_errors(arrays):
+    def Make(p2=0.5):
+        if arrays:
+            return thinkbayes2.MakePmfFromArrays([1, 2, 3], [0.5, p2, 0])
+        return thinkbayes2.Pmf({1: 0.5, 2: p2, 3: 0})
+
+    pmf = Make()
+    pmf.Log()
+    assert sorted(pmf.Values()) == [1, 2]
+    assert (pmf._d is None) == arrays
+
+    with pytest.raises(ValueError):
+        Make(p2=-0.5).Log()
+    with pytest.raises(ZeroDivisionError):
+        Make().Log(m=0)
+
+    pmf = Make()
+    pmf.Log()
+    with pytest.raises(OverflowError):
+        pmf.Exp(m=-1000)
+
+
+def test_dict_view():
+    pmf = thinkbayes2.MakePmfFromArrays([1, 2, 3], [1, 1, 2])
+    d = pmf.d
+    assert pmf._d is d and pmf._xs is None
+    assert d == {1: 0.25, 2: 0.25, 3: 0.5}
+
+    # changes to the dict are changes to the Pmf, and stay visible
+    d[4] = 0.5
+    pmf.Normalize()
+    assert pmf.Prob(4) == pytest.approx(1 / 3)
+    assert d[4] == pytest.approx(1 / 3)
+
+
+def test_copies_are_independent():
+    _, by_array = MakeBoth()
+    copy = by_array.Copy()
+    copy.Mult(3, 0)
+    assert by_array[3] == pytest.approx(3 / 8)
+
+    cdf = thinkbayes2.Cdf(by_array)
+    cdf.xs[0] = 100
+    assert by_array.Values()[0] == 1
+
+    xs, ps = by_array.GetArrays()
+    assert xs is by_array._xs
+
+
+def test_cdf_agrees():
+    by_dict, by_array = MakeBoth()
+    cdf1 = thinkbayes2.Cdf(by_dict)
+    cdf2 = thinkbayes2.Cdf(by_array)
+    assert list(cdf1.xs) == list(cdf2.xs)
+    np.testing.assert_allclose(cdf1.ps, cdf2.ps)
+
+
+def test_tuple_values():
+    pairs = [(1, 2.0), (1, 3.0), (0, 1.0), (1, 3.0)]
+    by_dict = thinkbayes2.Pmf(pairs)
+    by_array = thinkbayes2.Pmf(np.array(pairs))
+    AssertSameItems(by_dict, by_array)
+    assert by_array[(1, 3.0)] == pytest.approx(0.5)
+    assert by_dict.Mode() == by_array.Mode()
+    assert by_dict.MaxLike() == by_array.MaxLike()
+
+
+def test_random_is_in_support():
+    random.seed(1)
+    _, by_array = MakeBoth()
+    sample = [by_array.Random() for _ in range(100)]
+    assert set(sample) <= set(VALUES)
+
+
+class Coin(thinkbayes2.Suite):
+    def Likelihood(self, data, hypo):
+        return hypo if data == 'H' else 1 - hypo
+
+
+def test_suite_update_agrees():
+    by_dict = Coin(list(np.linspace(0, 1, 11)))
+    by_array = Coin(np.linspace(0, 1, 11))
+    for suite in [by_dict, by_array]:
+        suite.UpdateSet('HHTHT')
+    AssertSameItems(by_dict, by_array)
+    assert by_dict.Mean() == pytest.approx(by_array.Mean())
+
+
+class Dice(thinkbayes2.Suite):
+    def Likelihood(self, data, hypo):
+        return 0 if data > hypo else 1 / hypo
+
+    def Likelihoods(self, data, hypos):
+        return np.where(data > hypos, 0, 1 / hypos)
+
+    def LogLikelihood(self, data, hypo):
+        return -math.log(hypo)
+
+    def LogLikelihoods(self, data, hypos):
+        return -np.log(hypos)
+
+
+class LoopDice(Dice):
+    Likelihoods = thinkbayes2.Suite.Likelihoods
+    LogLikelihoods = thinkbayes2.Suite.LogLikelihoods
+
+
+@pytest.mark.parametrize('method', ['LogUpdateSet', 'UpdateSet'])
+def test_suite_update_integer_counts(method):
+    suites = []
+    for cls in [Dice, LoopDice]:
+        suite = cls()
+        suite.SetArrays(np.array([4, 6, 8, 12]), np.array([1, 3, 2, 1]))
+        getattr(suite, method)([3, 5, 2])
+        suites.append(suite)
+    assert suites[0]._d is None
+    AssertSameItems(*suites)
+
+
+class LoopHeight(variability.Height):
+    """Height that updates one hypothesis at a time."""
+    Likelihoods = thinkbayes2.Suite.Likelihoods
+    LogLikelihoods = thinkbayes2.Suite.LogLikelihoods
+
+
+@pytest.mark.parametrize('update', [variability.UpdateSuite1,
+                                    variability.UpdateSuite2,
+                                    variability.UpdateSuite3])
+def test_height_update_matches_loop(update):
+    xs = np.random.RandomState(17).normal(170, 7, 20)
+    mus, sigmas = np.linspace(165, 175, 11), np.linspace(5, 9, 9)
+
+    by_array = variability.Height(mus, sigmas)
+    update(by_array, xs)
+    assert by_array._d is None
+
+    by_loop = LoopHeight(mus, sigmas)
+    variability.UpdateSuite1(by_loop, xs)
+    assert by_loop._d is not None
+
+    AssertSameItems(by_array, by_loop)
+
+
+def PairwiseLoop(pmf1, pmf2, op):
+    """The distribution of op(v1, v2), one pair at a time."""
+    pmf = thinkbayes2.Pmf()
+    for v1, p1 in pmf1.Items():
+        for v2, p2 in pmf2.Items():
+            pmf.Incr(op(v1, v2), p1 * p2)
+    return pmf
+
+
+def AssertMatchesLoop(result, loop):
+    """Checks a result against the pairwise loop.
+
+    Every value of the result is a value the loop produces; the loop can
+    produce several values that differ by round off for the same sum,
+    and their probs add up to the prob of the result's value.
+    """
+    xs = np.array(sorted(result.Values()))
+    assert set(xs.tolist()) <= set(loop.Values())
+    totals = np.zeros(len(xs))
+    for x, p in loop.Items():
+        i = np.argmin(abs(xs - x))
+        assert xs[i] == pytest.approx(x, abs=1e-9)
+        totals[i] += p
+    np.testing.assert_allclose(totals, [result[x] for x in xs], atol=1e-12)
+
+
+GRID_CASES = [
+    (thinkbayes2.MakeUniformPmf(0.1, 0.7, 7), thinkbayes2.MakeUniformPmf(0.1, 0.9, 9)),
+    (thinkbayes2.MakeUniformPmf(0, 1, 11), thinkbayes2.MakeUniformPmf(0.05, 0.55, 6)),
+    (thinkbayes2.Pmf(range(1, 7)), thinkbayes2.Pmf([1, 2, 3, 4])),
+    (thinkbayes2.Pmf({0: 0.5, 10: 0.25, 20: 0.25}), thinkbayes2.Pmf(range(1, 7))),
+    (thinkbayes2.Pmf({0.1: 0.5, 0.4: 0.3, 0.5: 0.2}),
+     thinkbayes2.Pmf({0.2: 0.5, 0.3: 0.5})),
+    (thinkbayes2.Pmf({0.1: 0.5, -0.35: 0.2, 1.7: 0.3}), thinkbayes2.Pmf(range(1, 7))),
+    (thinkbayes2.MakeUniformPmf(0, 3, 301), thinkbayes2.MakeUniformPmf(1, 2, 201)),
+]
+
+
+@pytest.mark.parametrize('pmf1, pmf2', GRID_CASES)
+def test_add_and_sub_match_loop(pmf1, pmf2):
+    AssertMatchesLoop(pmf1 + pmf2, PairwiseLoop(pmf1, pmf2, lambda a, b: a + b))
+    AssertMatchesLoop(pmf1 - pmf2, PairwiseLoop(pmf1, pmf2, lambda a, b: a - b))
+
+
+def test_add_keys_are_exact_sums():
+    total = (thinkbayes2.MakeUniformPmf(0.1, 0.7, 7) +
+             thinkbayes2.MakeUniformPmf(0.1, 0.9, 9))
+    assert total[0.6] > 0
+    assert total.Total() == pytest.approx(1)
+
+    dice = thinkbayes2.Pmf(range(1, 7))
+    two = dice + dice
+    assert two[7] == pytest.approx(1 / 6)
+    assert all(isinstance(x, int) for x in two.Values())
+
+
+def test_pmf_sum():
+    dice = thinkbayes2.Pmf(range(1, 7))
+    three = thinkbayes2.PmfSum([dice, dice, dice.MakeCdf()])
+    assert three.Mean() == pytest.approx(10.5)
+    assert three[3] == pytest.approx(1 / 216)
+
+
+PRODUCT_CASES = [
+    (thinkbayes2.Pmf(range(1, 7)), thinkbayes2.Pmf(range(1, 7))),
+    (thinkbayes2.Pmf({0.5: 0.5, -2: 0.25, 3: 0.25}), thinkbayes2.Pmf([1, 2, 4])),
+    (thinkbayes2.MakeUniformPmf(0.1, 0.9, 9), thinkbayes2.MakeUniformPmf(1, 3, 5)),
+]
+
+
+@pytest.mark.parametrize('pmf1, pmf2', PRODUCT_CASES)
+def test_mul_and_div_match_loop(pmf1, pmf2):
+    AssertSameItems(pmf1.MulPmf(pmf2), PairwiseLoop(pmf1, pmf2, lambda a, b: a * b))
+    AssertSameItems(pmf1.DivPmf(pmf2), PairwiseLoop(pmf1, pmf2, lambda a, b: a / b))
+    AssertSameItems(pmf1 * pmf2, pmf1.MulPmf(pmf2))
+    AssertSameItems(pmf1 / pmf2, pmf1.DivPmf(pmf2))
+
+
+@pytest.mark.parametrize('bins', [None, 4])
+def test_mul_and_div_empty(bins):
+    dice = thinkbayes2.Pmf(range(1, 7))
+    empty = thinkbayes2.Pmf()
+    for pmf1, pmf2 in [(dice, empty), (empty, dice), (empty, empty)]:
+        for result in [pmf1.MulPmf(pmf2, bins), pmf1.DivPmf(pmf2, bins)]:
+            assert len(result) == 0
+            assert result.Total() == 0
+
+
+def test_div_by_zero():
+    dice = thinkbayes2.Pmf(range(1, 7))
+    with pytest.raises(ZeroDivisionError):
+        dice.DivPmf(thinkbayes2.Pmf([0, 1, 2]))
+    with pytest.raises(ZeroDivisionError):
+        dice / thinkbayes2.Pmf({0: 0.5, 1: 0.5})
+
+
+def test_bins_only_when_needed():
+    dice = thinkbayes2.Pmf(range(1, 7))
+    # 36 pairs but only 18 distinct products, so nothing is binned
+    AssertSameItems(dice.MulPmf(dice, bins=20), dice.MulPmf(dice))
+    AssertSameItems(dice.DivPmf(dice, bins=30), dice.DivPmf(dice))
+
+    binned = dice.MulPmf(dice, bins=10)
+    assert len(binned) <= 10
+    assert binned.Total() == pytest.approx(1)
+    assert binned.Mean() == pytest.approx(dice.Mean() ** 2)
+
+
+def test_bins_across_chunks(monkeypatch):
+    monkeypatch.setattr(thinkbayes2, 'OUTER_CHUNK_SIZE', 50)
+    pmf1 = thinkbayes2.MakeUniformPmf(1, 2, 40)
+    pmf2 = thinkbayes2.MakeUniformPmf(1, 3, 30)
+    exact = pmf1.MulPmf(pmf2)
+
+    # the exact result fits, even though it takes several chunks to find
+    AssertSameItems(pmf1.MulPmf(pmf2, bins=len(exact)), exact)
+
+    binned = pmf1.MulPmf(pmf2, bins=25)
+    assert len(binned) <= 25
+    assert binned.Total() == pytest.approx(1)
+    assert binned.Mean() == pytest.approx(exact.Mean())
+    assert min(binned.Values()) >= min(exact.Values())
+    assert max(binned.Values()) <= max(exact.Values())
+
+
+def MakeJoints(zero=False):
+    """Makes a GridJoint and a Joint with the same items."""
+    coords = [[3, 1, 2], [0.5, 1.0, 1.5, 2.0], [10, 20]]
+    ps = np.random.RandomState(3).random_sample((3, 4, 2))
+    if zero:
+        ps[1, 2, 0] = 0
+    grid = thinkbayes2.GridJoint(coords, ps, names=['mu', 'sigma', 'n'])
+    joint = thinkbayes2.Joint(dict(grid.Items()))
+    return grid, joint
+
+
+def AssertJointsAgree(grid, joint):
+    for i, name in enumerate(grid.names):
+        AssertSameItems(grid.Marginal(i), joint.Marginal(i))
+        AssertSameItems(grid.Marginal(name), joint.Marginal(i))
+
+    for i in range(3):
+        for j in range(3):
+            if i == j:
+                continue
+            for val in grid.coords[j]:
+                AssertSameItems(grid.Conditional(i, j, val),
+                                joint.Conditional(i, j, val))
+    AssertSameItems(grid.Conditional('mu', 'n', 20), joint.Conditional(0, 2, 20))
+
+    for percentage in [10, 50, 90, 100]:
+        assert (grid.MaxLikeInterval(percentage) ==
+                joint.MaxLikeInterval(percentage))
+
+
+def test_grid_joint_matches_joint():
+    grid, joint = MakeJoints()
+    assert grid._OnGrid()
+    AssertJointsAgree(grid, joint)
+    assert grid._OnGrid()
+    assert grid.GetGrid().shape == (3, 4, 2)
+
+
+def test_grid_joint_ties():
+    grid = thinkbayes2.GridJoint([[1, 2], [3, 4]], names=['a', 'b'])
+    joint = thinkbayes2.Joint(dict(grid.Items()))
+    # all probs are equal, so the order comes from the values
+    for percentage in [25, 50, 75, 100]:
+        assert (grid.MaxLikeInterval(percentage) ==
+                joint.MaxLikeInterval(percentage))
+
+
+def test_grid_joint_fallback_after_d_changes():
+    grid, joint = MakeJoints()
+    for dist in [grid, joint]:
+        dist.d[(2, 1.0, 10)] += 0.5
+        del dist.d[(3, 2.0, 20)]
+        dist.d[(4, 1.0, 10)] = 0.25
+        dist.Normalize()
+    assert not grid._OnGrid()
+    with pytest.raises(ValueError):
+        grid.GetGrid()
+    AssertJointsAgree(grid, joint)
+
+
+@pytest.mark.parametrize('zero', [False, True])
+def test_grid_joint_after_log_exp(zero):
+    grid, joint = MakeJoints(zero)
+    for dist in [grid, joint]:
+        dist.Log()
+    AssertSameItems(grid, joint)
+    for dist in [grid, joint]:
+        dist.Exp()
+        dist.Normalize()
+    # removing the zero leaves a hole in the grid
+    assert grid._OnGrid() != zero
+    AssertJointsAgree(grid, joint)
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.uint64, np.int8, np.int16,
+                                   np.float16, np.float32])
+def test_small_dtypes_do_not_wrap(dtype):
+    pmf1 = thinkbayes2.MakePmfFromArrays(np.array([1, 2, 100], dtype=dtype),
+                                         [1, 1, 2])
+    pmf2 = thinkbayes2.MakePmfFromArrays(np.array([3, 5, 120], dtype=dtype),
+                                         [2, 1, 1])
+    # the loop on Python numbers, which don't overflow
+    plain1, plain2 = [thinkbayes2.Pmf(dict(pmf.Items())) for pmf in (pmf1, pmf2)]
+    assert all(type(x) in (int, float) for x in plain1.Values())
+    for op in [lambda a, b: a + b, lambda a, b: a - b,
+               lambda a, b: a * b, lambda a, b: a / b]:
+        AssertSameItems(op(pmf1, pmf2), PairwiseLoop(plain1, plain2, op))
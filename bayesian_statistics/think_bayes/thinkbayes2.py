@@ -23,6 +23,7 @@ Pdf: represents a continuous probability density function
 
 import bisect
 import copy
+import itertools
 import logging
 import math
 import random
@@ -40,6 +41,7 @@ import scipy
 from scipy import stats
 from scipy import special
 from scipy import ndimage
+from scipy import signal
 
 from scipy.special import gamma
 
@@ -133,17 +135,255 @@ class Interpolator(object):
 DEFAULT_LABEL = '_nolegend_' 
 
 
+def _SortedSupport(xs, ps):
+    """Sorts values and adds up the probabilities of repeated values.
+
+    xs: array of values, 1-D, or 2-D with one row per tuple value
+    ps: array of freqs/probs
+
+    Returns: sorted array of distinct values, array of freqs/probs
+    """
+    xs = np.asarray(xs)
+    ps = np.asarray(ps)
+    if len(xs) == 0:
+        return xs, ps
+    if xs.ndim == 1:
+        order = np.argsort(xs, kind='stable')
+    else:
+        order = np.lexsort(xs.T[::-1])
+    xs = xs[order]
+    ps = ps[order]
+
+    new = np.empty(len(xs), dtype=bool)
+    new[0] = True
+    if xs.ndim == 1:
+        new[1:] = xs[1:] != xs[:-1]
+    else:
+        new[1:] = np.any(xs[1:] != xs[:-1], axis=1)
+    if not new.all():
+        starts = np.flatnonzero(new)
+        xs = xs[starts]
+        ps = np.add.reduceat(ps, starts)
+    return xs, ps
+
+
+def _GridIndex(xs, step, max_size):
+    """Finds the positions of values on a regular grid.
+
+    xs: sorted 1-D array of values
+    step: grid spacing
+    max_size: largest acceptable grid
+
+    Returns: int array of positions on the grid xs[0], xs[0]+step, ...,
+             or None if some value is off the grid or the grid is too large
+    """
+    k = (xs - xs[0]) / step
+    index = np.rint(k)
+    if not np.allclose(k, index, rtol=0, atol=1e-6):
+        return None
+    if index[-1] >= max_size:
+        return None
+    return index.astype(int)
+
+
+# Below this length the direct convolution beats the FFT.
+FFT_MIN_SIZE = 128
+
+
+def _Convolve(a, b):
+    """Convolves two arrays of probs, with the FFT for long arrays."""
+    if min(len(a), len(b)) < FFT_MIN_SIZE:
+        return np.convolve(a, b)
+    c = signal.fftconvolve(a, b)
+    # round off can leave small negative values
+    np.maximum(c, 0, out=c)
+    return c
+
+
+def _EndsFirst(n):
+    """Yields 0, n-1, 1, n-2, ... : the indices of n items, ends first."""
+    lo, hi = 0, n - 1
+    while lo <= hi:
+        yield lo
+        if hi != lo:
+            yield hi
+        lo += 1
+        hi -= 1
+
+
+def _GridSums(xs1, index1, xs2, index2, reached):
+    """Gets a value for each grid position some pair of values adds up to.
+
+    Pairs are taken a row (one value of xs1 with all of xs2) or a column
+    at a time, from the ends of both supports inwards, which covers the
+    reached positions after a few rows and columns unless the supports
+    are very sparse.
+
+    xs1, xs2: sorted 1-D arrays of numbers
+    index1, index2: their positions on a common grid
+    reached: boolean array, the positions some pair adds up to
+
+    Returns: array with, for each reached position, the sum of a pair of
+             values that lands there
+    """
+    sums = np.zeros(len(reached), dtype=np.result_type(xs1, xs2))
+    found = np.zeros(len(reached), dtype=bool)
+    remaining = reached.sum()
+    rows = _EndsFirst(len(xs1))
+    columns = _EndsFirst(len(xs2))
+    while remaining:
+        for lines in rows, columns:
+            a = next(lines, None)
+            if a is None:
+                continue
+            if lines is rows:
+                ks, values = index1[a] + index2, xs1[a] + xs2
+            else:
+                ks, values = index1 + index2[a], xs1 + xs2[a]
+            new = ~found[ks]
+            sums[ks[new]] = values[new]
+            found[ks] = True
+            remaining -= new.sum()
+    return sums[reached]
+
+
+def _AddArrays(xs1, ps1, xs2, ps2):
+    """Computes the distribution of the sum of values from two distributions.
+
+    When both supports lie on a common regular grid, the probs are
+    convolved, and each resulting value is the sum of an actual pair of
+    values, so it is a key the pairwise loop would also produce.
+    Otherwise every pair of values is added.
+
+    xs1, xs2: sorted 1-D arrays of numbers
+    ps1, ps2: arrays of probs
+
+    Returns: sorted array of values, array of probs
+    """
+    n1, n2 = len(xs1), len(xs2)
+    if n1 == 0 or n2 == 0:
+        return np.array([]), np.array([])
+
+    steps = [np.diff(xs).min() for xs in (xs1, xs2) if len(xs) > 1]
+    step = min(steps) if steps else 1
+    if step > 0:
+        max_size = 4 * (n1 + n2)
+        index1 = _GridIndex(xs1, step, max_size)
+        index2 = _GridIndex(xs2, step, max_size)
+        if index1 is not None and index2 is not None:
+            dense1 = np.zeros(index1[-1] + 1)
+            dense1[index1] = ps1
+            dense2 = np.zeros(index2[-1] + 1)
+            dense2[index2] = ps2
+            ps = _Convolve(dense1, dense2)
+            if len(dense1) == n1 and len(dense2) == n2:
+                ks = np.arange(len(ps))
+                first = np.maximum(ks - (n2 - 1), 0)
+                xs = xs1[first] + xs2[ks - first]
+            else:
+                # keep only the sums that some pair of values produces
+                dense1[index1] = 1
+                dense2[index2] = 1
+                reached = _Convolve(dense1, dense2) > 0.5
+                xs = _GridSums(xs1, index1, xs2, index2, reached)
+                ps = ps[reached]
+            return xs, ps
+
+    xs = np.add.outer(xs1, xs2).ravel()
+    ps = np.multiply.outer(ps1, ps2).ravel()
+    return _SortedSupport(xs, ps)
+
+
+# Largest number of pairs formed at once by binned products and ratios.
+OUTER_CHUNK_SIZE = 2**20
+
+
+def _OuterArrays(ufunc, xs1, ps1, xs2, ps2, bins=None):
+    """Computes the distribution of ufunc applied to pairs of values.
+
+    With bins, the pairs are formed a chunk of rows at a time and equal
+    results are combined as they come, so memory stays bounded however
+    many pairs there are.
+
+    ufunc: np.multiply or np.divide
+    xs1, xs2: 1-D arrays of numbers
+    ps1, ps2: arrays of probs
+    bins: if there are more distinct results than this, the results are
+          put in this many equal-width bins, each represented by the mean
+          of its values
+
+    Returns: sorted array of values, array of probs
+    """
+    if len(xs1) == 0 or len(xs2) == 0:
+        return np.array([]), np.array([])
+
+    rows = len(xs1) if bins is None else max(1, OUTER_CHUNK_SIZE // len(xs2))
+    chunks = ((ufunc.outer(xs1[i:i+rows], xs2).ravel(),
+               np.multiply.outer(ps1[i:i+rows], ps2).ravel())
+              for i in range(0, len(xs1), rows))
+
+    xs, ps = _SortedSupport(*next(chunks))
+    while bins is None or len(xs) <= bins:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return xs, ps
+        xs, ps = _SortedSupport(np.concatenate([xs, chunk[0]]),
+                                np.concatenate([ps, chunk[1]]))
+
+    # the extremes of x1 * g(x2) are products of extremes
+    gs = xs2 if ufunc is np.multiply else 1 / xs2
+    corners = np.multiply.outer([xs1.min(), xs1.max()], [gs.min(), gs.max()])
+    edges = np.linspace(corners.min(), corners.max(), bins + 1)
+
+    mass = np.zeros(bins)
+    moment = np.zeros(bins)
+    for xs, ps in itertools.chain([(xs, ps)], chunks):
+        k = np.searchsorted(edges, xs, side='right') - 1
+        np.clip(k, 0, bins - 1, out=k)
+        mass += np.bincount(k, weights=ps, minlength=bins)
+        moment += np.bincount(k, weights=ps * xs, minlength=bins)
+
+    keep = mass > 0
+    return moment[keep] / mass[keep], mass[keep]
+
+
+# Largest argument of exp that does not overflow.
+MAX_EXP = np.log(np.finfo(float).max)
+
+
+def _IsNumeric(a):
+    """Checks whether an array holds numbers (bools, ints or floats)."""
+    return a.dtype.kind in 'biuf'
+
+
+def _Scalar(x):
+    """Converts a NumPy scalar to the corresponding Python number."""
+    return x.item() if isinstance(x, np.generic) else x
+
+
 class _DictWrapper(object):
-    """An object that contains a dictionary."""
+    """An object that contains a dictionary.
+
+    The distribution is stored either as a dictionary that maps values to
+    freqs/probs, or as two arrays: sorted distinct values `xs` (one row
+    per value for tuple values) and their freqs/probs `ps`. Array storage
+    keeps reductions and transforms vectorized; the dictionary is built
+    from the arrays the first time something asks for `d`, and from then
+    on the dictionary is the storage.
+    """
 
     def __init__(self, obj=None, label=None):
         """Initializes the distribution.
 
-        obj: Hist, Pmf, Cdf, Pdf, dict, pandas Series, list of pairs
+        obj: Hist, Pmf, Cdf, Pdf, dict, pandas Series, list of pairs,
+             NumPy array of values (one row per value for tuple values)
         label: string label
         """
         self.label = label if label is not None else DEFAULT_LABEL
-        self.d = {}
+        self._d = {}
+        self._xs = None
+        self._ps = None
+        self._index = None
 
         # flag whether the distribution is under a log transform
         self.log = False
@@ -156,10 +396,15 @@ class _DictWrapper(object):
 
         if isinstance(obj, dict):
             self.d.update(obj.items())
+        elif isinstance(obj, _DictWrapper) and obj._d is None:
+            self.SetArrays(obj._xs.copy(), obj._ps.copy(), presorted=True)
         elif isinstance(obj, (_DictWrapper, Cdf, Pdf)):
             self.d.update(obj.Items())
         elif isinstance(obj, pandas.Series):
             self.d.update(obj.value_counts().iteritems())
+        elif isinstance(obj, np.ndarray) and _IsNumeric(obj) and obj.ndim <= 2:
+            xs, counts = np.unique(obj, axis=0, return_counts=True)
+            self.SetArrays(xs, counts, presorted=True)
         else:
             # finally, treat it like a list
             self.d.update(Counter(obj))
@@ -167,44 +412,122 @@ class _DictWrapper(object):
         if len(self) > 0 and isinstance(self, Pmf):
             self.Normalize()
 
+    @property
+    def d(self):
+        """The dictionary that maps values to freqs/probs.
+
+        Under array storage, builds the dictionary, which becomes the storage.
+        """
+        if self._d is None:
+            self._d = dict(zip(self._Keys(), self._ps.tolist()))
+            self._xs = self._ps = self._index = None
+        return self._d
+
+    @d.setter
+    def d(self, d):
+        self._d = d
+        self._xs = self._ps = self._index = None
+
+    def _Keys(self, xs=None):
+        """Gets the values under array storage, as dictionary keys."""
+        if xs is None:
+            xs = self._xs
+        if xs.ndim == 1:
+            return xs.tolist()
+        return [tuple(x) for x in xs.tolist()]
+
+    def _Index(self):
+        """Maps each value to its position, under array storage."""
+        if self._index is None:
+            self._index = dict(zip(self._Keys(), range(len(self._ps))))
+        return self._index
+
+    def _AsDict(self):
+        """Gets the contents as a dictionary without changing the storage."""
+        if self._d is not None:
+            return self._d
+        return dict(zip(self._Keys(), self._ps.tolist()))
+
+    def _Ps(self):
+        """Gets the freqs/probs as an array, in no particular order."""
+        if self._d is None:
+            return self._ps
+        return np.array(list(self._d.values()))
+
+    def _Arrays(self):
+        """Gets the values and freqs/probs as arrays.
+
+        Under dictionary storage the arrays are in no particular order.
+
+        Returns: (xs, ps), or None if the values are not numbers
+                 or tuples of numbers
+        """
+        if self._d is None:
+            return self._xs, self._ps
+        try:
+            xs = np.array(list(self._d.keys()))
+        except ValueError:
+            return None
+        if not _IsNumeric(xs) or xs.ndim > 2:
+            return None
+        return xs, np.array(list(self._d.values()))
+
+    def _FromArrays(self, xs, ps, presorted=False):
+        """Makes a new object of the same type with array storage."""
+        new = copy.copy(self)
+        new.SetArrays(xs, ps, presorted=presorted)
+        return new
+
     def __hash__(self):
         return id(self)
 
     def __str__(self):
         cls = self.__class__.__name__
         if self.label == DEFAULT_LABEL:
-            return '%s(%s)' % (cls, str(self.d))
+            return '%s(%s)' % (cls, str(self._AsDict()))
         else:
             return self.label
 
     def __repr__(self):
         cls = self.__class__.__name__
         if self.label == DEFAULT_LABEL:
-            return '%s(%s)' % (cls, repr(self.d))
+            return '%s(%s)' % (cls, repr(self._AsDict()))
         else:
-            return '%s(%s, %s)' % (cls, repr(self.d), repr(self.label))
+            return '%s(%s, %s)' % (cls, repr(self._AsDict()), repr(self.label))
 
     def __eq__(self, other):
-        try:
-            return self.d == other.d
-        except AttributeError:
+        if not isinstance(other, _DictWrapper):
             return False
+        if self._d is None and other._d is None:
+            return (self._xs.shape == other._xs.shape and
+                    np.array_equal(self._xs, other._xs) and
+                    np.array_equal(self._ps, other._ps))
+        return self._AsDict() == other._AsDict()
 
     def __len__(self):
-        return len(self.d)
+        if self._d is None:
+            return len(self._ps)
+        return len(self._d)
 
     def __iter__(self):
-        return iter(self.d)
+        if self._d is None:
+            return iter(self._Keys())
+        return iter(self._d)
 
     def iterkeys(self):
         """Returns an iterator over keys."""
-        return iter(self.d)
+        return iter(self)
 
     def __contains__(self, value):
-        return value in self.d
+        if self._d is None:
+            return value in self._Index()
+        return value in self._d
 
     def __getitem__(self, value):
-        return self.d.get(value, 0)
+        if self._d is None:
+            i = self._Index().get(value)
+            return 0 if i is None else self._ps[i].item()
+        return self._d.get(value, 0)
 
     def __setitem__(self, value, prob):
         self.d[value] = prob
@@ -223,7 +546,12 @@ class _DictWrapper(object):
         returns: new _DictWrapper with the same type
         """
         new = copy.copy(self)
-        new.d = copy.copy(self.d)
+        if self._d is None:
+            new._xs = self._xs.copy()
+            new._ps = self._ps.copy()
+            new._index = None
+        else:
+            new.d = copy.copy(self._d)
         new.label = label if label is not None else self.label
         return new
 
@@ -234,6 +562,11 @@ class _DictWrapper(object):
 
         Returns: new object
         """
+        arrays = self._Arrays()
+        if arrays is not None:
+            xs, ps = arrays
+            return self._FromArrays(xs * factor, ps.copy())
+
         new = self.Copy()
         new.d.clear()
 
@@ -243,7 +576,7 @@ class _DictWrapper(object):
 
     def Log(self, m=None):
         """Log transforms the probabilities.
-        
+
         Removes values with probability 0.
 
         Normalizes so that the largest logprob is 0.
@@ -255,11 +588,26 @@ class _DictWrapper(object):
         if m is None:
             m = self.MaxLike()
 
-        for x, p in self.d.items():
-            if p:
-                self.Set(x, math.log(p / m))
-            else:
-                self.Remove(x)
+        if self._d is None:
+            keep = self._ps != 0
+            if not keep.all():
+                self._xs = self._xs[keep]
+                self._ps = self._ps[keep]
+                self._index = None
+            # fail the way math.log does
+            if m == 0:
+                raise ZeroDivisionError('float division by zero')
+            ratios = self._ps / m
+            if not np.all(ratios > 0):
+                raise ValueError('math domain error')
+            self._ps = np.log(ratios)
+            return
+
+        d = self.d
+        for x in [x for x, p in d.items() if not p]:
+            del d[x]
+        for x, p in d.items():
+            d[x] = math.log(p / m)
 
     def Exp(self, m=None):
         """Exponentiates the probabilities.
@@ -275,8 +623,17 @@ class _DictWrapper(object):
         if m is None:
             m = self.MaxLike()
 
-        for x, p in self.d.items():
-            self.Set(x, math.exp(p - m))
+        if self._d is None:
+            shifted = self._ps - m
+            # fail the way math.exp does
+            if np.any(shifted > MAX_EXP):
+                raise OverflowError('math range error')
+            self._ps = np.exp(shifted)
+            return
+
+        d = self.d
+        for x, p in d.items():
+            d[x] = math.exp(p - m)
 
     def GetDict(self):
         """Gets the dictionary."""
@@ -286,6 +643,38 @@ class _DictWrapper(object):
         """Sets the dictionary."""
         self.d = d
 
+    def GetArrays(self):
+        """Gets sorted arrays of the values and freqs/probs.
+
+        Switches to array storage; the arrays are the storage, so
+        modifying them modifies the distribution.  Values have to be
+        numbers or tuples of numbers.
+
+        Returns: (xs, ps)
+        """
+        if self._d is not None:
+            arrays = self._Arrays()
+            if arrays is None:
+                raise ValueError('GetArrays: values are not numbers.')
+            self.SetArrays(*arrays)
+        return self._xs, self._ps
+
+    def SetArrays(self, xs, ps, presorted=False):
+        """Sets the values and freqs/probs, which become the storage.
+
+        xs: array of values, 1-D, or 2-D with one row per tuple value
+        ps: array of freqs/probs
+        presorted: whether xs is already sorted with no repeated values
+        """
+        xs = np.asarray(xs)
+        ps = np.asarray(ps)
+        if not presorted:
+            xs, ps = _SortedSupport(xs, ps)
+        self._d = None
+        self._index = None
+        self._xs = xs
+        self._ps = ps
+
     def Values(self):
         """Gets an unsorted sequence of values.
 
@@ -293,17 +682,25 @@ class _DictWrapper(object):
         dictionary are the values of the Hist/Pmf, and the
         values of the dictionary are frequencies/probabilities.
         """
-        return self.d.keys()
+        if self._d is None:
+            return self._Keys()
+        return self._d.keys()
 
     def Items(self):
         """Gets an unsorted sequence of (value, freq/prob) pairs."""
-        return self.d.items()
+        if self._d is None:
+            return list(zip(self._Keys(), self._ps.tolist()))
+        return self._d.items()
 
     def SortedItems(self):
         """Gets a sorted sequence of (value, freq/prob) pairs.
 
         It items are unsortable, the result is unsorted.
         """
+        if self._d is None:
+            # Array storage is sorted already.
+            return self.Items()
+
         def isnan(x):
             try:
                 return math.isnan(x)
@@ -327,6 +724,8 @@ class _DictWrapper(object):
         Returns:
             tuple of (sorted value sequence, freq/prob sequence)
         """
+        if self._d is None and self._xs.ndim == 1:
+            return self._xs, self._ps
         return zip(*self.SortedItems())
 
     def MakeCdf(self, label=None):
@@ -355,7 +754,8 @@ class _DictWrapper(object):
             x: number value
             term: how much to increment by
         """
-        self.d[x] = self.d.get(x, 0) + term
+        d = self.d
+        d[x] = d.get(x, 0) + term
 
     def Mult(self, x, factor):
         """Scales the freq/prob associated with the value x.
@@ -364,7 +764,8 @@ class _DictWrapper(object):
             x: number value
             factor: how much to multiply by
         """
-        self.d[x] = self.d.get(x, 0) * factor
+        d = self.d
+        d[x] = d.get(x, 0) * factor
 
     def Remove(self, x):
         """Removes a value.
@@ -378,18 +779,24 @@ class _DictWrapper(object):
 
     def Total(self):
         """Returns the total of the frequencies/probabilities in the map."""
-        total = sum(self.d.values())
-        return total
+        if self._d is not None and not self._d:
+            return 0
+        return _Scalar(self._Ps().sum())
 
     def MaxLike(self):
         """Returns the largest frequency/probability in the map."""
-        return max(self.d.values())
+        if len(self) == 0:
+            raise ValueError('MaxLike: empty distribution.')
+        return _Scalar(self._Ps().max())
 
     def Largest(self, n=10):
         """Returns the largest n values, with frequency/probability.
 
         n: number of items to return
         """
+        if self._d is None:
+            xs, ps = self._xs[::-1][:n], self._ps[::-1][:n]
+            return list(zip(self._Keys(xs), ps.tolist()))
         return sorted(self.d.items(), reverse=True)[:n]
 
     def Smallest(self, n=10):
@@ -397,6 +804,8 @@ class _DictWrapper(object):
 
         n: number of items to return
         """
+        if self._d is None:
+            return list(zip(self._Keys(self._xs[:n]), self._ps[:n].tolist()))
         return sorted(self.d.items(), reverse=False)[:n]
 
 
@@ -414,7 +823,7 @@ class Hist(_DictWrapper):
         Returns:
             int frequency
         """
-        return self.d.get(x, 0)
+        return self[x]
 
     def Freqs(self, xs):
         """Gets frequencies for a sequence of values."""
@@ -451,10 +860,18 @@ class Pmf(_DictWrapper):
         Returns:
             float probability
         """
-        return self.d.get(x, default)
+        if self._d is None:
+            i = self._Index().get(x)
+            return default if i is None else self._ps[i].item()
+        return self._d.get(x, default)
 
     def Probs(self, xs):
         """Gets probabilities for a sequence of values."""
+        if self._d is None and self._xs.ndim == 1 and len(self._xs):
+            # Vectorized lookup in the sorted values.
+            xs = np.asarray(xs)
+            i = np.clip(np.searchsorted(self._xs, xs), 0, len(self._xs) - 1)
+            return np.where(self._xs[i] == xs, self._ps[i], 0).tolist()
         return [self.Prob(x) for x in xs]
 
     def Percentile(self, percentage):
@@ -468,6 +885,10 @@ class Pmf(_DictWrapper):
         returns: value from the Pmf
         """
         p = percentage / 100
+        if self._d is None and self._xs.ndim == 1:
+            i = np.searchsorted(np.cumsum(self._ps), p)
+            return self._xs[i].item() if i < len(self._xs) else None
+
         total = 0
         for val, prob in sorted(self.Items()):
             total += prob
@@ -483,9 +904,12 @@ class Pmf(_DictWrapper):
         """
         if isinstance(x, _DictWrapper):
             return PmfProbGreater(self, x)
-        else:
-            t = [prob for (val, prob) in self.d.items() if val > x]
-            return sum(t)
+        arrays = self._Arrays()
+        if arrays is not None and arrays[0].ndim == 1:
+            xs, ps = arrays
+            return _Scalar(ps[xs > x].sum())
+        t = [prob for (val, prob) in self.d.items() if val > x]
+        return sum(t)
 
     def ProbLess(self, x):
         """Probability that a sample from this Pmf is less than x.
@@ -496,9 +920,12 @@ class Pmf(_DictWrapper):
         """
         if isinstance(x, _DictWrapper):
             return PmfProbLess(self, x)
-        else:
-            t = [prob for (val, prob) in self.d.items() if val < x]
-            return sum(t)
+        arrays = self._Arrays()
+        if arrays is not None and arrays[0].ndim == 1:
+            xs, ps = arrays
+            return _Scalar(ps[xs < x].sum())
+        t = [prob for (val, prob) in self.d.items() if val < x]
+        return sum(t)
 
     def ProbEqual(self, x):
         """Probability that a sample from this Pmf is exactly x.
@@ -532,8 +959,15 @@ class Pmf(_DictWrapper):
             raise ValueError('Normalize: total probability is zero.')
 
         factor = fraction / total
-        for x in self.d:
-            self.d[x] *= factor
+        if self._d is None:
+            if self._ps.dtype.kind == 'f':
+                self._ps *= factor
+            else:
+                self._ps = self._ps * factor
+        else:
+            d = self._d
+            ps = np.array(list(d.values())) * factor
+            d.update(zip(list(d.keys()), ps.tolist()))
 
         return total
 
@@ -547,6 +981,12 @@ class Pmf(_DictWrapper):
             float value from the Pmf
         """
         target = random.random()
+        if self._d is None:
+            i = np.searchsorted(np.cumsum(self._ps), target)
+            if i < len(self._ps):
+                return self._Keys(self._xs[i:i + 1])[0]
+            raise ValueError('Random: Pmf might not be normalized.')
+
         total = 0
         for x, p in self.d.items():
             total += p
@@ -570,6 +1010,10 @@ class Pmf(_DictWrapper):
         Returns:
             float mean
         """
+        arrays = self._Arrays()
+        if arrays is not None and arrays[0].ndim == 1:
+            xs, ps = arrays
+            return _Scalar(np.dot(xs, ps))
         return sum(p * x for x, p in self.Items())
 
     def Median(self):
@@ -591,6 +1035,10 @@ class Pmf(_DictWrapper):
         if mu is None:
             mu = self.Mean()
 
+        arrays = self._Arrays()
+        if arrays is not None and arrays[0].ndim == 1:
+            xs, ps = arrays
+            return _Scalar(np.dot((xs - mu)**2, ps))
         return sum(p * (x-mu)**2 for x, p in self.Items())
 
     def Expect(self, func):
@@ -617,6 +1065,10 @@ class Pmf(_DictWrapper):
 
         Returns: float probability
         """
+        if self._d is None:
+            # The largest value among those with the largest probability.
+            i = len(self._ps) - 1 - np.argmax(self._ps[::-1])
+            return self._Keys(self._xs[i:i + 1])[0]
         _, val = max((prob, val) for val, prob in self.Items())
         return val
 
@@ -662,12 +1114,36 @@ class Pmf(_DictWrapper):
 
         returns: new Pmf
         """
+        arrays = self._OperandArrays(other)
+        if arrays is not None:
+            (xs1, ps1), (xs2, ps2) = arrays
+            pmf = Pmf()
+            pmf.SetArrays(*_AddArrays(xs1, ps1, xs2, ps2), presorted=True)
+            return pmf
+
         pmf = Pmf()
         for v1, p1 in self.Items():
             for v2, p2 in other.Items():
                 pmf[v1 + v2] += p1 * p2
         return pmf
 
+    def _OperandArrays(self, other):
+        """Gets sorted arrays of both operands of an arithmetic operation.
+
+        Values are promoted to at least int64 or float64, so that results
+        of small or unsigned ints don't wrap around.
+
+        Returns: pair of (xs, ps) for self and other, or None if either
+                 has values that are not numbers
+        """
+        arrays = self._Arrays(), other._Arrays()
+        if any(a is None or a[0].ndim != 1 or a[0].dtype.kind == 'b'
+               for a in arrays):
+            return None
+        return [_SortedSupport(xs.astype(np.promote_types(xs.dtype, np.int64),
+                                         copy=False), ps)
+                for xs, ps in arrays]
+
     def AddConstant(self, other):
         """Computes the Pmf of the sum a constant and values from self.
 
@@ -678,6 +1154,13 @@ class Pmf(_DictWrapper):
         if other == 0:
             return self.Copy()
 
+        arrays = self._Arrays()
+        if arrays is not None and arrays[0].ndim == 1:
+            xs, ps = arrays
+            pmf = Pmf()
+            pmf.SetArrays(xs + other, ps.copy())
+            return pmf
+
         pmf = Pmf()
         for v1, p1 in self.Items():
             pmf.Set(v1 + other, p1)
@@ -702,6 +1185,15 @@ class Pmf(_DictWrapper):
 
         returns: new Pmf
         """
+        arrays = self._OperandArrays(other)
+        if arrays is not None:
+            # self - other is self + (-other)
+            (xs1, ps1), (xs2, ps2) = arrays
+            xs, ps = _AddArrays(xs1, ps1, -xs2[::-1], ps2[::-1])
+            pmf = Pmf()
+            pmf.SetArrays(xs, ps, presorted=True)
+            return pmf
+
         pmf = Pmf()
         for v1, p1 in self.Items():
             for v2, p2 in other.Items():
@@ -720,13 +1212,23 @@ class Pmf(_DictWrapper):
         except AttributeError:
             return self.MulConstant(other)
 
-    def MulPmf(self, other):
-        """Computes the Pmf of the diff of values drawn from self and other.
+    def MulPmf(self, other, bins=None):
+        """Computes the Pmf of the product of values drawn from self and other.
 
         other: another Pmf
+        bins: int, optional cap on the number of values in the result;
+              larger results are binned
 
         returns: new Pmf
         """
+        arrays = self._OperandArrays(other)
+        if arrays is not None:
+            (xs1, ps1), (xs2, ps2) = arrays
+            pmf = Pmf()
+            pmf.SetArrays(*_OuterArrays(np.multiply, xs1, ps1, xs2, ps2, bins),
+                          presorted=True)
+            return pmf
+
         pmf = Pmf()
         for v1, p1 in self.Items():
             for v2, p2 in other.Items():
@@ -740,6 +1242,13 @@ class Pmf(_DictWrapper):
 
         returns: new Pmf
         """
+        arrays = self._Arrays()
+        if arrays is not None and arrays[0].ndim == 1:
+            xs, ps = arrays
+            pmf = Pmf()
+            pmf.SetArrays(xs * other, ps.copy())
+            return pmf
+
         pmf = Pmf()
         for v1, p1 in self.Items():
             pmf.Set(v1 * other, p1)
@@ -759,13 +1268,24 @@ class Pmf(_DictWrapper):
 
     __truediv__ = __div__
 
-    def DivPmf(self, other):
+    def DivPmf(self, other, bins=None):
         """Computes the Pmf of the ratio of values drawn from self and other.
 
         other: another Pmf
+        bins: int, optional cap on the number of values in the result;
+              larger results are binned
 
         returns: new Pmf
         """
+        arrays = self._OperandArrays(other)
+        # dividing by zero raises ZeroDivisionError in the loop below
+        if arrays is not None and arrays[1][0].all():
+            (xs1, ps1), (xs2, ps2) = arrays
+            pmf = Pmf()
+            pmf.SetArrays(*_OuterArrays(np.divide, xs1, ps1, xs2, ps2, bins),
+                          presorted=True)
+            return pmf
+
         pmf = Pmf()
         for v1, p1 in self.Items():
             for v2, p2 in other.Items():
@@ -847,6 +1367,175 @@ class Joint(Pmf):
         return interval
 
 
+class GridJoint(Joint):
+    """Represents a joint distribution on a dense grid.
+
+    The probabilities are an ndarray with one axis per variable, and
+    each axis has sorted coordinates and optionally a name.  The values
+    are the tuples of coordinates, so the grid can be used like any
+    other Joint; Marginal, Conditional and MaxLikeInterval work on the
+    array directly.  If the support stops being the grid (for example,
+    after something modifies d), they fall back to the Joint versions.
+    """
+
+    def __init__(self, coords, ps=None, names=None, label=None):
+        """Initializes the grid.
+
+        coords: sequence of arrays, the values of each variable
+        ps: array of probs with shape (len(coords[0]), len(coords[1]), ...),
+            or None for a uniform distribution
+        names: optional sequence of variable names
+        label: string label
+        """
+        Joint.__init__(self, label=label)
+
+        coords = [np.asarray(c) for c in coords]
+        shape = tuple(len(c) for c in coords)
+        ps = np.ones(shape) if ps is None else np.array(ps, dtype=float)
+        if ps.shape != shape:
+            raise ValueError('GridJoint: ps has shape %s, expected %s' %
+                             (ps.shape, shape))
+
+        for axis, c in enumerate(coords):
+            order = np.argsort(c, kind='stable')
+            c = c[order]
+            if np.any(c[1:] == c[:-1]):
+                raise ValueError('GridJoint: repeated coordinates.')
+            coords[axis] = c
+            ps = np.take(ps, order, axis=axis)
+
+        self.coords = coords
+        self.names = list(names) if names is not None else None
+        self.shape = shape
+
+        # the tuple values, in the order of the flattened grid
+        mesh = np.meshgrid(*coords, indexing='ij')
+        xs = np.column_stack([m.ravel() for m in mesh])
+        self.SetArrays(xs, np.ascontiguousarray(ps).ravel(), presorted=True)
+        self._grid_xs = self._xs
+
+        if self.Total() > 0:
+            self.Normalize()
+
+    def _OnGrid(self):
+        """Checks whether the support is still the whole grid."""
+        return self._d is None and self._xs is self._grid_xs
+
+    def Axis(self, i):
+        """Gets the index of a variable.
+
+        i: index or name of the variable
+        """
+        if isinstance(i, str):
+            if self.names is None or i not in self.names:
+                raise ValueError('GridJoint: unknown variable %s' % i)
+            return self.names.index(i)
+        return i
+
+    def GetGrid(self):
+        """Gets the probs as an ndarray with one axis per variable.
+
+        Under grid storage, the result is a view, so modifying it
+        modifies the distribution.
+        """
+        if not self._OnGrid():
+            raise ValueError('GetGrid: the support is no longer a grid.')
+        return self._ps.reshape(self.shape)
+
+    def Copy(self, label=None):
+        """Returns a copy.
+
+        label: string label for the new GridJoint
+        """
+        new = Joint.Copy(self, label=label)
+        if self._OnGrid():
+            new._grid_xs = new._xs
+        return new
+
+    def Marginal(self, i, label=None):
+        """Gets the marginal distribution of the indicated variable.
+
+        i: index or name of the variable we want
+
+        Returns: Pmf
+        """
+        i = self.Axis(i)
+        if not self._OnGrid():
+            return Joint.Marginal(self, i, label=label)
+
+        others = tuple(k for k in range(len(self.shape)) if k != i)
+        pmf = Pmf(label=label)
+        pmf.SetArrays(self.coords[i].copy(), self.GetGrid().sum(axis=others),
+                      presorted=True)
+        return pmf
+
+    def Conditional(self, i, j, val, label=None):
+        """Gets the conditional distribution of the indicated variable.
+
+        Distribution of vs[i], conditioned on vs[j] = val.
+
+        i: index or name of the variable we want
+        j: index or name of the variable conditioned on
+        val: the value the jth variable has to have
+
+        Returns: Pmf
+        """
+        i, j = self.Axis(i), self.Axis(j)
+        index = np.flatnonzero(self.coords[j] == val) if self._OnGrid() else []
+        if i == j or len(index) == 0:
+            return Joint.Conditional(self, i, j, val, label=label)
+
+        grid = np.take(self.GetGrid(), index[0], axis=j)
+        axis = i if i < j else i - 1
+        others = tuple(k for k in range(grid.ndim) if k != axis)
+        pmf = Pmf(label=label)
+        pmf.SetArrays(self.coords[i].copy(), grid.sum(axis=others),
+                      presorted=True)
+        pmf.Normalize()
+        return pmf
+
+    def MaxLikeInterval(self, percentage=90):
+        """Returns the maximum-likelihood credible interval.
+
+        If percentage=90, computes a 90% CI containing the values
+        with the highest likelihoods.
+
+        percentage: float between 0 and 100
+
+        Returns: list of values from the suite
+        """
+        if not self._OnGrid():
+            return Joint.MaxLikeInterval(self, percentage)
+
+        # highest probs first; among ties, the largest values first
+        order = np.argsort(self._ps, kind='stable')[::-1]
+        total = np.cumsum(self._ps[order])
+        n = np.searchsorted(total, percentage / 100) + 1
+        return self._Keys(self._xs[order[:n]])
+
+
+def MakeGridJoint(pmfs, names=None, label=None):
+    """Joint distribution on the grid of values from the pmfs.
+
+    Assumes that the PMFs represent independent random variables.
+
+    Args:
+        pmfs: sequence of Pmf objects with numerical values
+        names: optional sequence of variable names
+        label: string label
+
+    Returns:
+        GridJoint
+    """
+    coords = []
+    ps = np.ones(())
+    for pmf in pmfs:
+        xs, qs = _SortedSupport(*pmf._Arrays())
+        coords.append(xs)
+        ps = np.multiply.outer(ps, qs)
+    return GridJoint(coords, ps, names=names, label=label)
+
+
 def MakeJoint(pmf1, pmf2):
     """Joint distribution of values from pmf1 and pmf2.
 
@@ -931,6 +1620,25 @@ def MakePmfFromItems(t, label=None):
     return Pmf(dict(t), label=label)
 
 
+def MakePmfFromArrays(xs, ps, label=None):
+    """Makes a PMF stored as arrays from values and probabilities.
+
+    Repeated values are combined.
+
+    Args:
+        xs: array of numbers, or 2-D array with one row per tuple value
+        ps: array of probabilities
+        label: string label for this PMF
+
+    Returns:
+        Pmf object
+    """
+    pmf = Pmf(label=label)
+    pmf.SetArrays(xs, ps)
+    pmf.Normalize()
+    return pmf
+
+
 def MakePmfFromHist(hist, label=None):
     """Makes a normalized PMF from a Hist object.
 
@@ -971,8 +1679,7 @@ def MakeUniformPmf(low, high, n):
     n: number of values
     """
     pmf = Pmf()
-    for x in np.linspace(low, high, n):
-        pmf.Set(x, 1)
+    pmf.SetArrays(np.linspace(low, high, n), np.ones(n))
     pmf.Normalize()
     return pmf
 
@@ -1033,9 +1740,14 @@ class Cdf:
             self.ps = np.asarray([])
             return
 
-        xs, freqs = zip(*sorted(dw.Items()))
+        if dw._d is None:
+            # Array storage is sorted already; copy it so the Cdf
+            # and the distribution don't share values.
+            xs, freqs = dw._xs.copy(), dw._ps
+        else:
+            xs, freqs = zip(*sorted(dw.Items()))
         self.xs = np.asarray(xs)
-        self.ps = np.cumsum(freqs, dtype=np.float)
+        self.ps = np.cumsum(freqs, dtype=float)
         self.ps /= self.ps[-1]
 
     def __str__(self):
@@ -1393,7 +2105,31 @@ class UnimplementedMethodException(Exception):
 
 
 class Suite(Pmf):
-    """Represents a suite of hypotheses and their probabilities."""
+    """Represents a suite of hypotheses and their probabilities.
+
+    Subclasses provide Likelihood (or LogLikelihood), which evaluates one
+    hypothesis at a time, or Likelihoods (or LogLikelihoods), which
+    evaluates the whole array of hypotheses at once.  The array versions
+    switch the suite to array storage.
+    """
+
+    def _Overrides(self, name):
+        """Checks whether a subclass provides the method with this name."""
+        return getattr(type(self), name) is not getattr(Suite, name)
+
+    def _MultProbs(self, likes):
+        """Multiplies the probs, under array storage, by an array."""
+        if self._ps.dtype.kind == 'f':
+            self._ps *= likes
+        else:
+            self._ps = self._ps * likes
+
+    def _AddProbs(self, loglikes):
+        """Adds an array to the probs (log probs), under array storage."""
+        if self._ps.dtype.kind == 'f':
+            self._ps += loglikes
+        else:
+            self._ps = self._ps + loglikes
 
     def Update(self, data):
         """Updates each hypothesis based on the data.
@@ -1402,6 +2138,11 @@ class Suite(Pmf):
 
         returns: the normalizing constant
         """
+        if self._Overrides('Likelihoods'):
+            hypos, _ = self.GetArrays()
+            self._MultProbs(self.Likelihoods(data, hypos))
+            return self.Normalize()
+
         for hypo in self.Values():
             like = self.Likelihood(data, hypo)
             self.Mult(hypo, like)
@@ -1418,6 +2159,11 @@ class Suite(Pmf):
         Args:
             data: any representation of the data
         """
+        if self._Overrides('LogLikelihoods'):
+            hypos, _ = self.GetArrays()
+            self._AddProbs(self.LogLikelihoods(data, hypos))
+            return
+
         for hypo in self.Values():
             like = self.LogLikelihood(data, hypo)
             self.Incr(hypo, like)
@@ -1435,6 +2181,12 @@ class Suite(Pmf):
 
         returns: the normalizing constant
         """
+        if self._Overrides('Likelihoods'):
+            hypos, _ = self.GetArrays()
+            for data in dataset:
+                self._MultProbs(self.Likelihoods(data, hypos))
+            return self.Normalize()
+
         for data in dataset:
             for hypo in self.Values():
                 like = self.Likelihood(data, hypo)
@@ -1470,6 +2222,32 @@ class Suite(Pmf):
         """
         raise UnimplementedMethodException()
 
+    def Likelihoods(self, data, hypos):
+        """Computes the likelihood of the data under each hypothesis.
+
+        Optional; if a subclass provides it, Update and UpdateSet use it
+        instead of Likelihood.
+
+        data: some representation of the data
+        hypos: array of hypotheses, one row per hypothesis for tuples
+
+        returns: array of likelihoods, one per hypothesis
+        """
+        raise UnimplementedMethodException()
+
+    def LogLikelihoods(self, data, hypos):
+        """Computes the log likelihood of the data under each hypothesis.
+
+        Optional; if a subclass provides it, LogUpdate and LogUpdateSet
+        use it instead of LogLikelihood.
+
+        data: some representation of the data
+        hypos: array of hypotheses, one row per hypothesis for tuples
+
+        returns: array of log likelihoods, one per hypothesis
+        """
+        raise UnimplementedMethodException()
+
     def Print(self):
         """Prints the hypotheses and their probabilities."""
         for hypo, prob in sorted(self.Items()):
@@ -1803,6 +2581,8 @@ def RandomSum(dists):
 def SampleSum(dists, n):
     """Draws a sample of sums from a list of distributions.
 
+    See PmfSum for the exact distribution of the sum.
+
     dists: sequence of Pmf or Cdf objects
     n: sample size
 
@@ -1812,6 +2592,24 @@ def SampleSum(dists, n):
     return pmf
 
 
+def PmfSum(dists):
+    """Computes the distribution of the sum of a value from each dist.
+
+    Exact alternative to SampleSum: adds the Pmfs pairwise, which
+    convolves their probabilities when the values are on a regular grid.
+
+    dists: sequence of Pmf or Cdf objects
+
+    returns: new Pmf of sums
+    """
+    pmfs = [dist.MakePmf() if isinstance(dist, Cdf) else dist
+            for dist in dists]
+    total = pmfs[0]
+    for pmf in pmfs[1:]:
+        total = total.AddPmf(pmf)
+    return total
+
+
 def EvalNormalPdf(x, mu, sigma):
     """Computes the unnormalized PDF of the normal distribution.
 
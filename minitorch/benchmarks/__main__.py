@@ -0,0 +1,108 @@
+"""
+Run every benchmark, write the timings as JSON and compare against a baseline.
+
+    python -m benchmarks [--quick] [--output results.json] [--baseline baseline.json]
+
+Every result is seconds per call (lower is better). With `--baseline`, any
+benchmark slower than the baseline by more than `--tolerance` is reported
+and the exit status is 1.
+"""
+import argparse
+import json
+import platform
+import sys
+import numpy as np
+from . import (
+    bench_autodiff,
+    bench_checkpoint,
+    bench_module,
+    bench_operators,
+    bench_parallel,
+    bench_train,
+)
+
+SUITES = {
+    "operators": bench_operators,
+    "autodiff": bench_autodiff,
+    "module": bench_module,
+    "train": bench_train,
+    "parallel": bench_parallel,
+    "checkpoint": bench_checkpoint,
+}
+
+
+def run(suites=SUITES, quick=False):
+    """
+    Returns:
+        dict : `{"suite.benchmark": seconds}` for every benchmark
+    """
+    results = {}
+    for suite, bench in suites.items():
+        for name, seconds in bench.run(quick=quick).items():
+            results[f"{suite}.{name}"] = seconds
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Benchmarks that got slower than `baseline`.
+    Args:
+        results (dict): current timings
+        baseline (dict): stored timings
+        tolerance (float): allowed relative slowdown
+    Returns:
+        list : `(name, baseline seconds, seconds)` for every regression
+    """
+    regressions = []
+    for name, seconds in results.items():
+        old = baseline.get(name)
+        if old is not None and seconds > old * (1.0 + tolerance):
+            regressions.append((name, old, seconds))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes only")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES), help="suites to run")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown")
+    args = parser.parse_args(argv)
+
+    suites = {name: SUITES[name] for name in args.suite} if args.suite else SUITES
+    results = run(suites, quick=args.quick)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    for name, seconds in results.items():
+        line = f"{name:<44} {seconds * 1e6:14.3f} us"
+        if baseline is not None and name in baseline:
+            line += f"  {seconds / baseline[name]:6.2f}x"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for name, old, seconds in regressions:
+            print(f"REGRESSION {name}: {old * 1e6:.3f} us -> {seconds * 1e6:.3f} us")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
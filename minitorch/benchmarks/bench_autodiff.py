@@ -0,0 +1,53 @@
+"""
+Memory and speed of building scalar autodiff graphs.
+
+    python -m benchmarks.bench_autodiff [nodes]
+"""
+import sys
+import time
+import tracemalloc
+import minitorch
+
+
+def build_graph(n):
+    "Chain of `n` multiply/add nodes on one leaf, as in a long training step."
+    x = minitorch.Scalar(1.0)
+    out = x
+    for _ in range(n // 2):
+        out = out * 0.5 + x
+    return x, out
+
+
+def bytes_per_node(n=10000):
+    "Bytes allocated per graph node."
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    x, out = build_graph(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    out.backward()
+    return (after - before) / n
+
+
+def nodes_per_second(n=10000, repeats=5):
+    "Graph nodes recorded per second (best of `repeats`)."
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build_graph(n)
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def run(quick=False):
+    n = 2000 if quick else 10000
+    return {f"scalar_graph.{n}": n / nodes_per_second(n)}
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    per_node = bytes_per_node(n)
+    print(f"nodes          {n}")
+    print(f"bytes / node   {per_node:.0f}")
+    print(f"graph size     {per_node * n / 2 ** 20:.2f} MB")
+    print(f"nodes / sec    {nodes_per_second(n):,.0f}")
@@ -0,0 +1,50 @@
+"""
+Time to save and load a checkpoint of a large model, reading the file into
+memory or memory-mapping it.
+
+    python -m benchmarks.bench_checkpoint [million parameters]
+"""
+import os
+import sys
+import tempfile
+import minitorch
+from .timer import best_time
+
+
+class Wide(minitorch.Module):
+    "`layers` square weight matrices holding `size` parameters in total."
+
+    def __init__(self, size, layers=8):
+        super().__init__()
+        side = int((size / layers) ** 0.5)
+        for i in range(layers):
+            setattr(self, f"weight{i}", minitorch.Parameter(minitorch.zeros((side, side))))
+
+
+def checkpoint_times(size):
+    "Seconds per save, full read load and memory-mapped load of a `size` parameter model."
+    model = Wide(size)
+    fd, path = tempfile.mkstemp(suffix=".ckpt")
+    os.close(fd)
+    try:
+        save = best_time(lambda: model.save(path), repeats=3)
+        read = best_time(lambda: model.load(path, mmap=False), repeats=3)
+        mapped = best_time(lambda: model.load(path), repeats=3)
+    finally:
+        os.remove(path)
+    return save, read, mapped
+
+
+def run(quick=False):
+    size = 10 ** 6 if quick else 10 ** 7
+    save, read, mapped = checkpoint_times(size)
+    return {"save": save, "load.read": read, "load.mmap": mapped}
+
+
+if __name__ == "__main__":
+    size = int(float(sys.argv[1]) * 1e6) if len(sys.argv) > 1 else 10 ** 7
+    save, read, mapped = checkpoint_times(size)
+    print(f"parameters       {size}")
+    print(f"save             {save * 1e3:.2f} ms")
+    print(f"load (read)      {read * 1e3:.2f} ms")
+    print(f"load (mmap)      {mapped * 1e3:.3f} ms")
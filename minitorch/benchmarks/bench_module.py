@@ -0,0 +1,155 @@
+"""
+Cost of Module attribute access in a forward pass, of setting and getting
+plain attributes, and of collecting parameters from deep module trees.
+
+    python -m benchmarks.bench_module [depth]
+"""
+import sys
+import time
+import minitorch
+from .timer import best_time
+
+
+class Layer(minitorch.Module):
+    def __init__(self):
+        super().__init__()
+        self.weight = minitorch.Parameter(1.0)
+        self.bias = minitorch.Parameter(0.5)
+        self.scale = 0.5
+
+    def forward(self, x):
+        return x * self.weight.value * self.scale + self.bias.value
+
+
+class Stack(minitorch.Module):
+    def __init__(self, depth):
+        super().__init__()
+        self.names = [f"layer{i}" for i in range(depth)]
+        for name in self.names:
+            setattr(self, name, Layer())
+
+    def forward(self, x):
+        for name in self.names:
+            x = getattr(self, name)(x)
+        return x
+
+
+class PlainParameter:
+    def __init__(self, x):
+        self.value = x
+
+
+class PlainLayer:
+    "Same as `Layer` on plain objects, the lower bound for attribute access."
+
+    def __init__(self):
+        self.weight = PlainParameter(1.0)
+        self.bias = PlainParameter(0.5)
+        self.scale = 0.5
+
+    def __call__(self, x):
+        return self.forward(x)
+
+    def forward(self, x):
+        return x * self.weight.value * self.scale + self.bias.value
+
+
+class PlainStack(PlainLayer):
+    def __init__(self, depth):
+        self.names = [f"layer{i}" for i in range(depth)]
+        for name in self.names:
+            setattr(self, name, PlainLayer())
+
+    def forward(self, x):
+        for name in self.names:
+            x = getattr(self, name)(x)
+        return x
+
+
+def seconds_per_forward(model, calls=2000, repeats=5):
+    "Time of one `model(1.0)` call (best of `repeats`)."
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            model(1.0)
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+def attribute_overhead(depth=50, repeats=5):
+    "Forward time of a `Module` stack relative to the same stack of plain objects."
+    module, plain = Stack(depth), PlainStack(depth)
+    # Interleaved, so both sides see the same machine load.
+    best_module = best_plain = float("inf")
+    for _ in range(repeats):
+        best_module = min(best_module, seconds_per_forward(module, repeats=1))
+        best_plain = min(best_plain, seconds_per_forward(plain, repeats=1))
+    return best_module / best_plain
+
+
+def attribute_times(obj, calls=10000):
+    "Seconds per set and per get of the plain attribute `scale` of `obj`."
+
+    def set_scale():
+        for _ in range(calls):
+            obj.scale = 0.5
+
+    def get_scale():
+        for _ in range(calls):
+            obj.scale
+
+    return best_time(set_scale, number=1) / calls, best_time(get_scale, number=1) / calls
+
+
+def attribute_set_overhead(repeats=5):
+    "Plain attribute set on a `Module` relative to the same set on a plain object."
+    module, plain = Layer(), PlainLayer()
+    # Interleaved, so both sides see the same machine load.
+    best_module = best_plain = float("inf")
+    for _ in range(repeats):
+        best_module = min(best_module, attribute_times(module)[0])
+        best_plain = min(best_plain, attribute_times(plain)[0])
+    return best_module / best_plain
+
+
+class Tree(minitorch.Module):
+    "Module tree `depth` levels deep with `width` children and two parameters per node."
+
+    def __init__(self, depth, width=2):
+        super().__init__()
+        self.weight = minitorch.Parameter(1.0)
+        self.bias = minitorch.Parameter(0.0)
+        if depth > 1:
+            for i in range(width):
+                setattr(self, f"child{i}", Tree(depth - 1, width))
+
+
+def named_parameters_time(depth=8, width=2):
+    "Seconds per `named_parameters()` and `parameters()` call on a :class:`Tree`."
+    tree = Tree(depth, width)
+    return best_time(tree.named_parameters), best_time(tree.parameters)
+
+
+def run(quick=False):
+    results = {}
+    for depth in (4, 8) if quick else (4, 8, 12):
+        named, params = named_parameters_time(depth)
+        results[f"named_parameters.depth{depth}"] = named
+        results[f"parameters.depth{depth}"] = params
+    results["forward.stack50"] = seconds_per_forward(Stack(50))
+    # The plain object is the reference the Module entries are read against.
+    for kind, obj in (("module", Layer()), ("plain", PlainLayer())):
+        results[f"setattr.{kind}"], results[f"getattr.{kind}"] = attribute_times(obj)
+    return results
+
+
+if __name__ == "__main__":
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    module = seconds_per_forward(Stack(depth))
+    plain = seconds_per_forward(PlainStack(depth))
+    print(f"layers           {depth}")
+    print(f"module forward   {module * 1e6:.1f} us")
+    print(f"plain forward    {plain * 1e6:.1f} us")
+    print(f"overhead         {attribute_overhead(depth):.2f}x")
+    print(f"setattr overhead {attribute_set_overhead():.2f}x")
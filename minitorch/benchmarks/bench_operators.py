@@ -0,0 +1,91 @@
+"""
+Speed of the scalar `operators` primitives, of map/zipWith/reduce and of
+compiled compositions of primitives.
+
+    python -m benchmarks.bench_operators
+"""
+import numpy as np
+import minitorch
+from minitorch import operators
+from .timer import best_time
+
+SIZES = [10 ** k for k in range(2, 7)]
+
+# Largest size the pure python (list) versions are timed at.
+LIST_LIMIT = 10 ** 4
+
+
+def primitives():
+    "Seconds per call of each float primitive."
+    x, y = 0.3, 0.7
+    unary = ["neg", "id", "sigmoid", "relu", "log", "exp", "inv"]
+    binary = ["add", "mul", "lt", "eq", "max", "relu_back", "log_back", "inv_back"]
+    results = {}
+    for name in unary:
+        fn = getattr(operators, name)
+        results[name] = best_time(lambda: fn(x))
+    for name in binary:
+        fn = getattr(operators, name)
+        results[name] = best_time(lambda: fn(x, y))
+    return results
+
+
+def higher_order(sizes=SIZES):
+    "Seconds per call of map/zipWith/reduce on lists and arrays of each size."
+    neg_map = operators.map(operators.neg)
+    add_zip = operators.zipWith(operators.add)
+    add_reduce = operators.reduce(operators.add, 0.0)
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in sizes:
+        a, b = rng.random(size), rng.random(size)
+        kinds = [("array", a, b)]
+        if size <= LIST_LIMIT:
+            kinds.append(("list", a.tolist(), b.tolist()))
+        for kind, x, y in kinds:
+            results[f"map.{kind}.{size}"] = best_time(lambda: neg_map(x))
+            results[f"zipWith.{kind}.{size}"] = best_time(lambda: add_zip(x, y))
+            results[f"reduce.{kind}.{size}"] = best_time(lambda: add_reduce(x))
+    return results
+
+
+def composed(sizes=SIZES):
+    """
+    Seconds per evaluation of `relu(add(mul(x, w), b))` composed from
+    map/zipWith, and as a compiled numpy and loop kernel.
+    """
+    relu_map = operators.map(operators.relu)
+    add_zip = operators.zipWith(operators.add)
+    mul_zip = operators.zipWith(operators.mul)
+    expression = "relu(add(mul(x, w), b))"
+    kernels = {mode: minitorch.compile_kernel(expression, mode) for mode in ("numpy", "loop")}
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in sizes:
+        x, w, b = rng.random(size), rng.random(size), rng.random(size)
+        if size <= LIST_LIMIT:
+            lx, lw, lb = x.tolist(), w.tolist(), b.tolist()
+            results[f"composed.list.{size}"] = best_time(
+                lambda: relu_map(add_zip(mul_zip(lx, lw), lb))
+            )
+        results[f"composed.array.{size}"] = best_time(
+            lambda: relu_map(add_zip(mul_zip(x, w), b))
+        )
+        out = np.empty(size)
+        for mode, kernel in kernels.items():
+            kernel(x, w, b, out=out)
+            results[f"compiled.{mode}.{size}"] = best_time(lambda: kernel(x, w, b, out=out))
+    return results
+
+
+def run(quick=False):
+    results = primitives()
+    sizes = SIZES[:3] if quick else SIZES
+    results.update(higher_order(sizes))
+    results.update(composed(sizes))
+    return results
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:<28} {seconds * 1e6:12.3f} us")
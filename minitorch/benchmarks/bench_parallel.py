@@ -0,0 +1,59 @@
+"""
+Scaling of the tensor kernels with the number of threads.
+
+    python -m benchmarks.bench_parallel [max threads]
+"""
+import os
+import sys
+import numpy as np
+import minitorch
+from minitorch import fast_ops
+from .timer import best_time
+
+
+def kernels(size=10 ** 7, n=1024):
+    "The benchmarked calls: an elementwise map and zip, a reduction and a matmul."
+    rng = np.random.default_rng(0)
+    backend = minitorch.SimpleBackend
+    a = minitorch.tensor(rng.random(size))._tensor
+    b = minitorch.tensor(rng.random(size))._tensor
+    x = minitorch.tensor(rng.random((n, n)))._tensor
+    y = minitorch.tensor(rng.random((n, n)))._tensor
+    return {
+        "exp_map": lambda: backend.exp_map(a),
+        "mul_zip": lambda: backend.mul_zip(a, b),
+        "add_reduce": lambda: backend.add_reduce(a, 0),
+        "matrix_multiply": lambda: backend.matrix_multiply(x, y),
+    }
+
+
+def scaling(threads, size=10 ** 7, n=1024):
+    "`{(name, threads): seconds}` for each kernel and thread count."
+    calls = kernels(size, n)
+    before = fast_ops.get_num_threads()
+    results = {}
+    try:
+        for t in threads:
+            fast_ops.set_num_threads(t)
+            for name, fn in calls.items():
+                results[name, t] = best_time(fn, number=1, repeats=3)
+    finally:
+        fast_ops.set_num_threads(before)
+    return results
+
+
+def run(quick=False):
+    cores = os.cpu_count() or 1
+    threads = sorted({1, cores})
+    size, n = (10 ** 6, 256) if quick else (10 ** 7, 1024)
+    return {f"{name}.threads{t}": s for (name, t), s in scaling(threads, size, n).items()}
+
+
+if __name__ == "__main__":
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    threads = [t for t in (1, 2, 4, 8, 16, 32, 64) if t < top] + [top]
+    results = scaling(threads)
+    for name in kernels(10, 2):
+        base = results[name, 1]
+        for t in threads:
+            print(f"{name:<16} threads {t:>3} {results[name, t] * 1e3:10.2f} ms  {base / results[name, t]:5.2f}x")
@@ -0,0 +1,90 @@
+"""
+End-to-end time of one full batch training epoch on Xor, as in
+`project/run_tensor.py`, and of batch prediction with and without
+gradient recording.
+
+    python -m benchmarks.bench_train [points]
+"""
+import sys
+import numpy as np
+import minitorch
+from .timer import best_time
+
+
+class Linear(minitorch.Module):
+    def __init__(self, in_size, out_size, relu=False):
+        super().__init__()
+        self.weights = minitorch.Parameter(2 * (minitorch.rand((in_size, out_size)) - 0.5))
+        self.bias = minitorch.Parameter(2 * (minitorch.rand((out_size,)) - 0.5))
+        self.relu = relu
+
+    def forward(self, x):
+        return minitorch.linear(x, self.weights.value, self.bias.value, relu=self.relu)
+
+
+class Network(minitorch.Module):
+    def __init__(self, hidden=10):
+        super().__init__()
+        self.layer1 = Linear(2, hidden, relu=True)
+        self.layer2 = Linear(hidden, hidden, relu=True)
+        self.layer3 = Linear(hidden, 1)
+
+    def forward(self, x):
+        h = self.layer2(self.layer1(x))
+        return self.layer3(h).sigmoid()
+
+
+def xor(N, seed=0):
+    "Xor points and labels, as `datasets.Xor` builds them."
+    X = np.random.default_rng(seed).random((N, 2))
+    y = (X[:, 0] < 0.5) != (X[:, 1] < 0.5)
+    return X, y.astype(np.float64)
+
+
+def epoch_time(N=250, rate=0.5):
+    "Seconds per forward, backward and SGD update over `N` points."
+    X, y = xor(N)
+    X, y = minitorch.tensor(X), minitorch.tensor(y)
+    model = Network()
+    parameters = model.flatten_parameters()
+
+    def epoch():
+        out = model(X).view(N)
+        probs = (out * y) + (out - 1.0) * (y - 1.0)
+        loss = -probs.log().sum()
+        parameters.zero_grad()
+        loss.view(1).backward()
+        parameters.sgd_step(rate / N)
+
+    return best_time(epoch)
+
+
+def predict_time(N=10000, grad=False):
+    "Seconds per forward pass over `N` points, under `no_grad` unless `grad`."
+    X = minitorch.tensor(xor(N)[0])
+    model = Network()
+
+    def predict():
+        if grad:
+            return model(X)
+        with minitorch.no_grad():
+            return model(X)
+
+    return best_time(predict)
+
+
+def run(quick=False):
+    sizes = (250,) if quick else (250, 10000)
+    results = {f"xor_epoch.{N}": epoch_time(N) for N in sizes}
+    for N in sizes:
+        results[f"predict.{N}"] = predict_time(N, grad=True)
+        results[f"predict_no_grad.{N}"] = predict_time(N)
+    return results
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    print(f"points           {N}")
+    print(f"epoch            {epoch_time(N) * 1e3:.3f} ms")
+    print(f"predict          {predict_time(N, grad=True) * 1e3:.3f} ms")
+    print(f"predict no_grad  {predict_time(N) * 1e3:.3f} ms")
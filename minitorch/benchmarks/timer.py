@@ -0,0 +1,33 @@
+"""
+Shared timing helper for the benchmarks.
+"""
+import time
+
+
+def best_time(fn, number=None, repeats=5, budget=0.05):
+    """
+    Seconds per call of `fn()` (best of `repeats`).
+    Args:
+        fn (function): function of no arguments
+        number (int, opt): calls per repeat, picked to fill `budget` seconds if None
+        repeats (int): number of repeats
+        budget (float): target seconds per repeat when `number` is None
+    Returns:
+        float : seconds per call
+    """
+    if number is None:
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            if time.perf_counter() - start >= budget / 4 or number >= 1 << 20:
+                break
+            number *= 4
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number
@@ -1,2 +1,15 @@
 from .module import *  # noqa: F401,F403
 from .operators import *  # noqa: F401,F403
+from .tensor_data import *  # noqa: F401,F403
+from .tensor_ops import *  # noqa: F401,F403
+from .autodiff import *  # noqa: F401,F403
+from .scalar import *  # noqa: F401,F403
+from .tensor import *  # noqa: F401,F403
+from .tensor_functions import *  # noqa: F401,F403
+from .flat_parameters import *  # noqa: F401,F403
+from .profiler import *  # noqa: F401,F403
+from .lazy import *  # noqa: F401,F403
+from .checkpoint import *  # noqa: F401,F403
+from .optim import *  # noqa: F401,F403
+from .training import *  # noqa: F401,F403
+from .kernel_compiler import *  # noqa: F401,F403
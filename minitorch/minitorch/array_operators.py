@@ -0,0 +1,136 @@
+"""
+Array versions of every primitive in :mod:`minitorch.operators`.
+
+Each function works elementwise on float64 arrays (inputs broadcast as in
+numpy) and writes into `out` when it is given, which may be one of the
+inputs. Every function is defined over the full float range: overflow
+saturates to the correct limit (`exp` gives inf, `sigmoid` gives 0 or 1)
+instead of raising or producing nan.
+"""
+
+import numpy as np
+from .operators import EPS
+
+
+def _out(out, *arrays):
+    if out is None:
+        return np.empty(np.broadcast_shapes(*[np.shape(a) for a in arrays]))
+    return out
+
+
+def mul(x, y, out=None):
+    ":math:`f(x, y) = x * y`"
+    return np.multiply(x, y, out=_out(out, x, y))
+
+
+def id(x, out=None):
+    ":math:`f(x) = x`"
+    out = _out(out, x)
+    np.copyto(out, x)
+    return out
+
+
+def add(x, y, out=None):
+    ":math:`f(x, y) = x + y`"
+    return np.add(x, y, out=_out(out, x, y))
+
+
+def neg(x, out=None):
+    ":math:`f(x) = -x`"
+    return np.negative(x, out=_out(out, x))
+
+
+def lt(x, y, out=None):
+    ":math:`f(x) =` 1.0 if x is less than y else 0.0"
+    return np.less(x, y, out=_out(out, x, y), casting="unsafe")
+
+
+def eq(x, y, out=None):
+    ":math:`f(x) =` 1.0 if x is equal to y else 0.0"
+    return np.equal(x, y, out=_out(out, x, y), casting="unsafe")
+
+
+def max(x, y, out=None):
+    ":math:`f(x) =` x if x is greater than y else y"
+    return np.maximum(x, y, out=_out(out, x, y))
+
+
+def sigmoid(x, out=None):
+    r"""
+    :math:`f(x) =  \frac{1.0}{(1.0 + e^{-x})}`, computed from
+    :math:`z = e^{-|x|}` so the exponential never overflows.
+    """
+    out = _out(out, x)
+    positive = np.greater_equal(x, 0.0)
+    z = np.exp(-np.abs(x))
+    # z / (1 + z) for negative x, 1 / (1 + z) otherwise.
+    numerator = np.where(positive, 1.0, z)
+    np.add(z, 1.0, out=z)
+    return np.divide(numerator, z, out=out)
+
+
+def sigmoid_back(x, d, out=None):
+    r"If :math:`f = sigmoid` compute :math:`d \times f'(x)`"
+    s = sigmoid(x)
+    out = _out(out, x, d)
+    # s * (1 - s), with 1 - s computed without cancellation as sigmoid(-x).
+    np.multiply(s, sigmoid(np.negative(x)), out=s)
+    return np.multiply(s, d, out=out)
+
+
+def relu(x, out=None):
+    ":math:`f(x) =` x if x is greater than 0, else 0"
+    return np.maximum(x, 0.0, out=_out(out, x))
+
+
+def relu_back(x, y, out=None):
+    ":math:`f(x) =` y if x is greater than 0 else 0"
+    out = _out(out, x, y)
+    # Select rather than multiply by the mask, so inf * 0 never gives nan.
+    negative = np.less_equal(x, 0.0)
+    np.copyto(out, np.broadcast_to(y, out.shape))
+    np.copyto(out, 0.0, where=np.broadcast_to(negative, out.shape))
+    return out
+
+
+def log(x, out=None):
+    ":math:`f(x) = log(x)`"
+    out = np.add(x, EPS, out=_out(out, x))
+    with np.errstate(divide="ignore"):
+        return np.log(out, out=out)
+
+
+def log_back(a, b, out=None):
+    r"If :math:`f = log` compute :math:`b \times f'(a)`"
+    shifted = np.add(a, EPS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.divide(b, shifted, out=_out(out, a, b))
+
+
+def exp(x, out=None):
+    ":math:`f(x) = e^{x}`"
+    with np.errstate(over="ignore"):
+        return np.exp(x, out=_out(out, x))
+
+
+def exp_back(a, b, out=None):
+    r"If :math:`f = exp` compute :math:`b \times f'(a)`"
+    e = exp(a)
+    with np.errstate(invalid="ignore"):
+        return np.multiply(e, b, out=_out(out, a, b))
+
+
+def inv(x, out=None):
+    ":math:`f(x) = 1/x`"
+    with np.errstate(divide="ignore"):
+        return np.divide(1.0, x, out=_out(out, x))
+
+
+def inv_back(a, b, out=None):
+    r"If :math:`f = 1/x` compute :math:`b \times f'(a)`"
+    out = _out(out, a, b)
+    # (b / a) / a rather than b / a ** 2, which overflows for |a| > 1e154.
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        ratio = np.divide(b, a)
+        np.divide(ratio, a, out=out)
+    return np.negative(out, out=out)
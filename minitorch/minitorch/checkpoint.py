@@ -0,0 +1,119 @@
+"""
+Saving and loading module parameters as a single binary file.
+
+The file starts with a header index, followed by the raw parameter values::
+
+    b"MTCK"  format version (uint32)  header length (uint64)
+    header: JSON {"params": [{"name", "shape", "dtype", "offset"}, ...],
+                  "data_offset": int}
+    padding up to `data_offset`, a multiple of `ALIGNMENT`
+    the values of every parameter, contiguous, at `data_offset + offset`
+
+Loading can memory-map the file, so each parameter is a view of the file's
+pages: nothing is read until it is used, and processes mapping the same
+file share one copy of the weights through the page cache.
+"""
+
+import json
+import struct
+import numpy as np
+
+__all__ = ["save_state", "load_state"]
+
+MAGIC = b"MTCK"
+VERSION = 1
+# Parameter data starts on a cache line boundary.
+ALIGNMENT = 64
+_PREFIX = struct.Struct("<4sIQ")
+_DTYPE = np.dtype("<f8")
+
+
+def _aligned(n):
+    return -(-n // ALIGNMENT) * ALIGNMENT
+
+
+def save_state(state, path):
+    """
+    Write `state` (as returned by :meth:`Module.state_dict`) to `path`.
+    Args:
+        state (dict of name x array): parameter values
+        path (string): file to write
+    """
+    entries = []
+    arrays = []
+    offset = 0
+    for name, value in state.items():
+        # ascontiguousarray makes 0-d arrays 1-d, so keep the original shape.
+        array = np.ascontiguousarray(value, dtype=_DTYPE).reshape(np.shape(value))
+        entries.append(
+            {"name": name, "shape": list(array.shape), "dtype": _DTYPE.str, "offset": offset}
+        )
+        arrays.append(array)
+        offset += _aligned(array.nbytes)
+
+    header = {"params": entries, "data_offset": 0}
+    # The data offset depends on the header length, which depends on the offset.
+    data_offset = 0
+    while True:
+        header["data_offset"] = data_offset
+        encoded = json.dumps(header).encode()
+        needed = _aligned(_PREFIX.size + len(encoded))
+        if needed == data_offset:
+            break
+        data_offset = needed
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(encoded)))
+        f.write(encoded)
+        for entry, array in zip(entries, arrays):
+            f.seek(data_offset + entry["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_offset + offset)
+
+
+def _read_header(f):
+    magic, version, length = _PREFIX.unpack(f.read(_PREFIX.size))
+    if magic != MAGIC:
+        raise ValueError("Not a minitorch checkpoint.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}.")
+    return json.loads(f.read(length))
+
+
+def load_state(path, mmap=True, mode="r"):
+    """
+    Read the parameter values written by :func:`save_state`.
+    Args:
+        path (string): checkpoint file
+        mmap (bool): map the file instead of reading it
+        mode (string): memory-map mode, "r" for read-only views shared with
+            other processes, "c" for copy-on-write views that can be modified
+            without changing the file
+    Returns:
+        dict of name x array : the values, views into the mapped file if `mmap`
+    """
+    with open(path, "rb") as f:
+        header = _read_header(f)
+        data_offset = header["data_offset"]
+        if mmap:
+            size = max((_end(e) for e in header["params"]), default=0)
+            if size == 0:
+                data = np.empty(0, dtype=np.uint8)
+            else:
+                data = np.memmap(f, dtype=np.uint8, mode=mode, offset=data_offset, shape=(size,))
+        else:
+            f.seek(data_offset)
+            data = np.frombuffer(bytearray(f.read()), dtype=np.uint8)
+
+    state = {}
+    for e in header["params"]:
+        dtype = np.dtype(e["dtype"])
+        count = int(np.prod(e["shape"]))
+        start = e["offset"]
+        flat = data[start : start + count * dtype.itemsize].view(dtype)
+        state[e["name"]] = flat.reshape(e["shape"])
+    return state
+
+
+def _end(entry):
+    return entry["offset"] + int(np.prod(entry["shape"])) * np.dtype(entry["dtype"]).itemsize
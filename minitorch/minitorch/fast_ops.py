@@ -0,0 +1,490 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from numba import njit
+from numba.core.errors import NumbaError
+from . import array_operators, operators
+
+## Task 3.1
+## Vectorized kernels
+#
+# Kernels work on a flat float64 buffer described by a shape and strides
+# (counted in elements, as in :class:`TensorData`). Functions from
+# :mod:`minitorch.operators` are dispatched to their array version in
+# :mod:`minitorch.array_operators`; any other function is compiled with
+# numba into a plain loop.
+
+
+def as_array(storage, shape, strides):
+    """
+    View a flat buffer with the given layout as a numpy array. No data is copied.
+    Args:
+        storage (array): flat float64 buffer
+        shape (tuple): shape of the view
+        strides (tuple): strides of the view in elements
+    Returns:
+        array : strided view of `storage`
+    """
+    itemsize = storage.itemsize
+    byte_strides = tuple([int(s) * itemsize for s in strides])
+    if storage.flags.c_contiguous:
+        # Much cheaper than as_strided, which goes through __array_interface__.
+        return np.ndarray(tuple(shape), storage.dtype, storage, 0, byte_strides)
+    return np.lib.stride_tricks.as_strided(storage, shape=tuple(shape), strides=byte_strides)
+
+
+def array_strides(a):
+    "Strides of numpy array `a` in elements."
+    return tuple(s // a.itemsize for s in a.strides)
+
+
+# fn -> vectorized kernel called as kernel(*inputs, out=out).
+UNARY_KERNELS = {
+    operators.id: array_operators.id,
+    operators.neg: array_operators.neg,
+    operators.relu: array_operators.relu,
+    operators.sigmoid: array_operators.sigmoid,
+    operators.exp: array_operators.exp,
+    operators.log: array_operators.log,
+    operators.inv: array_operators.inv,
+}
+
+BINARY_KERNELS = {
+    operators.add: array_operators.add,
+    operators.mul: array_operators.mul,
+    operators.max: array_operators.max,
+    operators.lt: array_operators.lt,
+    operators.eq: array_operators.eq,
+    operators.sigmoid_back: array_operators.sigmoid_back,
+    operators.relu_back: array_operators.relu_back,
+    operators.log_back: array_operators.log_back,
+    operators.exp_back: array_operators.exp_back,
+    operators.inv_back: array_operators.inv_back,
+}
+
+# fn -> ufunc whose `reduce` matches reducing with fn.
+REDUCERS = {
+    operators.add: np.add,
+    operators.mul: np.multiply,
+    operators.max: np.maximum,
+}
+
+
+def register(fn, kernel, reducer=None):
+    """
+    Plug a vectorized implementation in for `fn`.
+    Args:
+        fn (function): scalar function, as passed to :func:`map_kernel` etc.
+        kernel (function): vectorized version called as `kernel(*arrays, out=out)`
+        reducer (ufunc, optional): ufunc to use when reducing with `fn`
+    """
+    table = UNARY_KERNELS if fn.__code__.co_argcount == 1 else BINARY_KERNELS
+    table[fn] = kernel
+    if reducer is not None:
+        REDUCERS[fn] = reducer
+    for kind in _COMPILERS:
+        _COMPILED.pop((kind, fn), None)
+
+
+# Parallel execution.
+#
+# Large outputs are cut into chunks that are handed to a thread pool. The
+# array kernels spend their time in numpy loops that release the GIL, so the
+# chunks really run at the same time. Chunks never smaller than
+# `PARALLEL_CHUNK` elements keep small tensors on the calling thread.
+
+PARALLEL_CHUNK = 1 << 16
+
+_num_threads = int(os.environ.get("MINITORCH_NUM_THREADS", os.cpu_count() or 1))
+_pool = None
+# Guards creating and replacing `_pool`.
+_pool_lock = threading.Lock()
+
+
+def set_num_threads(n):
+    """
+    Number of threads the tensor kernels may use (1 disables the pool).
+    Args:
+        n (int): number of threads
+    """
+    global _num_threads, _pool
+    assert n >= 1, "Need at least one thread."
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+        _num_threads = n
+
+
+def get_num_threads():
+    "Number of threads the tensor kernels may use."
+    return _num_threads
+
+
+def _parts(size):
+    "Number of chunks to cut `size` elements of work into."
+    return min(_num_threads, size // PARALLEL_CHUNK)
+
+
+def _chunked(views, axis, parts):
+    "Cut every array in `views` into `parts` pieces along `axis`."
+    n = views[0].shape[axis]
+    bounds = [n * i // parts for i in range(parts + 1)]
+    lead = (slice(None),) * axis
+    return [
+        [v[lead + (slice(lo, hi),)] for v in views] for lo, hi in zip(bounds, bounds[1:])
+    ]
+
+
+def _run_chunks(fn, chunks):
+    "Call `fn(*chunk)` for every chunk, all but the first on the pool."
+    global _pool
+    pool = _pool
+    if pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=_num_threads, thread_name_prefix="minitorch")
+            pool = _pool
+    futures = [pool.submit(fn, *chunk) for chunk in chunks[1:]]
+    results = [fn(*chunks[0])]
+    results.extend(f.result() for f in futures)
+    return results
+
+
+def _split_axis(views):
+    """
+    Views to split and the axis to split them along. Contiguous arrays are
+    flattened so chunks are even; otherwise the longest axis is used.
+    """
+    if all(v.flags.c_contiguous for v in views):
+        return [v.reshape(-1) for v in views], 0
+    shape = views[0].shape
+    return views, shape.index(max(shape))
+
+
+def _elementwise(kernel, out_view, *in_views):
+    "`kernel(*in_views, out=out_view)`, split over the pool for large outputs."
+    parts = _parts(out_view.size)
+    if parts < 2:
+        kernel(*in_views, out=out_view)
+        return
+    views, axis = _split_axis([out_view, *in_views])
+    parts = min(parts, views[0].shape[axis])
+
+    def run(out, *ins):
+        kernel(*ins, out=out)
+
+    _run_chunks(run, _chunked(views, axis, parts))
+
+
+def matmul(a, b, out):
+    """
+    `np.matmul(a, b, out=out)`, with the rows of large outputs split over the
+    pool.
+    """
+    work = out.size * a.shape[-1]
+    parts = min(_parts(work), out.shape[-2])
+    if parts < 2:
+        np.matmul(a, b, out=out)
+        return
+    # Rows are the second to last axis of `a` and `out`.
+    row_axis = out.ndim - 2
+    a = np.broadcast_to(a, out.shape[:-2] + a.shape[-2:])
+    chunks = [
+        [a_rows, b, out_rows]
+        for (a_rows, out_rows) in _chunked([a, out], row_axis, parts)
+    ]
+
+    def run(a_rows, b, out_rows):
+        np.matmul(a_rows, b, out=out_rows)
+
+    _run_chunks(run, chunks)
+
+
+# Compiled fallbacks for functions without a registered kernel.
+#
+# Compiling a loop costs a few tenths of a second, so inputs smaller than
+# `COMPILE_MIN_SIZE` elements run the Python loop unless `fn` is already
+# compiled. At most `COMPILED_CACHE_SIZE` loops are kept, oldest dropped
+# first, so throwaway functions are not held for the life of the process.
+
+COMPILE_MIN_SIZE = 1 << 14
+COMPILED_CACHE_SIZE = 128
+
+_COMPILED = {}
+
+
+def _compiled_unary(fn):
+    f = njit()(fn)
+
+    @njit()
+    def _loop(a, out):
+        for i in range(a.shape[0]):
+            out[i] = f(a[i])
+
+    return _loop
+
+
+def _compiled_binary(fn):
+    f = njit()(fn)
+
+    @njit()
+    def _loop(a, b, out):
+        for i in range(a.shape[0]):
+            out[i] = f(a[i], b[i])
+
+    return _loop
+
+
+def _compiled_reduce(fn):
+    f = njit()(fn)
+
+    @njit()
+    def _loop(a, start):
+        cur = start
+        for i in range(a.shape[0]):
+            cur = f(a[i], cur)
+        return cur
+
+    return _loop
+
+
+def _compiled_reduce_rows(fn):
+    f = njit()(fn)
+
+    @njit()
+    def _loop(a, start, out):
+        for r in range(a.shape[0]):
+            cur = start
+            for i in range(a.shape[1]):
+                cur = f(a[r, i], cur)
+            out[r] = cur
+
+    return _loop
+
+
+def _python_unary(a, out, fn):
+    for i in range(a.shape[0]):
+        out[i] = fn(a[i])
+
+
+def _python_binary(a, b, out, fn):
+    for i in range(a.shape[0]):
+        out[i] = fn(a[i], b[i])
+
+
+def _python_reduce(a, start, fn):
+    cur = start
+    for x in a:
+        cur = fn(x, cur)
+    return cur
+
+
+def _python_reduce_rows(a, start, out, fn):
+    for r in range(a.shape[0]):
+        out[r] = _python_reduce(a[r], start, fn)
+
+
+_COMPILERS = {
+    "map": _compiled_unary,
+    "zip": _compiled_binary,
+    "reduce": _compiled_reduce,
+    "reduce_rows": _compiled_reduce_rows,
+}
+_FALLBACKS = {
+    "map": _python_unary,
+    "zip": _python_binary,
+    "reduce": _python_reduce,
+    "reduce_rows": _python_reduce_rows,
+}
+
+
+def _run_compiled(kind, fn, *args):
+    """
+    Run the compiled loop of `kind` for `fn`, compiling it on first use.
+    Small inputs, and functions numba cannot compile or type (builtins,
+    closures over Python objects), run through the same loop in Python.
+    """
+    key = (kind, fn)
+    loop = _COMPILED.get(key)
+    if loop is not None:
+        return loop(*args)
+    if args[0].size < COMPILE_MIN_SIZE:
+        return _FALLBACKS[kind](*args, fn)
+
+    try:
+        loop = _COMPILERS[kind](fn)
+        result = loop(*args)
+    except (NumbaError, TypeError):
+        loop = _bind(_FALLBACKS[kind], fn)
+        result = loop(*args)
+    if len(_COMPILED) >= COMPILED_CACHE_SIZE:
+        del _COMPILED[next(iter(_COMPILED))]
+    _COMPILED[key] = loop
+    return result
+
+
+def _bind(loop, fn):
+    def bound(*args):
+        return loop(*args, fn)
+
+    return bound
+
+
+def map_kernel(fn):
+    """
+    Low-level map over a flat buffer.
+    Args:
+        fn (one-arg function): function from :mod:`operators` or any float -> float function
+    Returns:
+        function : `_map(out, out_shape, out_strides, in_storage, in_shape, in_strides)`
+        that fills `out` with `fn` applied to the input. `in_shape` must equal `out_shape`.
+    """
+    kernel = UNARY_KERNELS.get(fn)
+
+    def _map(out, out_shape, out_strides, in_storage, in_shape, in_strides):
+        out_view = as_array(out, out_shape, out_strides)
+        in_view = as_array(in_storage, in_shape, in_strides)
+        if kernel is not None:
+            _elementwise(kernel, out_view, in_view)
+            return
+        a = np.ascontiguousarray(in_view).reshape(-1)
+        res = np.empty_like(a)
+        _run_compiled("map", fn, a, res)
+        out_view[...] = res.reshape(in_view.shape)
+
+    return _map
+
+
+def zip_kernel(fn):
+    """
+    Low-level zipWith over two flat buffers.
+    Args:
+        fn (two-arg function): function from :mod:`operators` or any (float, float) -> float function
+    Returns:
+        function : `_zip(out, out_shape, out_strides, a_storage, a_shape, a_strides,
+        b_storage, b_shape, b_strides)` that fills `out` with `fn(a, b)`.
+        `a_shape` and `b_shape` must equal `out_shape`.
+    """
+    kernel = BINARY_KERNELS.get(fn)
+
+    def _zip(
+        out, out_shape, out_strides, a_storage, a_shape, a_strides, b_storage, b_shape, b_strides
+    ):
+        out_view = as_array(out, out_shape, out_strides)
+        a_view = as_array(a_storage, a_shape, a_strides)
+        b_view = as_array(b_storage, b_shape, b_strides)
+        if kernel is not None:
+            _elementwise(kernel, out_view, a_view, b_view)
+            return
+        a = np.ascontiguousarray(a_view).reshape(-1)
+        b = np.ascontiguousarray(b_view).reshape(-1)
+        res = np.empty_like(a)
+        _run_compiled("zip", fn, a, b, res)
+        out_view[...] = res.reshape(a_view.shape)
+
+    return _zip
+
+
+def reduce_kernel(fn, start):
+    """
+    Low-level reduction of a whole flat buffer to a single value.
+    Args:
+        fn (two-arg function): combine two values
+        start (float): start value :math:`x_0`
+    Returns:
+        function : `_reduce(a_storage, a_shape, a_strides)` returning the float
+        :math:`fn(x_n, \\ldots fn(x_1, x_0))`.
+    """
+    reducer = REDUCERS.get(fn)
+
+    def _reduce(a_storage, a_shape, a_strides):
+        a_view = as_array(a_storage, a_shape, a_strides)
+        if reducer is not None:
+            parts = _parts(a_view.size)
+            if parts < 2:
+                return float(reducer.reduce(a_view, axis=None, initial=start))
+            views, axis = _split_axis([a_view])
+            parts = min(parts, views[0].shape[axis])
+            partials = _run_chunks(
+                lambda chunk: reducer.reduce(chunk, axis=None), _chunked(views, axis, parts)
+            )
+            return float(reducer.reduce(np.array(partials), initial=start))
+        a = np.ascontiguousarray(a_view).reshape(-1)
+        return float(_run_compiled("reduce", fn, a, float(start)))
+
+    return _reduce
+
+
+def reduce_dim_kernel(fn, start):
+    """
+    Low-level reduction of one dimension of a flat buffer.
+    Args:
+        fn (two-arg function): combine two values
+        start (float): start value :math:`x_0`
+    Returns:
+        function : `_reduce(out, out_shape, out_strides, a_storage, a_shape, a_strides, reduce_dim)`
+        that fills `out` (shaped like `a` with `reduce_dim` set to 1) with the reduction
+        along `reduce_dim`.
+    """
+    reducer = REDUCERS.get(fn)
+
+    def _reduce(out, out_shape, out_strides, a_storage, a_shape, a_strides, reduce_dim):
+        out_view = as_array(out, out_shape, out_strides)
+        a_view = as_array(a_storage, a_shape, a_strides)
+        if reducer is not None:
+
+            def run(a, out):
+                reducer.reduce(a, axis=reduce_dim, keepdims=True, initial=start, out=out)
+
+            # Split along the longest other dimension, so chunks reduce whole rows.
+            shape = list(a_view.shape)
+            shape[reduce_dim] = 0
+            axis = shape.index(max(shape))
+            parts = min(_parts(a_view.size), shape[axis])
+            if parts < 2:
+                run(a_view, out_view)
+                return
+            _run_chunks(run, _chunked([a_view, out_view], axis, parts))
+            return
+        # Move the reduced dimension last and walk it row by row.
+        rows = np.ascontiguousarray(np.moveaxis(a_view, reduce_dim, -1))
+        res = np.empty(rows.shape[:-1])
+        _run_compiled(
+            "reduce_rows", fn, rows.reshape(-1, a_shape[reduce_dim]), float(start), res.reshape(-1)
+        )
+        out_view[...] = np.expand_dims(res, reduce_dim)
+
+    return _reduce
+
+
+# Array helpers used by the list-level operators.
+
+
+def map_array(fn, a):
+    "Apply `fn` to every element of array `a`, returning a new float64 array."
+    a = np.asarray(a, dtype=np.float64)
+    out = np.empty(a.shape)
+    map_kernel(fn)(out, out.shape, array_strides(out), a, a.shape, array_strides(a))
+    return out
+
+
+def zip_array(fn, a, b):
+    "Apply `fn` to every pair of elements of equally shaped arrays `a` and `b`."
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    assert a.shape == b.shape, f"Shapes {a.shape} and {b.shape} must match."
+    out = np.empty(a.shape)
+    zip_kernel(fn)(
+        out, out.shape, array_strides(out),
+        a, a.shape, array_strides(a),
+        b, b.shape, array_strides(b),
+    )
+    return out
+
+
+def reduce_array(fn, start, a):
+    "Reduce all elements of array `a` with `fn` starting from `start`."
+    a = np.asarray(a, dtype=np.float64)
+    return reduce_kernel(fn, start)(a, a.shape, array_strides(a))
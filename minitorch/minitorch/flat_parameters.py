@@ -0,0 +1,92 @@
+"""
+Packing every parameter of a module tree into one contiguous buffer.
+"""
+
+import numpy as np
+from .tensor import Tensor
+from .tensor_data import TensorData
+
+
+class FlatParameters:
+    """
+    All the tensor parameters of a :class:`Module` tree packed into one flat
+    `data` buffer, with their gradients packed into a matching `grad` buffer.
+
+    Each `Parameter.value` becomes a tensor whose storage is a view into
+    `data`, and its `grad` a view into `grad`, so whole-model updates,
+    gradient zeroing and checkpoints are single array operations.
+    `Parameter.update` copies into the view instead of replacing it.
+
+    Attributes:
+        parameters (tuple of :class:`Parameter`): the packed parameters, in registry order
+        data (array): flat float64 buffer of all the parameter values
+        grad (array): flat float64 buffer of all the gradients
+    """
+
+    def __init__(self, module):
+        self.parameters = tuple(module.parameters())
+        for p in self.parameters:
+            assert isinstance(p.value, Tensor), f"Can only pack tensor parameters, got {p}."
+        size = sum(p.value.size for p in self.parameters)
+        self.data = np.empty(size)
+        self.grad = np.zeros(size)
+        self._grads = []
+
+        offset = 0
+        for p in self.parameters:
+            value = p.value
+            shape = value.shape
+            end = offset + value.size
+            self.data[offset:end] = value.to_numpy().reshape(-1)
+            flat = Tensor(TensorData(self.data[offset:end], shape), backend=value.backend)
+            flat.requires_grad_(p.requires_grad)
+            grad = Tensor(TensorData(self.grad[offset:end], shape), backend=value.backend)
+            flat.derivative = grad
+            p.value = flat
+            p.buffer = self
+            self._grads.append(grad)
+            offset = end
+
+    def __len__(self):
+        return len(self.data)
+
+    def _sync_grads(self):
+        # `zero_grad_` on a single tensor detaches its gradient from the buffer.
+        for p, grad in zip(self.parameters, self._grads):
+            derivative = p.value.derivative
+            if derivative is not grad:
+                if derivative is None:
+                    grad.to_numpy()[...] = 0.0
+                else:
+                    grad.to_numpy()[...] = derivative.to_numpy()
+                p.value.derivative = grad
+
+    def zero_grad(self):
+        "Reset every gradient in the buffer."
+        self._sync_grads()
+        self.grad.fill(0.0)
+
+    def sgd_step(self, rate):
+        """
+        Gradient descent update of every parameter, `data -= rate * grad`.
+        Args:
+            rate (float): learning rate
+        """
+        self._sync_grads()
+        self.data -= rate * self.grad
+
+    def state(self):
+        """
+        Returns:
+            array : a copy of all the parameter values
+        """
+        return self.data.copy()
+
+    def load_state(self, state):
+        """
+        Overwrite all the parameter values from :meth:`state`.
+        Args:
+            state (array): flat values, as returned by :meth:`state`
+        """
+        assert state.shape == self.data.shape, f"Expected {self.data.shape} values, got {state.shape}."
+        self.data[...] = state
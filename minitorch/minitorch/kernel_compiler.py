@@ -0,0 +1,337 @@
+"""
+Compiler for compositions of :mod:`minitorch.operators` primitives.
+
+A composition such as ``relu(add(mul(x, w), b))`` is turned into the
+source of one specialized function, executed once and cached by the
+structure of the expression, so every later use (with any input names)
+reuses it. Two kinds of kernel are generated:
+
+* ``"numpy"``: straight line code calling :mod:`minitorch.array_operators`,
+  writing intermediates in place where they have the result shape. Inputs
+  broadcast as in numpy.
+* ``"loop"``: a single loop computing the whole expression per element with
+  the scalar formulas inlined, compiled with numba (or run as Python if
+  numba cannot type it).
+
+Both remove the per-element function calls of composing
+:func:`operators.map` and :func:`operators.zipWith`.
+"""
+
+import ast
+import math
+import numpy as np
+from numba import njit
+from numba.core.errors import NumbaError
+from . import array_operators, operators
+
+__all__ = ["compile_kernel"]
+
+
+class Expr:
+    """
+    Node of a composition: an input, a constant or a primitive call.
+
+    Attributes:
+        fn (function): primitive of :mod:`minitorch.operators`, None for inputs and constants
+        args (tuple of :class:`Expr`): arguments of `fn`
+        name (string): input name, for inputs
+        value (float): value, for constants
+    """
+
+    def __init__(self, fn=None, args=(), name=None, value=None):
+        self.fn = fn
+        self.args = args
+        self.name = name
+        self.value = value
+
+
+def var(name):
+    "An input of the composition."
+    return Expr(name=name)
+
+
+def call(fn, *args):
+    """
+    Apply a primitive of :mod:`minitorch.operators`.
+    Args:
+        fn (function): the primitive, e.g. `operators.relu`
+        args: :class:`Expr`, input names or numbers
+    """
+    assert fn in _LOOP_TEMPLATES, f"{fn} is not an operators primitive."
+    args = tuple(_as_expr(a) for a in args)
+    assert len(args) == fn.__code__.co_argcount, f"Wrong number of arguments for {fn.__name__}."
+    return Expr(fn, args)
+
+
+def _as_expr(a):
+    if isinstance(a, Expr):
+        return a
+    if isinstance(a, str):
+        return var(a)
+    return Expr(value=float(a))
+
+
+def parse(source):
+    """
+    Parse a composition written as calls, e.g. ``"relu(add(mul(x, w), b))"``.
+    Function names are primitives of :mod:`minitorch.operators`, other names
+    are inputs and numbers are constants.
+    """
+
+    def build(node):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            fn = PRIMITIVES.get(node.func.id)
+            if fn is None:
+                raise ValueError(f"Unknown primitive {node.func.id!r}.")
+            return call(fn, *[build(a) for a in node.args])
+        if isinstance(node, ast.Name):
+            return var(node.id)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return Expr(value=float(node.value))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            inner = build(node.operand)
+            if inner.value is not None:
+                return Expr(value=-inner.value)
+        raise ValueError(f"Unsupported expression {ast.unparse(node)!r}.")
+
+    return build(ast.parse(source, mode="eval").body)
+
+
+# Scalar formulas of the primitives for the loop kernels: statements
+# assigning the result to {t} from the argument variables {a} and {b}.
+_SIGMOID = "{t} = 1.0 / (1.0 + exp(-{a})) if {a} >= 0.0 else exp({a}) / (1.0 + exp({a}))"
+_LOOP_TEMPLATES = {
+    operators.id: ["{t} = {a}"],
+    operators.neg: ["{t} = -{a}"],
+    operators.add: ["{t} = {a} + {b}"],
+    operators.mul: ["{t} = {a} * {b}"],
+    operators.lt: ["{t} = 1.0 if {a} < {b} else 0.0"],
+    operators.eq: ["{t} = 1.0 if {a} == {b} else 0.0"],
+    operators.max: ["{t} = {a} if {a} > {b} else {b}"],
+    operators.relu: ["{t} = {a} if {a} > 0.0 else 0.0"],
+    operators.relu_back: ["{t} = {b} if {a} > 0.0 else 0.0"],
+    operators.sigmoid: [_SIGMOID],
+    operators.sigmoid_back: [_SIGMOID, "{t} = {b} * {t} * (1.0 - {t})"],
+    operators.log: ["{t} = log({a} + EPS)"],
+    operators.log_back: ["{t} = {b} / ({a} + EPS)"],
+    operators.exp: ["{t} = exp({a})"],
+    operators.exp_back: ["{t} = exp({a}) * {b}"],
+    operators.inv: ["{t} = 1.0 / {a}"],
+    operators.inv_back: ["{t} = -(1.0 / {a} ** 2) * {b}"],
+}
+
+# Name -> primitive, for :func:`parse`.
+PRIMITIVES = {fn.__name__: fn for fn in _LOOP_TEMPLATES}
+
+
+def _flatten(root):
+    """
+    Number the nodes of `root` in evaluation order, sharing repeated
+    subexpressions.
+    Returns:
+        (list, list, string) : input names in order of first use, nodes as
+        `(fn, args)` or `(None, value)` for constants, and the signature
+    """
+    names = []
+    nodes = []
+    keys = {}
+
+    def visit(e):
+        # Inputs are numbered in order of first use, so the key of a node
+        # only depends on the structure of the expression.
+        if e.name is not None:
+            if e.name not in names:
+                names.append(e.name)
+            return f"${names.index(e.name)}"
+        if e.value is not None:
+            key = repr(e.value)
+            if key not in keys:
+                keys[key] = len(nodes)
+                nodes.append((None, e.value))
+            return key
+        arg_keys = [visit(a) for a in e.args]
+        key = f"{e.fn.__name__}({','.join(arg_keys)})"
+        if key not in keys:
+            args = tuple(k if k.startswith("$") else keys[k] for k in arg_keys)
+            keys[key] = len(nodes)
+            nodes.append((e.fn, args))
+        return key
+
+    signature = visit(root)
+    return names, nodes, signature
+
+
+def _operand(arg, nodes, prefix="x"):
+    """
+    Source for an argument: input `$i` (named `prefix` i), constant or temporary.
+    Infinite and nan constants come out as the names `inf` and `nan`, which
+    both kernel namespaces define.
+    """
+    if isinstance(arg, str):
+        return f"{prefix}{arg[1:]}"
+    fn, value = nodes[arg]
+    if fn is None:
+        return repr(value)
+    return f"t{arg}"
+
+
+def _last_uses(nodes):
+    last = {}
+    for j, (fn, args) in enumerate(nodes):
+        if fn is not None:
+            for a in args:
+                last[a] = j
+    return last
+
+
+def _numpy_source(n_inputs, nodes):
+    params = ", ".join(f"x{i}" for i in range(n_inputs))
+    lines = [f"def kernel({params}, out=None):"]
+    last = _last_uses(nodes)
+    result = len(nodes) - 1
+    for j, (fn, args) in enumerate(nodes):
+        if fn is None:
+            continue
+        operands = [_operand(a, nodes) for a in args]
+        call_args = ", ".join(operands)
+        if j == result:
+            lines.append(f"    return {fn.__name__}({call_args}, out=out)")
+            continue
+        # Write in place into a temporary that dies here, when it has the result shape.
+        dead = [o for a, o in zip(args, operands) if o.startswith("t") and last[a] == j]
+        target = "None" if not dead else f"reuse({dead[0]}, {call_args})"
+        lines.append(f"    t{j} = {fn.__name__}({call_args}, out={target})")
+    return "\n".join(lines) + "\n"
+
+
+def _reuse(t, *args):
+    "`t` if it has the broadcast shape of `args`, else None."
+    shape = np.broadcast_shapes(*[np.shape(a) for a in args])
+    return t if t.shape == shape else None
+
+
+def _loop_source(n_inputs, nodes):
+    params = ", ".join(f"x{i}" for i in range(n_inputs))
+    lines = [f"def loop({params}, out):", "    for i in range(out.shape[0]):"]
+    for i in range(n_inputs):
+        lines.append(f"        e{i} = x{i}[i]")
+    for j, (fn, args) in enumerate(nodes):
+        if fn is None:
+            continue
+        operands = [_operand(a, nodes, "e") for a in args]
+        fields = dict(zip("ab", operands), t=f"t{j}")
+        lines.extend("        " + s.format(**fields) for s in _LOOP_TEMPLATES[fn])
+    lines.append(f"        out[i] = t{len(nodes) - 1}")
+    return "\n".join(lines) + "\n"
+
+
+def _exec(source, name, namespace):
+    namespace = dict(namespace)
+    exec(compile(source, f"<minitorch kernel {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_NUMPY_NAMESPACE = {fn.__name__: getattr(array_operators, fn.__name__) for fn in _LOOP_TEMPLATES}
+_NUMPY_NAMESPACE["reuse"] = _reuse
+_NUMPY_NAMESPACE.update(inf=math.inf, nan=math.nan)
+_LOOP_NAMESPACE = {
+    "exp": math.exp,
+    "log": math.log,
+    "EPS": operators.EPS,
+    "inf": math.inf,
+    "nan": math.nan,
+}
+
+
+class Kernel:
+    """
+    A compiled composition, called with its inputs (arrays or floats) in
+    order of first use in the expression, or by name.
+
+    Attributes:
+        inputs (tuple of string): input names, in call order
+        signature (string): structure of the expression the kernel is cached under
+        mode (string): "numpy" or "loop"
+        source (string): the generated source
+    """
+
+    def __init__(self, inputs, signature, mode, source, fn):
+        self.inputs = inputs
+        self.signature = signature
+        self.mode = mode
+        self.source = source
+        self._fn = fn
+
+    def __call__(self, *args, out=None, **kwargs):
+        if kwargs:
+            args = args + tuple(kwargs.pop(name) for name in self.inputs[len(args) :])
+            assert not kwargs, f"Unknown inputs {sorted(kwargs)}."
+        assert len(args) == len(self.inputs), f"Expected inputs {self.inputs}."
+        if self.mode == "numpy":
+            return self._fn(*args, out=out)
+        # The loop walks flat arrays of the broadcast shape.
+        arrays = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in args])
+        shape = arrays[0].shape
+        flat = [np.ascontiguousarray(a).reshape(-1) for a in arrays]
+        if out is None:
+            out = np.empty(shape)
+        if out.flags.c_contiguous:
+            self._fn(*flat, out.reshape(-1))
+        else:
+            result = np.empty(out.size)
+            self._fn(*flat, result)
+            out[...] = result.reshape(shape)
+        return out
+
+
+# (signature, mode) -> (source, function), shared by every kernel with that structure.
+_CACHE = {}
+
+
+def _compile_loop(source):
+    loop = _exec(source, "loop", _LOOP_NAMESPACE)
+    jitted = njit()(loop)
+
+    def run(*args):
+        nonlocal jitted
+        if jitted is not None:
+            try:
+                return jitted(*args)
+            except NumbaError:
+                jitted = None
+        return loop(*args)
+
+    return run
+
+
+def compile_kernel(expression, mode="numpy"):
+    """
+    Compile a composition of :mod:`minitorch.operators` primitives. ::
+
+        kernel = minitorch.compile_kernel("relu(add(mul(x, w), b))")
+        y = kernel(x, w, b)
+
+    Args:
+        expression (string or :class:`Expr`): the composition
+        mode (string): "numpy" for array operations, "loop" for one compiled loop
+    Returns:
+        :class:`Kernel` : the kernel, compiled once per expression structure and mode
+    """
+    assert mode in ("numpy", "loop"), f"Unknown mode {mode}."
+    if isinstance(expression, str):
+        expression = parse(expression)
+    assert expression.fn is not None, "The expression must be a primitive call."
+    names, nodes, signature = _flatten(expression)
+    assert names, "The expression has no inputs."
+    key = (signature, mode)
+    cached = _CACHE.get(key)
+    if cached is None:
+        if mode == "numpy":
+            source = _numpy_source(len(names), nodes)
+            fn = _exec(source, "kernel", _NUMPY_NAMESPACE)
+        else:
+            source = _loop_source(len(names), nodes)
+            fn = _compile_loop(source)
+        cached = _CACHE[key] = (source, fn)
+    source, fn = cached
+    return Kernel(tuple(names), signature, mode, source, fn)
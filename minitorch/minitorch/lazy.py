@@ -0,0 +1,372 @@
+"""
+Lazy evaluation of elementwise tensor expressions with operator fusion.
+
+Inside :func:`lazy_mode`, elementwise tensor operations (arithmetic,
+comparisons, `sigmoid`, `relu`, `log`, `exp`) return a :class:`LazyTensor`
+recording the expression instead of computing it. The expression is
+evaluated when it reaches a full `sum`/`mean`, `item`, or any other tensor
+operation. Evaluation runs the whole expression one block of rows at a
+time, so intermediates stay small and in cache and every input is read
+from memory once. A full sum never materializes the expression at all.
+
+The evaluated expression is a single autodiff operation (:class:`Fused`),
+whose backward pass is fused the same way.
+"""
+
+import numpy as np
+from . import array_operators as aop
+from .tensor import Tensor
+from .tensor_data import TensorData, shape_broadcast
+from .tensor_functions import Function, tensor
+
+__all__ = ["LazyTensor", "lazy_mode"]
+
+# True inside `lazy_mode`.
+enabled = False
+
+# Elements evaluated per block: big enough to amortize the numpy calls,
+# small enough that all the intermediates of a block fit in cache.
+BLOCK_SIZE = 1 << 13
+
+
+class lazy_mode:
+    """
+    Context manager turning on lazy evaluation of elementwise operations. ::
+
+        with minitorch.lazy_mode():
+            loss = -((out * y) + (out - 1.0) * (y - 1.0)).log().sum()
+    """
+
+    def __enter__(self):
+        global enabled
+        self._previous = enabled
+        enabled = True
+        return self
+
+    def __exit__(self, *exc):
+        global enabled
+        enabled = self._previous
+        return False
+
+
+def node(fn, *inputs):
+    """
+    Record `fn` applied to `inputs`.
+    Args:
+        fn (:class:`Elementwise`): the elementwise function
+        inputs: tensors, lazy tensors or numbers
+    Returns:
+        :class:`LazyTensor` : the unevaluated result
+    """
+    backend = None
+    for v in inputs:
+        if isinstance(v, (Tensor, LazyTensor)):
+            backend = v.backend
+            break
+    inputs = tuple(
+        tensor([v], backend=backend) if isinstance(v, (int, float)) else v for v in inputs
+    )
+    shape = inputs[0].shape
+    for v in inputs[1:]:
+        shape = shape_broadcast(shape, v.shape)
+    return LazyTensor(fn.array_fn, inputs, shape, backend)
+
+
+class LazyTensor:
+    """
+    An elementwise expression over tensors that has not been evaluated yet.
+    Elementwise operations on it extend the expression; everything else
+    evaluates it first (see :meth:`materialize`).
+
+    Attributes:
+        fn : function of :mod:`minitorch.array_operators` applied at this node
+        inputs (tuple): :class:`LazyTensor` or :class:`Tensor` arguments of `fn`
+        shape (tuple): shape of the result
+        backend : backend of the tensors in the expression
+    """
+
+    __slots__ = ("fn", "inputs", "shape", "backend", "_value")
+
+    def __init__(self, fn, inputs, shape, backend):
+        self.fn = fn
+        self.inputs = inputs
+        self.shape = shape
+        self.backend = backend
+        self._value = None
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def dims(self):
+        return len(self.shape)
+
+    def materialize(self):
+        """
+        Evaluate the expression (once).
+        Returns:
+            :class:`Tensor` : the result, differentiable with respect to the tensors used
+        """
+        if self._value is None:
+            program, leaves = _compile(self)
+            self._value = Fused.apply(program, False, *leaves)
+        return self._value
+
+    def sum(self, dim=None):
+        "Compute the sum over dimension `dim`, without materializing the expression if `dim` is None"
+        if dim is not None:
+            return self.materialize().sum(dim)
+        if self._value is not None:
+            return self._value.sum()
+        program, leaves = _compile(self)
+        return Fused.apply(program, True, *leaves)
+
+    def mean(self, dim=None):
+        "Compute the mean over dimension `dim`"
+        if dim is None:
+            return self.sum() / self.size
+        return self.sum(dim) / self.shape[dim]
+
+    def __getattr__(self, key):
+        # Any other tensor method works on the evaluated result.
+        return getattr(self.materialize(), key)
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+    # Elementwise operations extend the expression.
+    def __add__(self, b):
+        return node(Add, self, b)
+
+    def __radd__(self, b):
+        return node(Add, b, self)
+
+    def __sub__(self, b):
+        return node(Add, self, node(Neg, b))
+
+    def __rsub__(self, b):
+        return node(Add, b, node(Neg, self))
+
+    def __mul__(self, b):
+        return node(Mul, self, b)
+
+    def __rmul__(self, b):
+        return node(Mul, b, self)
+
+    def __truediv__(self, b):
+        return node(Mul, self, node(Inv, b))
+
+    def __rtruediv__(self, b):
+        return node(Mul, b, node(Inv, self))
+
+    def __neg__(self):
+        return node(Neg, self)
+
+    def __lt__(self, b):
+        return node(LT, self, b)
+
+    def __gt__(self, b):
+        return node(LT, b, self)
+
+    def __eq__(self, b):
+        return node(EQ, self, b)
+
+    def sigmoid(self):
+        return node(Sigmoid, self)
+
+    def relu(self):
+        return node(ReLU, self)
+
+    def log(self):
+        return node(Log, self)
+
+    def exp(self):
+        return node(Exp, self)
+
+
+class Program:
+    """
+    A compiled expression: `ops[j] = (fn, args)` computes value `n_leaves + j`
+    from earlier values, where values `0 .. n_leaves - 1` are the leaf tensors.
+
+    Attributes:
+        ops (list): `(fn, args)` in evaluation order
+        n_leaves (int): number of leaf tensors
+        needs (tuple of bool): whether each leaf needs a gradient
+        shape (tuple): shape of the result
+    """
+
+    def __init__(self, ops, n_leaves, needs, shape):
+        self.ops = ops
+        self.n_leaves = n_leaves
+        self.needs = needs
+        self.shape = shape
+
+
+def _compile(root):
+    "Flatten the expression under `root` into a :class:`Program` and its leaf tensors."
+    leaves = []
+    ids = {}
+    ops = []
+    stack = [(root, False)]
+    while stack:
+        v, expanded = stack.pop()
+        if id(v) in ids:
+            continue
+        if isinstance(v, LazyTensor) and v._value is not None:
+            # Already evaluated: use the result as a leaf.
+            value = v._value
+            if id(value) not in ids:
+                ids[id(value)] = len(leaves)
+                leaves.append(value)
+            ids[id(v)] = ids[id(value)]
+            continue
+        if isinstance(v, Tensor):
+            ids[id(v)] = len(leaves)
+            leaves.append(v)
+            continue
+        if not expanded:
+            stack.append((v, True))
+            for inp in reversed(v.inputs):
+                if id(inp) not in ids:
+                    stack.append((inp, False))
+            continue
+        ops.append((v.fn, tuple(id(inp) for inp in v.inputs)))
+        ids[id(v)] = -len(ops)
+    # Ops refer to leaves as 0 .. n - 1 and to op j as n + j.
+    n = len(leaves)
+
+    def index(key):
+        i = ids[key]
+        return i if i >= 0 else n - i - 1
+
+    ops = [(fn, tuple(index(a) for a in args)) for fn, args in ops]
+    needs = tuple(leaf.history is not None for leaf in leaves)
+    return Program(ops, n, needs, root.shape), leaves
+
+
+def _row_blocks(shape):
+    "Yield `(lo, hi)` bounds of the row blocks of an array of `shape`."
+    inner = int(np.prod(shape[1:]))
+    rows = max(1, BLOCK_SIZE // max(inner, 1))
+    for lo in range(0, shape[0], rows):
+        yield lo, min(lo + rows, shape[0])
+
+
+def _forward_block(program, leaf_views, lo, hi, buffers):
+    "All the values of `program` for rows `lo:hi`."
+    values = [view[lo:hi] for view in leaf_views]
+    for (fn, args), buf in zip(program.ops, buffers):
+        values.append(fn(*[values[a] for a in args], out=buf[: hi - lo]))
+    return values
+
+
+def _block_buffers(program):
+    "One block sized buffer per op, reused for every block."
+    shape = program.shape
+    # Empty arrays have no blocks, and need no room.
+    rows = next(_row_blocks(shape), (0, 0))[1]
+    return [np.empty((rows,) + tuple(shape[1:])) for _ in program.ops]
+
+
+# Gradient of `fn` with respect to its argument `k`, given the argument
+# values `x`, the result `out` and the result gradient `g`.
+_BACKWARD = {
+    aop.add: lambda k, x, out, g: g,
+    aop.mul: lambda k, x, out, g: aop.mul(g, x[1 - k]),
+    aop.neg: lambda k, x, out, g: aop.neg(g),
+    aop.inv: lambda k, x, out, g: aop.inv_back(x[0], g),
+    aop.sigmoid: lambda k, x, out, g: aop.sigmoid_back(x[0], g),
+    aop.relu: lambda k, x, out, g: aop.relu_back(x[0], g),
+    aop.log: lambda k, x, out, g: aop.log_back(x[0], g),
+    aop.exp: lambda k, x, out, g: aop.mul(g, out),
+}
+
+
+class Fused(Function):
+    """
+    Evaluation of a :class:`Program` as one autodiff operation, either
+    elementwise (`reduce` False) or summed to shape `(1,)` (`reduce` True).
+    """
+
+    @staticmethod
+    def forward(ctx, program, reduce, *leaves):
+        ctx.save_for_backward(program, reduce, leaves)
+        shape = program.shape
+        views = [np.broadcast_to(leaf.to_numpy(), shape) for leaf in leaves]
+        buffers = _block_buffers(program)
+        backend = leaves[0].backend
+        if reduce:
+            total = 0.0
+            for lo, hi in _row_blocks(shape):
+                total += float(_forward_block(program, views, lo, hi, buffers)[-1].sum())
+            return tensor([total], backend=backend)
+
+        out = np.empty(shape)
+        for lo, hi in _row_blocks(shape):
+            # The last op writes its block straight into the output.
+            buffers[-1] = out[lo:hi]
+            _forward_block(program, views, lo, hi, buffers)
+        return Tensor(TensorData(out.reshape(-1), shape), backend=backend)
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        program, reduce, leaves = ctx.saved_values
+        shape = program.shape
+        n = program.n_leaves
+        views = [np.broadcast_to(leaf.to_numpy(), shape) for leaf in leaves]
+        buffers = _block_buffers(program)
+
+        # Which values need a gradient: leaves with history, and ops using them.
+        needs = list(program.needs)
+        for fn, args in program.ops:
+            needs.append(fn in _BACKWARD and any(needs[a] for a in args))
+
+        full = [(1,) * (len(shape) - leaf.dims) + leaf.shape for leaf in leaves]
+        grads = [np.zeros(f) if needs[i] else None for i, f in enumerate(full)]
+        g_out = grad_output.to_numpy()
+        g_view = None if reduce else np.broadcast_to(g_out, shape)
+
+        for lo, hi in _row_blocks(shape):
+            values = _forward_block(program, views, lo, hi, buffers)
+            block = [None] * len(values)
+            if reduce:
+                block[-1] = np.broadcast_to(g_out[0], values[-1].shape)
+            else:
+                block[-1] = g_view[lo:hi]
+            for j in range(len(program.ops) - 1, -1, -1):
+                g = block[n + j]
+                if g is None:
+                    continue
+                fn, args = program.ops[j]
+                x = [values[a] for a in args]
+                for k, a in enumerate(args):
+                    if not needs[a]:
+                        continue
+                    d = _BACKWARD[fn](k, x, values[n + j], g)
+                    block[a] = d if block[a] is None else block[a] + d
+            for i in range(n):
+                if grads[i] is not None and block[i] is not None:
+                    _accumulate(grads[i], block[i], full[i], shape, lo, hi)
+
+        leaf_grads = [
+            0.0 if g is None else leaf._new(TensorData(g.reshape(-1), leaf.shape))
+            for leaf, g in zip(leaves, grads)
+        ]
+        return (0.0, 0.0, *leaf_grads)
+
+
+def _accumulate(grad, block, full, shape, lo, hi):
+    "Add the gradient `block` of rows `lo:hi` into `grad`, summing broadcast dimensions."
+    axes = tuple(d for d in range(len(shape)) if full[d] == 1 and shape[d] != 1)
+    if axes:
+        block = block.sum(axis=axes, keepdims=True)
+    if full[0] == 1:
+        grad += block
+    else:
+        grad[lo:hi] += block
+
+
+# The elementwise functions, which refer back to this module.
+from .tensor_functions import Add, EQ, Exp, Inv, LT, Log, Mul, Neg, ReLU, Sigmoid  # noqa: E402
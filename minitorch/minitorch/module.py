@@ -1,7 +1,38 @@
+import itertools
+import numpy as np
 
 ## Task 0.4
 ## Modules
 
+# The :class:`Profiler` currently recording, if any.
+_active_profiler = None
+
+# Bumped whenever a parameter or submodule is added to any module. A module's
+# flat parameter registry is valid while its recorded version matches.
+_structure_version = 0
+
+
+def _structure_changed():
+    global _structure_version
+    _structure_version += 1
+
+
+def _state_array(name, value):
+    "Array holding a parameter value: tensors as is, scalars and numbers 0-d."
+    from .scalar import Scalar
+    from .tensor import Tensor
+
+    if isinstance(value, Tensor):
+        return value.to_numpy().copy()
+    if isinstance(value, Scalar):
+        return np.array(value.data, dtype=np.float64)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return np.array(value, dtype=np.float64)
+    raise TypeError(
+        f"Parameter {name} holds a {type(value).__name__}, which cannot be saved; "
+        "only tensors, scalars and numbers can."
+    )
+
 
 class Module:
     """
@@ -14,11 +45,15 @@ class Module:
     def __init__(self):
         self._modules = {}
         self._parameters = {}
+        self._registry = None
+        self._registry_version = -1
+        self._forward_pre_hooks = {}
+        self._forward_hooks = {}
         self.mode = "train"
 
     def modules(self):
         "Return the child modules of this module."
-        return self.__dict__["_modules"].values()
+        return self._modules.values()
 
     def train(self):
         self.mode = "train"
@@ -39,18 +74,143 @@ class Module:
             parameters.update(module.child_parameters())
         return parameters
 
+    def _parameter_registry(self):
+        """
+        Flat `(names, parameters)` of the whole tree under this module, rebuilt
+        only after the structure of some module changed.
+        """
+        if self._registry_version != _structure_version:
+            names = []
+            parameters = []
+            stack = [("", self)]
+            while stack:
+                prefix, module = stack.pop()
+                for name, val in module._parameters.items():
+                    names.append(prefix + name)
+                    parameters.append(val)
+                children = list(module._modules.items())
+                for name, child in reversed(children):
+                    stack.append((f"{prefix}{name}.", child))
+            self._registry = (tuple(names), tuple(parameters))
+            self._registry_version = _structure_version
+        return self._registry
+
     def named_parameters(self):
         """
         Collect all the ancestor parameters of this module.
         Returns:
             dict: Each name (key) and :class:`Parameter` (value) under this module.
         """
-        parameters = {**self._parameters}
-        parameters.update(self.child_parameters())
-        return parameters
+        names, parameters = self._parameter_registry()
+        return dict(zip(names, parameters))
 
     def parameters(self):
-        return self.named_parameters().values()
+        "All the parameters under this module, as a cached tuple."
+        return self._parameter_registry()[1]
+
+    def flatten_parameters(self):
+        """
+        Pack the tensor parameters under this module into one contiguous buffer
+        (see :class:`FlatParameters`).
+        Returns:
+            FlatParameters: the buffer holding the parameter values and gradients.
+        """
+        from .flat_parameters import FlatParameters
+
+        return FlatParameters(self)
+
+    def requires_grad_(self, val=True):
+        """
+        Set whether the parameters under this module record gradients.
+        Frozen parameters (`val` False) hold plain history free values, so
+        computations using them record no graph at all; combined with
+        :class:`no_grad` this is the inference fast path.
+        Args:
+            val (bool): True to train the parameters, False to freeze them
+        Returns:
+            Module: this module
+        """
+        for p in self.parameters():
+            p.requires_grad_(val)
+        return self
+
+    def state_dict(self):
+        """
+        Copy of the values of all the parameters under this module. Scalar
+        and number parameters are saved as 0-d arrays.
+        Returns:
+            dict: Each name (key) and array of values (value), as in :meth:`named_parameters`.
+        Raises:
+            TypeError: if a parameter holds something other than a tensor, a scalar or a number
+        """
+        return {name: _state_array(name, p.value) for name, p in self.named_parameters().items()}
+
+    def load_state_dict(self, state, copy=True):
+        """
+        Set the parameter values from `state`, which must have an array with
+        the right shape for every parameter.
+        Args:
+            state (dict of name x array): values, as returned by :meth:`state_dict`
+            copy (bool): copy the values. Otherwise each parameter keeps its
+                array as storage, without copying, when it is contiguous float64.
+        """
+        from .scalar import Scalar
+        from .tensor import Tensor
+        from .tensor_data import TensorData
+
+        named = self.named_parameters()
+        missing = named.keys() - state.keys()
+        unexpected = state.keys() - named.keys()
+        if missing or unexpected:
+            raise KeyError(
+                f"State does not match the module: missing {sorted(missing)}, "
+                f"unexpected {sorted(unexpected)}."
+            )
+        for name, p in named.items():
+            value = p.value
+            array = state[name]
+            shape = value.shape if isinstance(value, Tensor) else _state_array(name, value).shape
+            assert tuple(array.shape) == shape, (
+                f"Shape mismatch for {name}: {tuple(array.shape)} vs {shape}."
+            )
+            if isinstance(value, Scalar):
+                p.update(Scalar(float(array)))
+                continue
+            if not isinstance(value, Tensor):
+                # Numbers keep their type.
+                p.update(type(value)(array.item()))
+                continue
+            if p.buffer is not None:
+                # Keep the value a view into the flat buffer.
+                value.to_numpy()[...] = array
+                continue
+            if copy or array.dtype != np.float64 or not array.flags.c_contiguous:
+                array = np.array(array, dtype=np.float64)
+            p.update(Tensor(TensorData(array.reshape(-1), value.shape), backend=value.backend))
+
+    def save(self, path):
+        """
+        Write the parameter values to a checkpoint file (see :mod:`minitorch.checkpoint`).
+        Args:
+            path (string): file to write
+        """
+        from .checkpoint import save_state
+
+        save_state(self.state_dict(), path)
+
+    def load(self, path, mmap=True, mode="r"):
+        """
+        Load the parameter values from a checkpoint file written by :meth:`save`.
+        With `mmap`, the parameters become views of the mapped file: loading is
+        near instant and processes loading the same file share its memory.
+        Args:
+            path (string): checkpoint file
+            mmap (bool): map the file instead of reading it
+            mode (string): "r" for read-only parameters, "c" for copy-on-write
+        """
+        from .checkpoint import load_state
+
+        self.load_state_dict(load_state(path, mmap=mmap, mode=mode), copy=False)
 
     def add_parameter(self, k, v):
         """
@@ -62,29 +222,96 @@ class Module:
             Parameter: Newly created parameter.
         """
         val = Parameter(v)
-        self.__dict__["_parameters"][k] = val
+        self.__setattr__(k, val)
         return val
 
+    # Parameters and submodules are also set as ordinary attributes, so reading
+    # `self.layer` is a plain attribute lookup. There is deliberately no
+    # `__getattr__`, and `__dict__` is never touched: either one keeps the
+    # interpreter from specializing attribute access on modules.
+
     def __setattr__(self, key, val):
-        if isinstance(val, Parameter):
-            self.__dict__["_parameters"][key] = val
-        elif isinstance(val, Module):
-            self.__dict__["_modules"][key] = val
-        else:
-            super().__setattr__(key, val)
+        if isinstance(val, _REGISTERED_TYPES):
+            if isinstance(val, Parameter):
+                self._parameters[key] = val
+                self._modules.pop(key, None)
+            else:
+                self._modules[key] = val
+                self._parameters.pop(key, None)
+            _structure_changed()
+        elif _is_registered(self, key):
+            # A parameter or submodule replaced by a plain value.
+            self._parameters.pop(key, None)
+            self._modules.pop(key, None)
+            _structure_changed()
+        super().__setattr__(key, val)
+
+    def __delattr__(self, key):
+        if _is_registered(self, key):
+            self._parameters.pop(key, None)
+            self._modules.pop(key, None)
+            _structure_changed()
+        super().__delattr__(key)
 
-    def __getattr__(self, key):
-        if key in self.__dict__["_parameters"]:
-            return self.__dict__["_parameters"][key]
+    def register_forward_pre_hook(self, hook):
+        """
+        Run `hook(module, args)` before every forward call. If it returns
+        something other than None, that tuple replaces the positional args.
+        Args:
+            hook (function): the hook
+        Returns:
+            HookHandle: call `remove()` on it to unregister the hook.
+        """
+        return HookHandle(self._forward_pre_hooks, hook)
 
-        if key in self.__dict__["_modules"]:
-            return self.__dict__["_modules"][key]
+    def register_forward_hook(self, hook):
+        """
+        Run `hook(module, args, output)` after every forward call. If it
+        returns something other than None, that replaces the output.
+        Args:
+            hook (function): the hook
+        Returns:
+            HookHandle: call `remove()` on it to unregister the hook.
+        """
+        return HookHandle(self._forward_hooks, hook)
 
-        return self.__getattribute__(key)
+    def profile(self):
+        """
+        Profiler for the module tree under this module (see :class:`Profiler`). ::
+
+            with model.profile() as prof:
+                model.forward(x)
+            print(prof.table())
+        """
+        from .profiler import Profiler
+
+        return Profiler(self)
 
     def __call__(self, *args, **kwargs):
+        if self._forward_pre_hooks or self._forward_hooks or _active_profiler is not None:
+            return self._call_with_hooks(args, kwargs)
         return self.forward(*args, **kwargs)
 
+    def _call_with_hooks(self, args, kwargs):
+        profiler = _active_profiler
+        if profiler is not None:
+            profiler.enter(self)
+        out = None
+        try:
+            for hook in list(self._forward_pre_hooks.values()):
+                result = hook(self, args)
+                if result is not None:
+                    args = result if isinstance(result, tuple) else (result,)
+            out = self.forward(*args, **kwargs)
+            for hook in list(self._forward_hooks.values()):
+                result = hook(self, args, out)
+                if result is not None:
+                    out = result
+        finally:
+            if profiler is not None:
+                profiler.exit(self, out)
+        return out
+
     def forward(self):
         assert False, "Not Implemented"
 
@@ -116,23 +343,68 @@ class Module:
         return main_str
 
 
+def _is_registered(module, key):
+    "True if `key` names a parameter or submodule of `module`."
+    try:
+        return key in module._parameters or key in module._modules
+    except AttributeError:
+        # Attributes set before `Module.__init__` ran.
+        return False
+
+
+class HookHandle:
+    "Registration of a hook, returned by `Module.register_*_hook`."
+
+    _ids = itertools.count()
+
+    def __init__(self, hooks, hook):
+        self.hooks = hooks
+        self.id = next(HookHandle._ids)
+        hooks[self.id] = hook
+
+    def remove(self):
+        "Unregister the hook."
+        self.hooks.pop(self.id, None)
+
+
 class Parameter:
     """
     A Parameter is a special container stored in a :class:`Module`.
     It is designed to hold a :class:`Variable`, but we all it to hold
     any value for testing.
+
+    Attributes:
+        value : the held value
+        buffer (:class:`FlatParameters`): flat buffer `value` is a view into, if any
+        requires_grad (bool): False if the parameter is frozen
     """
 
     def __init__(self, x=None):
         self.value = x
+        self.buffer = None
+        self.requires_grad = True
         if hasattr(x, "requires_grad_"):
             self.value.requires_grad_(True)
 
     def update(self, x):
         "Update the parameter value."
+        if self.buffer is not None:
+            # Keep the value a view into the flat buffer.
+            self.value.copy_(x)
+            return
         self.value = x
         if hasattr(x, "requires_grad_"):
-            self.value.requires_grad_(True)
+            self.value.requires_grad_(self.requires_grad)
+
+    def requires_grad_(self, val=True):
+        "Freeze (`val` False) or unfreeze the parameter."
+        self.requires_grad = val
+        if hasattr(self.value, "requires_grad_"):
+            self.value.requires_grad_(val)
 
     def __repr__(self):
         return repr(self.value)
+
+
+# Values `Module.__setattr__` registers, built once rather than on every set.
+_REGISTERED_TYPES = (Parameter, Module)
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 ## Task 0.1
 ## Mathematical operators
@@ -25,8 +26,8 @@ def neg(x):
 
 
 def lt(x, y):
-    ":math:`f(x) =` 1.0 if x is greater than y else 0.0"
-    return float(x > y)
+    ":math:`f(x) =` 1.0 if x is less than y else 0.0"
+    return float(x < y)
 
 
 def eq(x, y):
@@ -48,9 +49,16 @@ def sigmoid(x):
     for stability.
     """
     if x >= 0:
-        return 1 / (1 + math.exp(x))
+        return 1.0 / (1.0 + math.exp(-x))
     else:
-        return math.exp(x) / (1 + math.exp(x))
+        z = math.exp(x)
+        return z / (1.0 + z)
+
+
+def sigmoid_back(x, d):
+    r"If :math:`f = sigmoid` compute :math:`d \times f'(x)`"
+    s = sigmoid(x)
+    return d * s * (1.0 - s)
 
 
 def relu(x):
@@ -80,15 +88,22 @@ def exp(x):
 
 
 def log_back(a, b):
+    r"If :math:`f = log` compute :math:`b \times f'(a)`"
     return b / (a + EPS)
 
 
+def exp_back(a, b):
+    r"If :math:`f = exp` compute :math:`b \times f'(a)`"
+    return math.exp(a) * b
+
+
 def inv(x):
     ":math:`f(x) = 1/x`"
     return 1.0 / x
 
 
 def inv_back(a, b):
+    r"If :math:`f = 1/x` compute :math:`b \times f'(a)`"
     return -(1.0 / a ** 2) * b
 
 
@@ -104,9 +119,14 @@ def map(fn):
     Args:
         fn (one-arg function): process one value
     Returns:
-        function : a function that takes a list and applies `fn` to each element
+        function : a function that takes a list and applies `fn` to each element.
+        Numpy arrays are processed by :mod:`minitorch.fast_ops` and give back an array.
     """
     def mapped_fn(input_list):
+        if isinstance(input_list, np.ndarray):
+            from .fast_ops import map_array
+
+            return map_array(fn, input_list)
         return [fn(x) for x in input_list]
     return mapped_fn
 
@@ -125,9 +145,14 @@ def zipWith(fn):
         fn (two-arg function): combine two values
     Returns:
         function : takes two equally sized lists `ls1` and `ls2`, produce a new list by
-        applying fn(x, y) one each pair of elements.
+        applying fn(x, y) one each pair of elements. Numpy arrays are processed by
+        :mod:`minitorch.fast_ops` and give back an array.
     """
     def zipped_fn(list_a, list_b):
+        if isinstance(list_a, np.ndarray) or isinstance(list_b, np.ndarray):
+            from .fast_ops import zip_array
+
+            return zip_array(fn, list_a, list_b)
         return [fn(a, b) for a, b in zip(list_a, list_b)]
     return zipped_fn
 
@@ -147,9 +172,13 @@ def reduce(fn, start):
     Returns:
         function : function that takes a list `ls` of elements
         :math:`x_1 \ldots x_n` and computes the reduction :math:`fn(x_3, fn(x_2,
-        fn(x_1, x_0)))`
+        fn(x_1, x_0)))`. Numpy arrays are reduced by :mod:`minitorch.fast_ops`.
     """
     def reduce(input_list):
+        if isinstance(input_list, np.ndarray):
+            from .fast_ops import reduce_array
+
+            return reduce_array(fn, start, input_list)
         cur_val = start
         for i in input_list:
             cur_val = fn(i, cur_val)
@@ -0,0 +1,113 @@
+"""
+Optimizers updating the flat parameter buffer of a module in place.
+"""
+
+import math
+import numpy as np
+from .flat_parameters import FlatParameters
+
+__all__ = ["SGD", "Adam"]
+
+
+class Optimizer:
+    """
+    Base class of the optimizers. Every update is a few whole-buffer array
+    operations on :attr:`FlatParameters.data`, written in place with one
+    scratch buffer, so a step allocates nothing.
+
+    Attributes:
+        parameters (:class:`FlatParameters`): the buffer being optimized
+        lr (float): learning rate
+    """
+
+    def __init__(self, parameters, lr):
+        if not isinstance(parameters, FlatParameters):
+            # A module: pack its parameters first.
+            parameters = parameters.flatten_parameters()
+        self.parameters = parameters
+        self.lr = lr
+        self._scratch = np.empty_like(parameters.data)
+
+    def zero_grad(self):
+        "Reset every gradient."
+        self.parameters.zero_grad()
+
+    def step(self):
+        "Update the parameters from their gradients."
+        self.parameters._sync_grads()
+        self._update(self.parameters.data, self.parameters.grad)
+
+    def _update(self, data, grad):
+        raise NotImplementedError
+
+
+class SGD(Optimizer):
+    """
+    Stochastic gradient descent with momentum::
+
+        velocity = momentum * velocity + grad
+        data -= lr * velocity
+
+    Args:
+        parameters (:class:`Module` or :class:`FlatParameters`): what to optimize
+        lr (float): learning rate
+        momentum (float): momentum factor, 0 for plain SGD
+    """
+
+    def __init__(self, parameters, lr, momentum=0.0):
+        super().__init__(parameters, lr)
+        self.momentum = momentum
+        self.velocity = np.zeros_like(self.parameters.data) if momentum else None
+
+    def _update(self, data, grad):
+        if self.velocity is not None:
+            self.velocity *= self.momentum
+            self.velocity += grad
+            grad = self.velocity
+        np.multiply(grad, self.lr, out=self._scratch)
+        data -= self._scratch
+
+
+class Adam(Optimizer):
+    """
+    Adam (Kingma and Ba, 2015), with bias corrected moment estimates.
+
+    Args:
+        parameters (:class:`Module` or :class:`FlatParameters`): what to optimize
+        lr (float): learning rate
+        betas (tuple): decay rates of the first and second moment estimates
+        eps (float): term added to the denominator
+    """
+
+    def __init__(self, parameters, lr=1e-3, betas=(0.9, 0.999), eps=1e-8):
+        super().__init__(parameters, lr)
+        self.betas = betas
+        self.eps = eps
+        self.steps = 0
+        self.m = np.zeros_like(self.parameters.data)
+        self.v = np.zeros_like(self.parameters.data)
+
+    def _update(self, data, grad):
+        beta1, beta2 = self.betas
+        self.steps += 1
+        correction1 = 1.0 - beta1 ** self.steps
+        correction2 = 1.0 - beta2 ** self.steps
+        scratch = self._scratch
+
+        # m = beta1 * m + (1 - beta1) * grad
+        self.m *= beta1
+        np.multiply(grad, 1.0 - beta1, out=scratch)
+        self.m += scratch
+        # v = beta2 * v + (1 - beta2) * grad ** 2
+        self.v *= beta2
+        np.multiply(grad, grad, out=scratch)
+        scratch *= 1.0 - beta2
+        self.v += scratch
+
+        # data -= lr / correction1 * m / (sqrt(v / correction2) + eps)
+        np.sqrt(self.v, out=scratch)
+        scratch /= math.sqrt(correction2)
+        scratch += self.eps
+        np.divide(self.m, scratch, out=scratch)
+        scratch *= self.lr / correction1
+        data -= scratch
@@ -0,0 +1,148 @@
+"""
+Per-module timing of forward calls.
+"""
+
+import json
+import time
+from . import module as _module
+
+
+class ProfileNode:
+    """
+    Profile of one module, with one child per entry of its `_modules`.
+
+    Attributes:
+        name (string): dotted path of the module from the profiled root
+        module (:class:`Module`): the profiled module
+        children (list of :class:`ProfileNode`): profiles of the submodules
+        calls (int): number of forward calls
+        total_time (float): wall time of those calls in seconds, submodules included
+        output_size (int): total number of elements returned by those calls
+    """
+
+    def __init__(self, name, module):
+        self.name = name
+        self.module = module
+        self.children = []
+        self.calls = 0
+        self.total_time = 0.0
+        self.output_size = 0
+
+    @property
+    def self_time(self):
+        "Wall time not spent in profiled submodules."
+        return max(0.0, self.total_time - sum(c.total_time for c in self.children))
+
+    def walk(self, depth=0):
+        "Yield `(depth, node)` for this node and its descendants, depth first."
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+def _output_size(out):
+    size = getattr(out, "size", None)
+    if isinstance(size, int):
+        return size
+    return 0 if out is None else 1
+
+
+class Profiler:
+    """
+    Records wall time, call counts and output sizes of every module call under
+    `root` while active. Use it as a context manager, usually through
+    :meth:`Module.profile`. Only calls through `module(...)` are seen, not
+    direct calls to `forward`.
+
+    Attributes:
+        root (:class:`ProfileNode`): profile tree mirroring the module tree
+        events (list): one Chrome-trace event per call
+    """
+
+    def __init__(self, root):
+        self.root = ProfileNode(type(root).__name__, root)
+        self._nodes = {id(root): self.root}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for name, child in node.module._modules.items():
+                if id(child) in self._nodes:
+                    # A shared module is profiled under its first name.
+                    continue
+                path = name if node is self.root else f"{node.name}.{name}"
+                child_node = ProfileNode(path, child)
+                node.children.append(child_node)
+                self._nodes[id(child)] = child_node
+                stack.append(child_node)
+        self.events = []
+        self._stack = []
+        self._start = time.perf_counter()
+
+    def __enter__(self):
+        assert _module._active_profiler is None, "Another profiler is already running."
+        _module._active_profiler = self
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _module._active_profiler = None
+        return False
+
+    def enter(self, module):
+        "Called by :class:`Module` when a forward call starts."
+        self._stack.append(time.perf_counter())
+
+    def exit(self, module, out):
+        "Called by :class:`Module` when a forward call ends with output `out`."
+        end = time.perf_counter()
+        start = self._stack.pop()
+        node = self._nodes.get(id(module))
+        if node is None:
+            return
+        size = _output_size(out)
+        node.calls += 1
+        node.total_time += end - start
+        node.output_size += size
+        self.events.append(
+            {
+                "name": node.name,
+                "cat": type(module).__name__,
+                "ph": "X",
+                "ts": (start - self._start) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 0,
+                "tid": 0,
+                "args": {"output_size": size},
+            }
+        )
+
+    def table(self):
+        """
+        Returns:
+            string : one row per module, indented like the module tree
+        """
+        rows = [f"{'module':<40} {'calls':>8} {'total ms':>10} {'self ms':>10} {'output':>10}"]
+        for depth, node in self.root.walk():
+            label = "  " * depth + node.name
+            if node is not self.root:
+                label += f" ({type(node.module).__name__})"
+            rows.append(
+                f"{label:<40} {node.calls:>8} {node.total_time * 1e3:>10.3f} "
+                f"{node.self_time * 1e3:>10.3f} {node.output_size:>10}"
+            )
+        return "\n".join(rows)
+
+    def chrome_trace(self, path=None):
+        """
+        Export the calls in the Chrome trace event format (open in
+        `chrome://tracing` or Perfetto).
+        Args:
+            path (string, opt): file to write the JSON to
+        Returns:
+            dict : the trace
+        """
+        trace = {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
@@ -0,0 +1,228 @@
+"""
+Implementation of the core Tensor object for autodifferentiation.
+"""
+
+from .autodiff import Variable, backpropagate
+from .tensor_data import TensorData
+from .tensor_ops import SimpleBackend
+
+
+## Task 2.3
+## Tensor
+
+
+class Tensor(Variable):
+    """
+    Tensor is a generalization of Scalar in that it is a Variable that
+    handles multidimensional arrays.
+
+    Attributes:
+
+        _tensor (:class:`TensorData`) : the tensor data storage
+        backend : backend object used to implement tensor math (see `tensor_ops.py`)
+    """
+
+    __slots__ = ("_tensor", "backend")
+
+    def __init__(self, v, back=None, name=None, backend=None):
+        assert isinstance(v, TensorData)
+        if backend is None:
+            backend = SimpleBackend
+        super().__init__(back, name=name)
+        self._tensor = v
+        self.backend = backend
+
+    def to_numpy(self):
+        """
+        Returns:
+             narray : converted to numpy array (a view of the storage)
+        """
+        return self._tensor.to_numpy()
+
+    # Properties
+    @property
+    def shape(self):
+        """
+        Returns:
+             tuple : shape of the tensor
+        """
+        return self._tensor.shape
+
+    @property
+    def size(self):
+        """
+        Returns:
+             int : size of the tensor
+        """
+        return self._tensor.size
+
+    @property
+    def dims(self):
+        """
+        Returns:
+             int : dimensionality of the tensor
+        """
+        return self._tensor.dims
+
+    @property
+    def grad(self):
+        "The derivative accumulated on this tensor by `backward`."
+        return self.derivative
+
+    def _ensure_tensor(self, b):
+        "Turns a python number into a tensor with the same backend."
+        if isinstance(b, (int, float)):
+            b = tf.tensor([b], backend=self.backend)
+        return b
+
+    def _new(self, tensor_data):
+        "A constant tensor on the same backend."
+        return Tensor(tensor_data, backend=self.backend)
+
+    # Functions
+    def __add__(self, b):
+        return tf.Add.apply(self, self._ensure_tensor(b))
+
+    def __sub__(self, b):
+        return tf.Add.apply(self, -self._ensure_tensor(b))
+
+    def __mul__(self, b):
+        return tf.Mul.apply(self, self._ensure_tensor(b))
+
+    def __truediv__(self, b):
+        return tf.Mul.apply(self, tf.Inv.apply(self._ensure_tensor(b)))
+
+    def __rtruediv__(self, b):
+        return tf.Mul.apply(self._ensure_tensor(b), tf.Inv.apply(self))
+
+    def __matmul__(self, b):
+        "Not used until Module 3"
+        return tf.MatMul.apply(self, b)
+
+    def __lt__(self, b):
+        return tf.LT.apply(self, self._ensure_tensor(b))
+
+    def __eq__(self, b):
+        return tf.EQ.apply(self, self._ensure_tensor(b))
+
+    def __gt__(self, b):
+        return tf.LT.apply(self._ensure_tensor(b), self)
+
+    def __neg__(self):
+        return tf.Neg.apply(self)
+
+    def __radd__(self, b):
+        return self + b
+
+    def __rmul__(self, b):
+        return self * b
+
+    def __rsub__(self, b):
+        return tf.Add.apply(self._ensure_tensor(b), -self)
+
+    def all(self, dim=None):
+        "1.0 if all elements are non-zero (along `dim`) else 0.0"
+        return self.backend_reduce(self.backend.mul_reduce, dim)
+
+    def sigmoid(self):
+        return tf.Sigmoid.apply(self)
+
+    def relu(self):
+        return tf.ReLU.apply(self)
+
+    def log(self):
+        return tf.Log.apply(self)
+
+    def exp(self):
+        return tf.Exp.apply(self)
+
+    def item(self):
+        "The value of a single element tensor as a float."
+        assert self.size == 1, f"item() needs a single element, got shape {self.shape}."
+        return float(self._tensor._storage[0])
+
+    def sum(self, dim=None):
+        "Compute the sum over dimension `dim`"
+        if dim is None:
+            return tf.Sum.apply(self.contiguous().view(self.size), 0)
+        return tf.Sum.apply(self, dim)
+
+    def mean(self, dim=None):
+        "Compute the mean over dimension `dim`"
+        if dim is None:
+            return self.sum() / self.size
+        return self.sum(dim) / self.shape[dim]
+
+    def permute(self, *order):
+        "Permute tensor dimensions to *order"
+        return tf.Permute.apply(self, order)
+
+    def view(self, *shape):
+        "Change the shape of the tensor to a new shape with the same size"
+        return tf.View.apply(self, shape)
+
+    def contiguous(self):
+        "Return a contiguous tensor with the same data"
+        if self._tensor.is_compact():
+            return self
+        return tf.Copy.apply(self)
+
+    def backend_reduce(self, reduce, dim=None):
+        "Apply a raw backend reduction without tracking history."
+        if dim is None:
+            td = self._tensor.contiguous().view(self.size)
+            return self._new(reduce(td, 0))
+        return self._new(reduce(self._tensor, dim))
+
+    def __repr__(self):
+        return self._tensor.to_string()
+
+    def __getitem__(self, key):
+        return self._tensor.get(key)
+
+    def __setitem__(self, key, val):
+        self._tensor.set(key, val)
+
+    def copy_(self, b):
+        "Overwrite the values of this tensor with `b` (broadcast), in place."
+        self.backend.id_map(self._ensure_tensor(b)._tensor, self._tensor)
+        return self
+
+    # Internal methods used for autodiff.
+    def tuple(self):
+        return self._tensor.tuple()
+
+    def get_data(self):
+        "A history free tensor sharing this tensor's storage."
+        return Tensor(self._tensor, backend=self.backend)
+
+    def detach(self):
+        "Same as `get_data`."
+        return self.get_data()
+
+    def zeros(self, shape=None):
+        if shape is None:
+            shape = self.shape
+        return tf.zeros(shape, backend=self.backend)
+
+    def backward(self, grad_output=None):
+        if grad_output is None:
+            assert self.shape == (1,), "Must provide grad_output if non-scalar"
+            grad_output = tf.tensor([1.0], backend=self.backend)
+        backpropagate(self, grad_output)
+
+    def accumulate_derivative(self, val):
+        assert self.is_leaf(), "Only leaf variables can have derivatives."
+        if self.derivative is None:
+            # Copy, so the gradient never aliases a buffer of the graph.
+            self.derivative = self._new(self.backend.id_map(val._tensor))
+        else:
+            grad = self.derivative._tensor
+            self.backend.add_zip(grad, val._tensor, out=grad)
+
+    def zero_grad_(self):
+        self.derivative = None
+
+
+# Functions refer back to Tensor, so they are imported last.
+from . import tensor_functions as tf  # noqa: E402
@@ -0,0 +1,342 @@
+import math
+import random
+from .operators import prod
+from .fast_ops import as_array
+import numpy as np
+
+## Task 2.1
+## Tensor storage
+
+
+MAX_DIMS = 32
+
+
+class IndexingError(RuntimeError):
+    "Exception raised for indexing errors."
+    pass
+
+
+def index_to_position(index, strides):
+    """
+    Converts a multidimensional tensor `index` into a single-dimensional position in
+    storage based on strides.
+    Args:
+        index (array-like): index tuple of ints
+        strides (array-like): tensor strides
+    Returns:
+        int : position in storage
+    """
+    position = 0
+    for ind, stride in zip(index, strides):
+        position += ind * stride
+    return position
+
+
+def to_index(ordinal, shape, out_index):
+    """
+    Convert an `ordinal` to an index in the `shape`.
+    Should ensure that enumerating position 0 ... size of a
+    tensor produces every index exactly once. It
+    may not be the inverse of `index_to_position`.
+    Args:
+        ordinal (int): ordinal position to convert.
+        shape (tuple): tensor shape.
+        out_index (array): the index corresponding to position.
+    Returns:
+      None : Fills in `out_index`.
+    """
+    cur_ord = ordinal
+    for i in range(len(shape) - 1, -1, -1):
+        sh = shape[i]
+        out_index[i] = int(cur_ord % sh)
+        cur_ord = cur_ord // sh
+
+
+def broadcast_index(big_index, big_shape, shape, out_index):
+    """
+    Convert an `big_index` into `big_shape` to a smaller `out_index` into `shape`
+    following broadcasting rules. In this case it may be larger or with more
+    dimensions than the `shape` given. Additional dimensions may need to be
+    mapped to 0 or removed.
+    Args:
+        big_index (array-like): multidimensional index of bigger tensor
+        big_shape (array-like): tensor shape of bigger tensor
+        shape (array-like): tensor shape of smaller tensor
+        out_index (array-like): multidimensional index of smaller tensor
+    Returns:
+        None : Fills in `out_index`.
+    """
+    offset = len(big_shape) - len(shape)
+    for i, s in enumerate(shape):
+        out_index[i] = big_index[i + offset] if s > 1 else 0
+
+
+def shape_broadcast(shape1, shape2):
+    """
+    Broadcast two shapes to create a new union shape.
+    Args:
+        shape1 (tuple): first shape
+        shape2 (tuple): second shape
+    Returns:
+        tuple : broadcasted shape
+    Raises:
+        IndexingError : if cannot broadcast
+    """
+    n = max(len(shape1), len(shape2))
+    a = (1,) * (n - len(shape1)) + tuple(shape1)
+    b = (1,) * (n - len(shape2)) + tuple(shape2)
+    out = []
+    for x, y in zip(a, b):
+        if x != y and x != 1 and y != 1:
+            raise IndexingError(f"Cannot broadcast {shape1} and {shape2}.")
+        out.append(y if x == 1 else x)
+    return tuple(out)
+
+
+def broadcast_strides(shape, strides, big_shape):
+    """
+    Strides that walk a tensor of `shape` as if it were broadcast to `big_shape`.
+    Broadcast dimensions get stride 0, so no data is expanded.
+    Args:
+        shape (tuple): shape of the smaller tensor
+        strides (tuple): strides of the smaller tensor
+        big_shape (tuple): shape to broadcast to
+    Returns:
+        tuple : strides aligned with `big_shape`
+    """
+    offset = len(big_shape) - len(shape)
+    if offset < 0:
+        raise IndexingError(f"Cannot broadcast {shape} to {big_shape}.")
+    out = [0] * len(big_shape)
+    for i, (s, st) in enumerate(zip(shape, strides)):
+        if s == big_shape[i + offset]:
+            out[i + offset] = st
+        elif s != 1:
+            raise IndexingError(f"Cannot broadcast {shape} to {big_shape}.")
+    return tuple(out)
+
+
+def strides_from_shape(shape):
+    "Contiguous (row-major) strides for `shape`."
+    strides = [1] * len(shape)
+    offset = 1
+    for i in range(len(shape) - 1, 0, -1):
+        offset *= shape[i]
+        strides[i - 1] = offset
+    return tuple(strides)
+
+
+class TensorData:
+    """
+    Storage and layout of a tensor.
+
+    The values live in a single flat, contiguous ``float64`` buffer. A
+    :class:`TensorData` only describes how to walk that buffer (`shape`
+    and `strides`), so :meth:`permute`, :meth:`view` and slicing return
+    new layouts over the *same* storage without copying.
+
+    Attributes:
+        _storage (array): flat float64 buffer (may be a view into a parent buffer)
+        shape (tuple): shape of the tensor
+        strides (tuple): strides of the tensor
+        size (int): number of elements
+        dims (int): number of dimensions
+    """
+
+    def __init__(self, storage, shape, strides=None):
+        if isinstance(storage, np.ndarray) and storage.dtype == np.float64:
+            if storage.ndim != 1:
+                storage = storage.reshape(-1)
+            self._storage = storage
+        else:
+            self._storage = np.array(storage, dtype=np.float64).reshape(-1)
+        shape = tuple([int(s) for s in shape])
+        if strides is None:
+            strides = strides_from_shape(shape)
+        else:
+            strides = tuple([int(s) for s in strides])
+        if len(strides) != len(shape):
+            raise IndexingError(f"Len of strides {strides} must match {shape}.")
+        self.strides = strides
+        self.dims = len(strides)
+        self.size = math.prod(shape)
+        self.shape = shape
+        if self.size > 0 and self._max_position() >= len(self._storage):
+            raise IndexingError(
+                f"Layout {shape} / {strides} does not fit in storage of size {len(self._storage)}."
+            )
+
+    def _max_position(self):
+        return sum((s - 1) * st for s, st in zip(self.shape, self.strides))
+
+    def is_contiguous(self):
+        """
+        Check that the layout is contiguous, i.e. outer dimensions have bigger strides than inner dimensions.
+        Returns:
+            bool : True if contiguous
+        """
+        last = 1e9
+        for stride in self.strides:
+            if stride > last:
+                return False
+            last = stride
+        return True
+
+    def is_compact(self):
+        "True if the layout is the row-major layout of its shape."
+        return self.strides == strides_from_shape(self.shape)
+
+    def index(self, index):
+        if isinstance(index, (int, np.integer)):
+            index = (index,)
+        if len(index) != len(self.shape):
+            raise IndexingError(f"Index {index} must be size of {self.shape}.")
+        for i, ind in enumerate(index):
+            if ind >= self.shape[i]:
+                raise IndexingError(f"Index {index} out of range {self.shape}.")
+            if ind < 0:
+                raise IndexingError(f"Negative indexing for {index} not supported.")
+
+        # Call fast indexing.
+        return index_to_position(index, self.strides)
+
+    def indices(self):
+        lshape = self.shape
+        out_index = [0] * len(lshape)
+        for i in range(self.size):
+            to_index(i, lshape, out_index)
+            yield tuple(out_index)
+
+    def sample(self):
+        return tuple((random.randint(0, s - 1) for s in self.shape))
+
+    def get(self, key):
+        return self._storage[self.index(key)]
+
+    def set(self, key, val):
+        self._storage[self.index(key)] = val
+
+    def tuple(self):
+        return (self._storage, self.shape, self.strides)
+
+    def to_numpy(self):
+        """
+        A numpy view of the tensor. No data is copied, so writes to the
+        returned array are visible in the storage.
+        Returns:
+            array : strided view with this layout
+        """
+        return as_array(self._storage, self.shape, self.strides)
+
+    def contiguous(self):
+        """
+        Return a compact copy of the tensor, or `self` if it is already compact.
+        Returns:
+            :class:`TensorData` : row-major layout over its own storage
+        """
+        if self.is_compact():
+            return self
+        return TensorData(np.ascontiguousarray(self.to_numpy()), self.shape)
+
+    def permute(self, *order):
+        """
+        Permute the dimensions of the tensor.
+        Args:
+            order (list): a permutation of the dimensions
+        Returns:
+            :class:`TensorData`: a new TensorData with the same storage and a new dimension order.
+        """
+        assert list(sorted(order)) == list(
+            range(len(self.shape))
+        ), f"Must give a position to each dimension. Shape: {self.shape} Order: {order}"
+
+        return TensorData(
+            self._storage,
+            tuple(self.shape[o] for o in order),
+            tuple(self.strides[o] for o in order),
+        )
+
+    def view(self, *shape):
+        """
+        Reshape the tensor without copying. Only compact layouts can be viewed.
+        Args:
+            shape (list): new shape, with at most one `-1` to infer a dimension
+        Returns:
+            :class:`TensorData`: a new TensorData with the same storage.
+        """
+        if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+            shape = tuple(shape[0])
+        shape = list(shape)
+        if shape.count(-1) > 1:
+            raise IndexingError("Only one dimension can be inferred.")
+        if -1 in shape:
+            known = int(prod([s for s in shape if s != -1]))
+            shape[shape.index(-1)] = self.size // known if known else 0
+        shape = tuple(shape)
+        if int(prod(shape)) != self.size:
+            raise IndexingError(f"Cannot view shape {self.shape} as {shape}.")
+        if not self.is_compact():
+            raise IndexingError(
+                f"Cannot view non-contiguous layout {self.strides}, call contiguous() first."
+            )
+        return TensorData(self._storage, shape)
+
+    def __getitem__(self, key):
+        """
+        Basic slicing (ints and slices with positive step). Ints drop a
+        dimension, slices keep it. The result shares storage with `self`.
+        Args:
+            key (int, slice or tuple): per-dimension index
+        Returns:
+            :class:`TensorData`: a view into the same storage
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.dims:
+            raise IndexingError(f"Too many indices {key} for shape {self.shape}.")
+        key = key + (slice(None),) * (self.dims - len(key))
+
+        offset = 0
+        shape = []
+        strides = []
+        for k, size, stride in zip(key, self.shape, self.strides):
+            if isinstance(k, slice):
+                start, stop, step = k.indices(size)
+                if step <= 0:
+                    raise IndexingError("Only positive slice steps are supported.")
+                length = max(0, (stop - start + step - 1) // step)
+                offset += start * stride
+                shape.append(length)
+                strides.append(stride * step)
+            else:
+                k = int(k)
+                if k < 0:
+                    k += size
+                if not 0 <= k < size:
+                    raise IndexingError(f"Index {k} out of range {size}.")
+                offset += k * stride
+        return TensorData(self._storage[offset:], tuple(shape), tuple(strides))
+
+    def to_string(self):
+        s = ""
+        for index in self.indices():
+            line = ""
+            for i in range(len(index) - 1, -1, -1):
+                if index[i] == 0:
+                    line = "\n%s[" % ("\t" * i) + line
+                else:
+                    break
+            s += line
+            v = self.get(index)
+            s += f"{v:3.2f}"
+            line = ""
+            for i in range(len(index) - 1, -1, -1):
+                if index[i] == self.shape[i] - 1:
+                    line += "]"
+                else:
+                    break
+            if line:
+                s += line
+            else:
+                s += " "
+        return s
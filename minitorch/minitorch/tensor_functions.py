@@ -0,0 +1,451 @@
+"""
+Implementation of the autodifferentiation Functions for Tensor.
+"""
+
+import random
+import numpy as np
+from . import array_operators
+from .autodiff import FunctionBase
+from .tensor_ops import SimpleBackend
+from .tensor_data import TensorData
+from .tensor import Tensor
+
+
+# The Function classes share names with the scalar ones, so only the
+# helpers are exported at the package level.
+__all__ = ["linear", "zeros", "rand", "tensor", "grad_central_difference", "grad_check"]
+
+
+## Task 2.3 and 2.4
+## Tensor Functions
+#
+# `forward` and `backward` get history free tensors and run the backend
+# kernels on their `_tensor` storage directly.
+
+
+def _reduce_to_shape(grad, shape):
+    """
+    Sum a gradient over the dimensions its input was broadcast along.
+    Args:
+        grad (:class:`Tensor`): gradient of the broadcast result
+        shape (tuple): shape of the input
+    Returns:
+        :class:`Tensor` : gradient with shape `shape`
+    """
+    if grad.shape == shape:
+        return grad
+    backend = grad.backend
+    td = grad._tensor
+    extra = td.dims - len(shape)
+    for dim in range(td.dims):
+        if dim < extra or (shape[dim - extra] == 1 and td.shape[dim] != 1):
+            td = backend.add_reduce(td, dim)
+    return grad._new(td.view(*shape))
+
+
+class Function(FunctionBase):
+    data_type = Tensor
+
+    @staticmethod
+    def variable(raw, history):
+        # `forward` returns a fresh tensor, so it can take the history directly.
+        raw.history = history
+        return raw
+
+    @classmethod
+    def apply(cls, *vals):
+        for v in vals:
+            if isinstance(v, lazy.LazyTensor):
+                vals = [v.materialize() if isinstance(v, lazy.LazyTensor) else v for v in vals]
+                break
+        return super().apply(*vals)
+
+
+class Elementwise(Function):
+    """
+    Function applied elementwise with broadcasting. Under
+    :func:`minitorch.lazy_mode` it is recorded into a fused expression
+    instead of being run (see :mod:`minitorch.lazy`).
+
+    Attributes:
+        array_fn : the matching function of :mod:`minitorch.array_operators`
+    """
+
+    array_fn = None
+
+    @classmethod
+    def apply(cls, *vals):
+        if lazy.enabled:
+            return lazy.node(cls, *vals)
+        return super().apply(*vals)
+
+
+class Neg(Elementwise):
+    array_fn = array_operators.neg
+
+    @staticmethod
+    def forward(ctx, t1):
+        return t1._new(t1.backend.neg_map(t1._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        return grad_output._new(grad_output.backend.neg_map(grad_output._tensor))
+
+
+class Inv(Elementwise):
+    array_fn = array_operators.inv
+
+    @staticmethod
+    def forward(ctx, t1):
+        ctx.save_for_backward(t1)
+        return t1._new(t1.backend.inv_map(t1._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        t1 = ctx.saved_values
+        return t1._new(t1.backend.inv_back_zip(t1._tensor, grad_output._tensor))
+
+
+class Add(Elementwise):
+    array_fn = array_operators.add
+
+    @staticmethod
+    def forward(ctx, t1, t2):
+        ctx.save_for_backward(t1.shape, t2.shape)
+        return t1._new(t1.backend.add_zip(t1._tensor, t2._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        shape1, shape2 = ctx.saved_values
+        return (
+            _reduce_to_shape(grad_output, shape1),
+            _reduce_to_shape(grad_output, shape2),
+        )
+
+
+class Mul(Elementwise):
+    array_fn = array_operators.mul
+
+    @staticmethod
+    def forward(ctx, a, b):
+        ctx.save_for_backward(a, b)
+        return a._new(a.backend.mul_zip(a._tensor, b._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        a, b = ctx.saved_values
+        mul_zip = a.backend.mul_zip
+        return (
+            _reduce_to_shape(a._new(mul_zip(grad_output._tensor, b._tensor)), a.shape),
+            _reduce_to_shape(b._new(mul_zip(grad_output._tensor, a._tensor)), b.shape),
+        )
+
+
+class Sigmoid(Elementwise):
+    array_fn = array_operators.sigmoid
+
+    @staticmethod
+    def forward(ctx, t1):
+        ctx.save_for_backward(t1)
+        return t1._new(t1.backend.sigmoid_map(t1._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        t1 = ctx.saved_values
+        return t1._new(t1.backend.sigmoid_back_zip(t1._tensor, grad_output._tensor))
+
+
+class ReLU(Elementwise):
+    array_fn = array_operators.relu
+
+    @staticmethod
+    def forward(ctx, t1):
+        ctx.save_for_backward(t1)
+        return t1._new(t1.backend.relu_map(t1._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        t1 = ctx.saved_values
+        return t1._new(t1.backend.relu_back_zip(t1._tensor, grad_output._tensor))
+
+
+class Log(Elementwise):
+    array_fn = array_operators.log
+
+    @staticmethod
+    def forward(ctx, t1):
+        ctx.save_for_backward(t1)
+        return t1._new(t1.backend.log_map(t1._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        t1 = ctx.saved_values
+        return t1._new(t1.backend.log_back_zip(t1._tensor, grad_output._tensor))
+
+
+class Exp(Elementwise):
+    array_fn = array_operators.exp
+
+    @staticmethod
+    def forward(ctx, t1):
+        out = t1._new(t1.backend.exp_map(t1._tensor))
+        ctx.save_for_backward(out)
+        return out
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        out = ctx.saved_values
+        return out._new(out.backend.mul_zip(out._tensor, grad_output._tensor))
+
+
+class Sum(Function):
+    @staticmethod
+    def forward(ctx, a, dim):
+        ctx.save_for_backward(a.shape)
+        return a._new(a.backend.add_reduce(a._tensor, dim))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        shape = ctx.saved_values
+        # The gradient is the same for every summed element: broadcast it back.
+        out = zeros(shape, backend=grad_output.backend)
+        grad_output.backend.id_map(grad_output._tensor, out._tensor)
+        return out, 0.0
+
+
+class LT(Elementwise):
+    array_fn = array_operators.lt
+
+    @staticmethod
+    def forward(ctx, a, b):
+        ctx.save_for_backward(a.shape, b.shape)
+        return a._new(a.backend.lt_zip(a._tensor, b._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        shape1, shape2 = ctx.saved_values
+        return zeros(shape1, grad_output.backend), zeros(shape2, grad_output.backend)
+
+
+class EQ(Elementwise):
+    array_fn = array_operators.eq
+
+    @staticmethod
+    def forward(ctx, a, b):
+        ctx.save_for_backward(a.shape, b.shape)
+        return a._new(a.backend.eq_zip(a._tensor, b._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        shape1, shape2 = ctx.saved_values
+        return zeros(shape1, grad_output.backend), zeros(shape2, grad_output.backend)
+
+
+class Permute(Function):
+    @staticmethod
+    def forward(ctx, a, order):
+        ctx.save_for_backward(order)
+        return a._new(a._tensor.permute(*order))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        order = ctx.saved_values
+        inverse = [0] * len(order)
+        for i, o in enumerate(order):
+            inverse[o] = i
+        return grad_output._new(grad_output._tensor.permute(*inverse)), 0.0
+
+
+class View(Function):
+    @staticmethod
+    def forward(ctx, a, shape):
+        ctx.save_for_backward(a.shape)
+        return a._new(a._tensor.contiguous().view(*shape))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        original = ctx.saved_values
+        return grad_output._new(grad_output._tensor.contiguous().view(*original)), 0.0
+
+
+class Copy(Function):
+    @staticmethod
+    def forward(ctx, a):
+        return a._new(a.backend.id_map(a._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        return grad_output
+
+
+class MatMul(Function):
+    @staticmethod
+    def forward(ctx, t1, t2):
+        ctx.save_for_backward(t1, t2)
+        return t1._new(t1.backend.matrix_multiply(t1._tensor, t2._tensor))
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        t1, t2 = ctx.saved_values
+        matrix_multiply = t1.backend.matrix_multiply
+
+        def transpose(td):
+            order = list(range(td.dims))
+            order[-2], order[-1] = order[-1], order[-2]
+            return td.permute(*order)
+
+        return (
+            _reduce_to_shape(
+                t1._new(matrix_multiply(grad_output._tensor, transpose(t2._tensor))),
+                t1.shape,
+            ),
+            _reduce_to_shape(
+                t2._new(matrix_multiply(transpose(t1._tensor), grad_output._tensor)),
+                t2.shape,
+            ),
+        )
+
+
+class Linear(Function):
+    """
+    Fused `relu(x @ weight + bias)` (relu optional). Forward writes a single
+    output buffer and backward produces the three gradients in one pass
+    without building the matmul and bias-add intermediates.
+    """
+
+    @staticmethod
+    def forward(ctx, x, weight, bias, relu):
+        out = x._new(x.backend.linear(x._tensor, weight._tensor, bias._tensor, relu))
+        ctx.save_for_backward(x, weight, out, relu)
+        return out
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        x, weight, out, relu = ctx.saved_values
+        grad_x, grad_w, grad_b = x.backend.linear_back(
+            x._tensor, weight._tensor, out._tensor, grad_output._tensor, relu
+        )
+        return x._new(grad_x), x._new(grad_w), x._new(grad_b), 0.0
+
+
+def linear(x, weight, bias, relu=False):
+    """
+    Fully connected layer `x @ weight + bias` with an optional relu, as a single
+    autodiff operation.
+    Args:
+        x (:class:`Tensor`): input of shape `(..., in_size)`
+        weight (:class:`Tensor`): weights of shape `(in_size, out_size)`
+        bias (:class:`Tensor`): bias of shape `(out_size,)`
+        relu (bool): apply relu to the output
+    Returns:
+        :class:`Tensor` : output of shape `(..., out_size)`
+    """
+    return Linear.apply(x, weight, bias, relu)
+
+
+# Helpers for Constructing tensors
+def zeros(shape, backend=SimpleBackend):
+    """
+    Produce a zero tensor of size `shape`.
+    Args:
+        shape (tuple): shape of tensor
+        backend (:class:`Backend`): tensor backend
+    Returns:
+        :class:`Tensor` : new tensor
+    """
+    return Tensor(TensorData(np.zeros(int(np.prod(shape))), tuple(shape)), backend=backend)
+
+
+def rand(shape, backend=SimpleBackend, requires_grad=False):
+    """
+    Produce a random tensor of size `shape`.
+    Args:
+        shape (tuple): shape of tensor
+        backend (:class:`Backend`): tensor backend
+        requires_grad (bool): turn on autodifferentiation
+    Returns:
+        :class:`Tensor` : new tensor
+    """
+    vals = [random.random() for _ in range(int(np.prod(shape)))]
+    tensor = Tensor(TensorData(vals, tuple(shape)), backend=backend)
+    tensor.requires_grad_(requires_grad)
+    return tensor
+
+
+def _tensor(ls, shape=None, backend=SimpleBackend, requires_grad=False):
+    """
+    Produce a tensor with data ls and shape `shape`.
+    Args:
+        ls (list): data for tensor
+        shape (tuple): shape of tensor
+        backend (:class:`Backend`): tensor backend
+        requires_grad (bool): turn on autodifferentiation
+    Returns:
+        :class:`Tensor` : new tensor
+    """
+    tensor = Tensor(TensorData(ls, shape), backend=backend)
+    tensor.requires_grad_(requires_grad)
+    return tensor
+
+
+def tensor(ls, backend=SimpleBackend, requires_grad=False):
+    """
+    Produce a tensor with data and shape from ls
+    Args:
+        ls (list or array): data for tensor
+        backend (:class:`Backend`): tensor backend
+        requires_grad (bool): turn on autodifferentiation
+    Returns:
+        :class:`Tensor` : new tensor
+    """
+    data = np.array(ls, dtype=np.float64)
+    return _tensor(data.reshape(-1), data.shape, backend=backend, requires_grad=requires_grad)
+
+
+## Gradient check for tensors
+
+
+def grad_central_difference(f, *vals, arg=0, epsilon=1e-6, ind=None):
+    x = vals[arg]
+    up = zeros(x.shape)
+    up[ind] = epsilon
+    vals1 = [x if j != arg else x + up for j, x in enumerate(vals)]
+    vals2 = [x if j != arg else x - up for j, x in enumerate(vals)]
+    delta = f(*vals1).sum() - f(*vals2).sum()
+
+    return delta[0] / (2.0 * epsilon)
+
+
+def grad_check(f, *vals):
+    for x in vals:
+        x.requires_grad_(True)
+        x.zero_grad_()
+    random.seed(10)
+    out = f(*vals)
+    out.sum().backward()
+    err_msg = """
+
+Gradient check error for function %s.
+
+Input %s
+
+Received derivative %f for argument %d and index %s,
+but was expecting derivative %f from central difference.
+
+"""
+
+    constants = [x.detach() for x in vals]
+    for i, x in enumerate(vals):
+        ind = x._tensor.sample()
+        check = grad_central_difference(f, *constants, arg=i, ind=ind)
+        np.testing.assert_allclose(
+            x.grad[ind],
+            check,
+            1e-2,
+            1e-2,
+            err_msg=err_msg % (f, vals, x.grad[ind], i, ind, check),
+        )
+
+
+# The lazy module builds on the Functions above, so it is imported last.
+from . import lazy  # noqa: E402
@@ -0,0 +1,248 @@
+import math
+import numpy as np
+from . import fast_ops, operators
+from .tensor_data import TensorData, shape_broadcast, broadcast_strides, IndexingError
+
+## Task 2.2
+## Broadcasting tensor kernels
+#
+# Broadcasting never expands data: a broadcast input is walked with stride 0
+# along the dimensions it is broadcast over, and the elementwise work is
+# handed to the kernels in :mod:`minitorch.fast_ops`.
+
+
+def tensor_map(fn):
+    """
+    Higher-order tensor map function ::
+
+      fn_map = tensor_map(fn)
+      fn_map(out, ... )
+
+    Args:
+        fn: function from float-to-float to apply
+    Returns:
+        function : `_map(out, out_shape, out_strides, in_storage, in_shape, in_strides)`
+        that fills `out`. The input is broadcast to `out_shape`.
+    """
+    kernel = fast_ops.map_kernel(fn)
+
+    def _map(out, out_shape, out_strides, in_storage, in_shape, in_strides):
+        kernel(
+            out,
+            out_shape,
+            out_strides,
+            in_storage,
+            out_shape,
+            broadcast_strides(in_shape, in_strides, out_shape),
+        )
+
+    return _map
+
+
+def tensor_zip(fn):
+    """
+    Higher-order tensor zip function ::
+
+      fn_zip = tensor_zip(fn)
+      fn_zip(out, ...)
+
+    Args:
+        fn: function mapping two floats to float to apply
+    Returns:
+        function : `_zip(out, out_shape, out_strides, a_storage, a_shape, a_strides,
+        b_storage, b_shape, b_strides)` that fills `out`. Both inputs are broadcast
+        to `out_shape`.
+    """
+    kernel = fast_ops.zip_kernel(fn)
+
+    def _zip(
+        out, out_shape, out_strides, a_storage, a_shape, a_strides, b_storage, b_shape, b_strides
+    ):
+        kernel(
+            out,
+            out_shape,
+            out_strides,
+            a_storage,
+            out_shape,
+            broadcast_strides(a_shape, a_strides, out_shape),
+            b_storage,
+            out_shape,
+            broadcast_strides(b_shape, b_strides, out_shape),
+        )
+
+    return _zip
+
+
+def tensor_reduce(fn, start=0.0):
+    """
+    Higher-order tensor reduce function along one dimension.
+    Args:
+        fn: reduction function mapping two floats to float
+        start (float): start value :math:`x_0`
+    Returns:
+        function : `_reduce(out, out_shape, out_strides, a_storage, a_shape, a_strides, reduce_dim)`
+        that fills `out`, whose shape is `a_shape` with `reduce_dim` set to 1.
+    """
+    return fast_ops.reduce_dim_kernel(fn, start)
+
+
+def _empty(shape):
+    shape = tuple(shape)
+    return TensorData(np.empty(math.prod(shape)), shape)
+
+
+class TensorOps:
+    """
+    :class:`TensorData` level operations. Each returns a function that allocates
+    its output (unless `out` is given) and runs the matching kernel.
+    """
+
+    @staticmethod
+    def map(fn):
+        f = tensor_map(fn)
+
+        def ret(a, out=None):
+            if out is None:
+                out = _empty(a.shape)
+            f(*out.tuple(), *a.tuple())
+            return out
+
+        return ret
+
+    @staticmethod
+    def zip(fn):
+        f = tensor_zip(fn)
+
+        def ret(a, b, out=None):
+            if out is None:
+                out = _empty(shape_broadcast(a.shape, b.shape))
+            f(*out.tuple(), *a.tuple(), *b.tuple())
+            return out
+
+        return ret
+
+    @staticmethod
+    def reduce(fn, start=0.0):
+        f = tensor_reduce(fn, start)
+
+        def ret(a, dim):
+            out_shape = list(a.shape)
+            out_shape[dim] = 1
+            out = _empty(out_shape)
+            f(*out.tuple(), *a.tuple(), dim)
+            return out
+
+        return ret
+
+    @staticmethod
+    def matrix_multiply(a, b):
+        """
+        Batched matrix multiply. The last two dimensions are multiplied and the
+        leading (batch) dimensions are broadcast, so `(N, 2) @ (2, H)` and
+        `(B, N, 2) @ (2, H)` both work.
+        Args:
+            a (:class:`TensorData`): tensor of shape `(..., n, m)`
+            b (:class:`TensorData`): tensor of shape `(..., m, p)`
+        Returns:
+            :class:`TensorData` : tensor of shape `(..., n, p)`
+        """
+        if a.dims < 2 or b.dims < 2:
+            raise IndexingError(f"Matrix multiply needs 2 dims, got {a.shape} and {b.shape}.")
+        if a.shape[-1] != b.shape[-2]:
+            raise IndexingError(f"Cannot multiply {a.shape} and {b.shape}.")
+        batch = shape_broadcast(a.shape[:-2], b.shape[:-2])
+        out = _empty(batch + (a.shape[-2], b.shape[-1]))
+        fast_ops.matmul(a.to_numpy(), b.to_numpy(), out.to_numpy())
+        return out
+
+    @staticmethod
+    def linear(x, weight, bias, relu=False):
+        """
+        Fused `x @ weight + bias`, optionally followed by relu, written into a
+        single output buffer.
+        Args:
+            x (:class:`TensorData`): input of shape `(..., n, m)`
+            weight (:class:`TensorData`): weights of shape `(m, p)`
+            bias (:class:`TensorData`): bias of shape `(p,)`
+            relu (bool): apply relu in place
+        Returns:
+            :class:`TensorData` : output of shape `(..., n, p)`
+        """
+        out = TensorOps.matrix_multiply(x, weight)
+        out_view = out.to_numpy()
+        np.add(out_view, bias.to_numpy(), out=out_view)
+        if relu:
+            np.maximum(out_view, 0.0, out=out_view)
+        return out
+
+    @staticmethod
+    def linear_back(x, weight, out, grad, relu=False):
+        """
+        Gradients of :meth:`linear` for `x`, `weight` and `bias` in one pass.
+        The relu mask is applied straight to `grad`, so the pre-activation
+        gradient is the only temporary.
+        Args:
+            x (:class:`TensorData`): input of the forward call
+            weight (:class:`TensorData`): weights of the forward call
+            out (:class:`TensorData`): output of the forward call
+            grad (:class:`TensorData`): gradient of the output
+            relu (bool): whether the forward call applied relu
+        Returns:
+            tuple : gradients for `x`, `weight` and `bias`
+        """
+        g = grad.to_numpy()
+        if relu:
+            g = np.where(out.to_numpy() > 0, g, 0.0)
+        x_view = x.to_numpy()
+        w_view = weight.to_numpy()
+        m, p = w_view.shape
+        grad_x = _empty(x.shape)
+        fast_ops.matmul(g, w_view.T, grad_x.to_numpy())
+        # Batch dimensions are folded into the rows for the weight and bias.
+        g2 = g.reshape(-1, p)
+        grad_w = _empty((m, p))
+        fast_ops.matmul(x_view.reshape(-1, m).T, g2, grad_w.to_numpy())
+        grad_b = _empty((p,))
+        np.sum(g2, axis=0, out=grad_b.to_numpy())
+        return grad_x, grad_w, grad_b
+
+
+class TensorBackend:
+    """
+    The kernels a :class:`Tensor` runs on, built from an ops class such as
+    :class:`TensorOps`.
+    """
+
+    def __init__(self, ops):
+        self.ops = ops
+
+        # Maps
+        self.neg_map = ops.map(operators.neg)
+        self.sigmoid_map = ops.map(operators.sigmoid)
+        self.relu_map = ops.map(operators.relu)
+        self.log_map = ops.map(operators.log)
+        self.exp_map = ops.map(operators.exp)
+        self.id_map = ops.map(operators.id)
+        self.inv_map = ops.map(operators.inv)
+
+        # Zips
+        self.add_zip = ops.zip(operators.add)
+        self.mul_zip = ops.zip(operators.mul)
+        self.lt_zip = ops.zip(operators.lt)
+        self.eq_zip = ops.zip(operators.eq)
+        self.sigmoid_back_zip = ops.zip(operators.sigmoid_back)
+        self.relu_back_zip = ops.zip(operators.relu_back)
+        self.log_back_zip = ops.zip(operators.log_back)
+        self.exp_back_zip = ops.zip(operators.exp_back)
+        self.inv_back_zip = ops.zip(operators.inv_back)
+
+        # Reduce
+        self.add_reduce = ops.reduce(operators.add, 0.0)
+        self.mul_reduce = ops.reduce(operators.mul, 1.0)
+
+        self.matrix_multiply = ops.matrix_multiply
+        self.linear = ops.linear
+        self.linear_back = ops.linear_back
+
+
+SimpleBackend = TensorBackend(TensorOps)
@@ -0,0 +1,149 @@
+"""
+Minibatch training of modules: shuffled batches prefetched on a background
+thread, and a training loop reporting throughput.
+"""
+
+import queue
+import threading
+import time
+import numpy as np
+from .tensor import Tensor
+from .tensor_data import TensorData
+
+__all__ = ["DataLoader", "fit"]
+
+
+class DataLoader:
+    """
+    Iterates over `(X, y)` minibatch tensors of a dataset, one epoch per
+    iteration. Each epoch shuffles an array of indices, not the data;
+    batches are gathered from the original arrays. With `prefetch` the
+    next batches are gathered on a background thread while the current
+    one is used. ::
+
+        loader = DataLoader(data.X, data.y, batch_size=32, seed=0)
+        for epoch in range(10):
+            for X, y in loader:
+                ...
+
+    Args:
+        X (array): inputs, one row per sample
+        y (array): targets, one per sample
+        batch_size (int): samples per batch (the last batch may be smaller)
+        shuffle (bool): visit the samples in a new random order every epoch
+        seed (int, opt): random seed of the shuffling
+        prefetch (int): number of batches gathered ahead, 0 to gather in the loop
+        backend : backend of the batch tensors
+    """
+
+    def __init__(self, X, y, batch_size, shuffle=True, seed=None, prefetch=2, backend=None):
+        self.X = np.asarray(X, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        assert len(self.X) == len(self.y), "X and y must have one entry per sample."
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        self.backend = backend
+        self.index = np.arange(len(self.X))
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        "Number of batches per epoch."
+        return -(-len(self.X) // self.batch_size)
+
+    def _tensor(self, array):
+        return Tensor(TensorData(array.reshape(-1), array.shape), backend=self.backend)
+
+    def _batches(self, index):
+        for start in range(0, len(index), self.batch_size):
+            batch = index[start : start + self.batch_size]
+            yield self._tensor(self.X.take(batch, axis=0)), self._tensor(self.y.take(batch, axis=0))
+
+    def __iter__(self):
+        if self.shuffle:
+            self._rng.shuffle(self.index)
+        # The epoch keeps its own order, even if the next one starts early.
+        batches = self._batches(self.index.copy() if self.prefetch else self.index)
+        if self.prefetch:
+            return _prefetched(batches, self.prefetch)
+        return batches
+
+
+# Marks the end of the prefetched batches.
+_DONE = object()
+
+
+def _prefetched(iterable, depth):
+    "Iterate over `iterable` with up to `depth` items computed ahead on a thread."
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in iterable:
+                items.put(item)
+                if stop.is_set():
+                    return
+            items.put(_DONE)
+        except BaseException as e:  # Raised again in the consumer.
+            items.put(e)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Unblock the producer if the loop stopped early.
+        stop.set()
+        while thread.is_alive():
+            try:
+                items.get(timeout=0.01)
+            except queue.Empty:
+                pass
+        thread.join()
+
+
+def fit(model, loader, loss_fn, optimizer, epochs=1, callback=None):
+    """
+    Train `model` with minibatch updates.
+    Args:
+        model (:class:`Module`): the model
+        loader (:class:`DataLoader`): the training batches
+        loss_fn (function): maps the model output and the targets of a batch to the loss
+        optimizer (:class:`minitorch.optim.Optimizer`): updates the model parameters
+        epochs (int): passes over the data
+        callback (function, opt): called with the stats of every epoch
+    Returns:
+        list of dict : per epoch `epoch`, `loss` (summed over batches), `samples`,
+        `seconds` and `samples_per_sec`
+    """
+    history = []
+    for epoch in range(epochs):
+        start = time.perf_counter()
+        total = 0.0
+        samples = 0
+        for X, y in loader:
+            optimizer.zero_grad()
+            loss = loss_fn(model(X), y)
+            loss.view(1).backward()
+            optimizer.step()
+            total += loss.item()
+            samples += y.shape[0]
+        seconds = time.perf_counter() - start
+        stats = {
+            "epoch": epoch,
+            "loss": total,
+            "samples": samples,
+            "seconds": seconds,
+            "samples_per_sec": samples / seconds if seconds > 0 else float("inf"),
+        }
+        history.append(stats)
+        if callback is not None:
+            callback(stats)
+    return history
@@ -1,6 +1,4 @@
-import numpy
-import random
-import visdom
+import os
 import numpy as np
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -12,95 +10,159 @@ def to_fig(canvas):
     return np.frombuffer(s, np.uint8).reshape((height, width, 4))
 
 
-def make_pts(N):
-    X = []
-    for i in range(N):
-        x_1 = random.random()
-        x_2 = random.random()
-        X.append((x_1, x_2))
-    return X
+def make_pts(N, seed=None):
+    """
+    Uniform random points in the unit square.
+    Args:
+        N (int): number of points
+        seed (int or Generator, opt): seed or numpy random generator
+    Returns:
+        array : float array of shape `(N, 2)`
+    """
+    return np.random.default_rng(seed).random((N, 2))
 
 
 class Graph:
-    def __init__(self, vis=False):
+    """
+    Plots the points of a dataset over the decision surface of a model.
+
+    Frames go to visdom if `vis` is set and are written as PNG files to
+    `save_dir` if it is given. The figure is built once and only the
+    contour is redrawn for every frame.
+
+    Args:
+        vis (bool): show the frames in visdom
+        save_dir (string, opt): directory to write `frame_XXXX.png` files to
+        resolution (int): number of grid points along each axis of the surface
+    """
+
+    def __init__(self, vis=False, save_dir=None, resolution=11):
         self.gifs = []
         if vis:
+            import visdom
+
             self.vis = visdom.Visdom()
         else:
             self.vis = None
+        self.save_dir = save_dir
+        if save_dir is not None:
+            os.makedirs(save_dir, exist_ok=True)
+        self.resolution = resolution
+        self.frames = 0
         self.first = True
+        self._fig = None
+
+    @staticmethod
+    def labels(X):
+        "0/1 label of each row of the `(N, 2)` points `X`."
+        assert False, "Not Implemented"
+
+    @classmethod
+    def stream(cls, batch_size, N=None, seed=None):
+        """
+        Yield `(X, y)` minibatches of fresh points and their labels, without
+        ever holding more than one batch.
+        Args:
+            batch_size (int): points per batch
+            N (int, opt): total number of points, unbounded if None
+            seed (int, opt): random seed
+        """
+        rng = np.random.default_rng(seed)
+        remaining = N
+        while remaining is None or remaining > 0:
+            n = batch_size if remaining is None else min(batch_size, remaining)
+            X = make_pts(n, rng)
+            yield X, cls.labels(X)
+            if remaining is not None:
+                remaining -= n
+
+    def grid(self):
+        """
+        Returns:
+            (array, array) : `resolution x resolution` meshgrid of the unit square
+        """
+        ticks = np.linspace(0.0, 1.0, self.resolution)
+        return np.meshgrid(ticks, ticks, indexing="ij")
+
+    def _figure(self):
+        if self._fig is None:
+            fig = Figure()
+            self._canvas = FigureCanvas(fig)
+            self._ax = fig.gca()
+            self._ax.scatter(
+                self.X[:, 0], self.X[:, 1], c=self.y, edgecolors="black", zorder=2
+            )
+            self._contour = None
+            self._fig = fig
+        return self._ax
 
     def graph(self, outfile, model=None):
-        if self.vis is None:
+        """
+        Draw a frame.
+        Args:
+            outfile (string): title of the frame
+            model (function, opt): maps an `(M, 2)` array of points to `M` values
+        """
+        if self.vis is None and self.save_dir is None:
             return
-        fig = Figure()
-        canvas = FigureCanvas(fig)
-        ax = fig.gca()
+        ax = self._figure()
 
+        if self._contour is not None:
+            self._contour.remove()
+            self._contour = None
         if model is not None:
-            X = []
-            Y = []
-            Z = []
-            for i in range(11):
-                inner = []
-                innerx = []
-                innery = []
-                for j in range(11):
-                    x_1 = i / 10.0
-                    x_2 = j / 10.0
-                    innerx.append(x_1)
-                    innery.append(x_2)
-                    val = model([x_1, x_2])
-                    inner.append(val)
-                    Z.append(inner)
-                    X.append(innerx)
-                    Y.append(innery)
-
-            Z = numpy.array(Z)
-            ax.contourf(X, Y, Z)
-
-        ax.scatter(
-            [p[0] for p in self.X], [p[1] for p in self.X], c=self.y, edgecolors="black"
-        )
-        # plt.savefig(outfile)
+            x_1, x_2 = self.grid()
+            points = np.stack([x_1.ravel(), x_2.ravel()], axis=1)
+            Z = np.asarray(model(points), dtype=np.float64).reshape(x_1.shape)
+            self._contour = ax.contourf(x_1, x_2, Z, zorder=1)
+
         ax.set_title(outfile)
-        im = to_fig(canvas)
-        if self.first:
-            self.vis.close(win="Progress")
-        self.vis.image(
-            im.transpose(2, 0, 1), win="Progress", opts=dict(store_history=True)
-        )
+        if self.save_dir is not None:
+            path = os.path.join(self.save_dir, f"frame_{self.frames:04d}.png")
+            self._canvas.print_png(path)
+        if self.vis is not None:
+            im = to_fig(self._canvas)
+            if self.first:
+                self.vis.close(win="Progress")
+            self.vis.image(
+                im.transpose(2, 0, 1), win="Progress", opts=dict(store_history=True)
+            )
+        self.frames += 1
         self.first = False
 
 
 class Simple(Graph):
-    def __init__(self, N, vis=False):
-        super().__init__(vis)
+    def __init__(self, N, vis=False, seed=None, save_dir=None, resolution=11):
+        super().__init__(vis, save_dir, resolution)
         self.N = N
-        self.X = make_pts(N)
-        self.y = []
-        for x_1, x_2 in self.X:
-            y = 1 if x_1 < 0.5 else 0
-            self.y.append(y)
+        self.X = make_pts(N, seed)
+        self.y = self.labels(self.X)
+
+    @staticmethod
+    def labels(X):
+        return (X[:, 0] < 0.5).astype(np.int64)
 
 
 class Split(Graph):
-    def __init__(self, N, vis=False):
-        super().__init__(vis)
+    def __init__(self, N, vis=False, seed=None, save_dir=None, resolution=11):
+        super().__init__(vis, save_dir, resolution)
         self.N = N
-        self.X = make_pts(N)
-        self.y = []
-        for x_1, x_2 in self.X:
-            y = 1 if x_1 < 0.2 or x_1 > 0.8 else 0
-            self.y.append(y)
+        self.X = make_pts(N, seed)
+        self.y = self.labels(self.X)
+
+    @staticmethod
+    def labels(X):
+        return ((X[:, 0] < 0.2) | (X[:, 0] > 0.8)).astype(np.int64)
 
 
 class Xor(Graph):
-    def __init__(self, N, vis=False):
-        super().__init__(vis)
+    def __init__(self, N, vis=False, seed=None, save_dir=None, resolution=11):
+        super().__init__(vis, save_dir, resolution)
         self.N = N
-        self.X = make_pts(N)
-        self.y = []
-        for x_1, x_2 in self.X:
-            y = 1 if ((x_1 < 0.5 and x_2 > 0.5) or (x_1 > 0.5 and x_2 < 0.5)) else 0
-            self.y.append(y)
+        self.X = make_pts(N, seed)
+        self.y = self.labels(self.X)
+
+    @staticmethod
+    def labels(X):
+        x_1, x_2 = X[:, 0], X[:, 1]
+        return (((x_1 < 0.5) & (x_2 > 0.5)) | ((x_1 > 0.5) & (x_2 < 0.5))).astype(np.int64)
@@ -0,0 +1,76 @@
+"""
+Minibatch training of the `run_tensor.py` network with the minitorch
+training driver.
+
+>>> python run_minibatch.py
+"""
+
+import minitorch
+import datasets
+
+PTS = 1000
+DATASET = datasets.Xor(PTS, seed=0)
+HIDDEN = 10
+BATCH_SIZE = 50
+RATE = 0.05
+MOMENTUM = 0.9
+EPOCHS = 50
+
+
+class Network(minitorch.Module):
+    def __init__(self):
+        super().__init__()
+        self.layer1 = Linear(2, HIDDEN, relu=True)
+        self.layer2 = Linear(HIDDEN, HIDDEN, relu=True)
+        self.layer3 = Linear(HIDDEN, 1)
+
+    def forward(self, x):
+        h = self.layer2.forward(self.layer1.forward(x))
+        return self.layer3.forward(h).sigmoid()
+
+
+class Linear(minitorch.Module):
+    def __init__(self, in_size, out_size, relu=False):
+        super().__init__()
+        self.weights = minitorch.Parameter(2 * (minitorch.rand((in_size, out_size)) - 0.5))
+        self.bias = minitorch.Parameter(2 * (minitorch.rand((out_size,)) - 0.5))
+        self.relu = relu
+
+    def forward(self, x):
+        return minitorch.linear(x, self.weights.value, self.bias.value, relu=self.relu)
+
+
+def bce_loss(out, y):
+    out = out.view(y.shape[0])
+    probs = (out * y) + (out - 1.0) * (y - 1.0)
+    return -probs.log().sum() / float(y.shape[0])
+
+
+model = Network()
+data = DATASET
+loader = minitorch.DataLoader(data.X, data.y, BATCH_SIZE, seed=0)
+optimizer = minitorch.SGD(model, RATE, momentum=MOMENTUM)
+
+
+def check(points):
+    # One batched call over the whole grid, without recording gradients.
+    with minitorch.no_grad():
+        return model.forward(minitorch.tensor(points)).to_numpy()
+
+
+def log(stats):
+    epoch = stats["epoch"]
+    if epoch % 5 == 0:
+        pred = check(data.X).reshape(-1) > 0.5
+        correct = int((pred == (data.y == 1)).sum())
+        print(
+            "Epoch ", epoch, " loss ", stats["loss"] / len(loader), "correct", correct,
+            f"{stats['samples_per_sec']:.0f} samples/sec",
+        )
+        data.graph(f"graph epoch: {epoch} loss: {stats['loss']}", check)
+
+
+history = minitorch.fit(model, loader, bce_loss, optimizer, epochs=EPOCHS, callback=log)
+samples = sum(h["samples"] for h in history)
+seconds = sum(h["seconds"] for h in history)
+print(f"Throughput {samples / seconds:.0f} samples/sec")
@@ -0,0 +1,90 @@
+"""
+Be sure you have minitorch installed in you Virtual Env.
+>>> pip install -Ue .
+"""
+
+import minitorch
+import datasets
+import time
+
+PTS = 250
+DATASET = datasets.Xor(PTS)
+HIDDEN = 10
+RATE = 0.5
+
+
+# Model with
+class Network(minitorch.Module):
+    def __init__(self):
+        super().__init__()
+
+        # Submodules
+        self.layer1 = Linear(2, HIDDEN, relu=True)
+        self.layer2 = Linear(HIDDEN, HIDDEN, relu=True)
+        self.layer3 = Linear(HIDDEN, 1)
+
+    def forward(self, x):
+        h = self.layer1.forward(x)
+        h = self.layer2.forward(h)
+        return self.layer3.forward(h).sigmoid()
+
+
+class Linear(minitorch.Module):
+    def __init__(self, in_size, out_size, relu=False):
+        super().__init__()
+        self.weights = minitorch.Parameter(2 * (minitorch.rand((in_size, out_size)) - 0.5))
+        self.bias = minitorch.Parameter(2 * (minitorch.rand((out_size,)) - 0.5))
+        self.relu = relu
+
+    def forward(self, x):
+        # Matmul, bias and relu run as one fused op.
+        return minitorch.linear(x, self.weights.value, self.bias.value, relu=self.relu)
+
+
+model = Network()
+# All the parameters live in one buffer, so the update is a single operation.
+parameters = model.flatten_parameters()
+
+# Dataset
+data = DATASET
+X = minitorch.tensor(data.X)
+y = minitorch.tensor(data.y)
+
+losses = []
+start = time.time()
+for epoch in range(500):
+
+    # Forward
+    out = model.forward(X).view(data.N)
+    probs = (out * y) + (out - 1.0) * (y - 1.0)
+    loss = -probs.log().sum()
+
+    # Update
+    parameters.zero_grad()
+    loss.view(1).backward()
+    parameters.sgd_step(RATE / float(data.N))
+
+    # Logging
+    pred = out.detach() > 0.5
+    correct = ((y == 1) * pred).sum().item() + ((y == 0) * (1 - pred)).sum().item()
+    losses.append(loss.item())
+
+    if epoch % 10 == 0:
+        print("Epoch ", epoch, " loss ", loss.item(), "correct", correct)
+        im = f"graph epoch: {epoch} loss: {loss.item()}"
+
+    if epoch % 50 == 0:
+
+        def check(X):
+            # One batched call over the whole grid, without recording gradients.
+            with minitorch.no_grad():
+                return model.forward(minitorch.tensor(X)).to_numpy()
+
+        data.graph(im, check)
+        if data.vis is not None:
+            import matplotlib.pyplot as plt
+
+            plt.plot(losses, c="blue")
+            data.vis.matplot(plt, win="loss")
+
+print("Time per epoch", (time.time() - start) / 500)
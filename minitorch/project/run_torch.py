@@ -43,7 +43,7 @@ losses = []
 for epoch in range(500):
 
     # Forward
-    out = model.forward(torch.tensor(data.X, requires_grad=True)).view(data.N)
+    out = model.forward(torch.tensor(data.X, dtype=torch.float32, requires_grad=True)).view(data.N)
     y = torch.tensor(data.y)
     probs = (out * y) + (out - 1.0) * (y - 1.0)
     loss = -probs.log().sum()
@@ -67,8 +67,10 @@ for epoch in range(500):
 
     if epoch % 50 == 0:
 
-        def check(x):
-            return model.forward(torch.tensor(x).view(1, 2))[0, 0]
+        def check(X):
+            # One batched call over the whole grid.
+            with torch.no_grad():
+                return model.forward(torch.tensor(X, dtype=torch.float32)).numpy()
 
         data.graph(im, check)
         plt.plot(losses, c="blue")
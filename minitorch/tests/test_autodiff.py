@@ -0,0 +1,194 @@
+import sys
+import tracemalloc
+import minitorch
+import pytest
+from minitorch import Scalar, History, Context
+from minitorch.autodiff import FunctionBase
+from .strategies import assert_close
+
+
+class Function1(minitorch.ScalarFunction):
+    @staticmethod
+    def forward(ctx, x, y):
+        ":math:`f(x, y) = x + y + 10`"
+        return x + y + 10
+
+    @staticmethod
+    def backward(ctx, d_output):
+        ":math:`f'_x(x, y) = 1 ; f'_y(x, y) = 1`"
+        return d_output, d_output
+
+
+class Function2(minitorch.ScalarFunction):
+    @staticmethod
+    def forward(ctx, x, y):
+        ":math:`f(x, y) = x \timesy + x`"
+        ctx.save_for_backward(x, y)
+        return x * y + x
+
+    @staticmethod
+    def backward(ctx, d_output):
+        ":math:`f'_x(x, y) = y + 1 ; f'_y(x, y) = x`"
+        x, y = ctx.saved_values
+        return d_output * (y + 1), d_output * x
+
+
+@pytest.mark.task1_2
+def test_chain_rule():
+    x = Scalar(10.0)
+    y = Scalar(5.0)
+    z = Function2.apply(x, y)
+    back = z.history.last_fn.chain_rule(z.history.ctx, z.history.inputs, d_output=5)
+    assert [v for v, _ in back] == [x, y]
+    assert [d for _, d in back] == [5 * 6, 5 * 10]
+
+    # Constants are dropped.
+    constant = Scalar(0.0, None)
+    z = Function2.apply(constant, y)
+    back = z.history.last_fn.chain_rule(z.history.ctx, z.history.inputs, d_output=5)
+    assert len(back) == 1
+
+
+@pytest.mark.task1_4
+def test_backprop():
+    var = Scalar(0)
+    var2 = Function1.apply(0, var)
+    var2.backward(d_output=5)
+    assert var.derivative == 5
+
+    var = Scalar(0)
+    var2 = Function1.apply(0, var)
+    var3 = Function1.apply(0, var2)
+    var3.backward(d_output=5)
+    assert var.derivative == 5
+
+    # Variable used twice.
+    var1 = Scalar(0)
+    var2 = Function1.apply(0, var1)
+    var3 = Function1.apply(0, var1)
+    var4 = Function1.apply(var2, var3)
+    var4.backward(d_output=5)
+    assert var1.derivative == 10
+
+    # Diamond with a shared intermediate.
+    var0 = Scalar(0)
+    var1 = Function1.apply(0, var0)
+    var2 = Function1.apply(0, var1)
+    var3 = Function1.apply(0, var1)
+    var4 = Function1.apply(var2, var3)
+    var4.backward(d_output=5)
+    assert var0.derivative == 10
+
+
+@pytest.mark.task1_4
+def test_deep_chain():
+    "Long graphs are walked without recursion"
+    x = Scalar(1.0)
+    out = x
+    for _ in range(3 * sys.getrecursionlimit()):
+        out = out * 1.0 + 0.0
+    out.backward()
+    assert_close(x.derivative, 1.0)
+
+
+@pytest.mark.task1_4
+def test_separate_graphs():
+    "Each backward walks its own graph; other pending graphs are unaffected"
+    x = Scalar(2.0)
+    for step in range(3):
+        out = x * x
+        out.backward()
+        assert x.derivative == 4.0 * (step + 1)
+
+    x.zero_derivative_()
+    a = x * 3.0
+    b = x * 4.0
+    b.backward()
+    a.backward()
+    assert x.derivative == 7.0
+
+
+@pytest.mark.task1_4
+def test_shared_subgraph():
+    "Building a tape leaves no marks, so graphs sharing nodes backpropagate in turn"
+    x = Scalar(2.0)
+    y = Scalar(5.0)
+    h = x * y
+    a = h + x
+    b = h * 2.0
+    a.backward()
+    assert (x.derivative, y.derivative) == (6.0, 2.0)
+    assert all(v._slot is None for v in (x, y, h, a))
+    b.backward()
+    assert (x.derivative, y.derivative) == (16.0, 6.0)
+    assert all(v._slot is None for v in (x, y, h, b))
+
+
+@pytest.mark.task1_4
+def test_forward_only_graphs_are_freed():
+    "A graph nobody backpropagates through is freed with its variables"
+    x = minitorch.rand((1000, 100), requires_grad=True)
+
+    def forward():
+        # The intermediate is saved for the backward of the second product.
+        return (x * x) * x
+
+    forward()
+    tracemalloc.start()
+    for _ in range(5):
+        forward()
+    after_5 = tracemalloc.get_traced_memory()[0]
+    for _ in range(50):
+        forward()
+    after_55 = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # One forward allocates about 1.6 MB; nothing accumulates.
+    assert after_55 - after_5 < 2 ** 20
+
+
+@pytest.mark.task1_4
+def test_no_grad():
+    "Nothing is recorded inside `no_grad`, and recording resumes after it"
+    x = Scalar(2.0)
+    with minitorch.no_grad():
+        assert not minitorch.is_grad_enabled()
+        with minitorch.no_grad():
+            y = x * x + 1.0
+        assert not minitorch.is_grad_enabled()
+        assert y.history is None
+        assert y.data == 5.0
+    assert minitorch.is_grad_enabled()
+    out = x * x
+    out.backward()
+    assert x.derivative == 4.0
+
+
+@pytest.mark.task1_2
+def test_context():
+    ctx = Context()
+    ctx.save_for_backward(1.0, 2.0)
+    assert ctx.saved_values == (1.0, 2.0)
+
+    ctx = Context(no_grad=True)
+    ctx.save_for_backward(1.0)
+    assert ctx._saved_values is None
+    assert History().last_fn is None
+    assert issubclass(minitorch.ScalarFunction, FunctionBase)
+
+
+@pytest.mark.task1_4
+def test_compact_nodes():
+    "Graph nodes carry no per-instance dict and a 10k node graph stays small"
+    x = Scalar(1.0)
+    y = x * 2.0
+    for obj in (x, y, y.history, y.history.ctx):
+        assert not hasattr(obj, "__dict__")
+    assert isinstance(y.history.inputs, tuple)
+
+    tracemalloc.start()
+    out = x
+    for _ in range(5000):
+        out = out * 0.5 + x
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert size < 8 * 2 ** 20
@@ -0,0 +1,108 @@
+import minitorch
+import numpy as np
+import pytest
+from .strategies import assert_close
+from .test_flat_parameters import Network
+
+
+def same_values(a, b):
+    for p, q in zip(a.parameters(), b.parameters()):
+        assert p.value.shape == q.value.shape
+        assert_close(p.value.to_numpy(), q.value.to_numpy())
+
+
+@pytest.mark.task2_4
+def test_state_dict():
+    "`load_state_dict` restores the values of `state_dict`"
+    model = Network()
+    other = Network()
+    state = model.state_dict()
+    assert list(state) == list(model.named_parameters())
+    other.load_state_dict(state)
+    same_values(model, other)
+
+    # The state is a copy.
+    state["layer1.bias"][...] = 100.0
+    assert model.layer1.bias.value[0] != 100.0
+
+    del state["layer2.bias"]
+    with pytest.raises(KeyError):
+        other.load_state_dict(state)
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize("mmap", [True, False])
+def test_checkpoint(tmp_path, mmap):
+    "Checkpoint files round trip, and memory-mapped parameters are views of the file"
+    path = tmp_path / "model.ckpt"
+    model = Network()
+    model.save(path)
+    assert minitorch.load_state(path, mmap=mmap).keys() == model.state_dict().keys()
+
+    other = Network()
+    other.load(path, mmap=mmap)
+    same_values(model, other)
+    X = minitorch.tensor([[0.1, 0.2], [0.5, -0.3]])
+    assert_close(other(X).to_numpy(), model(X).to_numpy())
+    storage = other.layer1.weights.value._tensor._storage
+    assert isinstance(storage, np.memmap) == mmap
+
+    # Training still works: updates replace the mapped values.
+    other(X).sum().view(1).backward()
+    for p in other.parameters():
+        p.update(p.value.detach() - 0.5 * p.value.grad)
+    assert minitorch.load_state(path)["layer1.weights"][0, 0] == model.layer1.weights.value[0, 0]
+
+
+@pytest.mark.task2_4
+def test_checkpoint_modes(tmp_path):
+    "Read-only and copy-on-write mappings, and loading into a flat buffer"
+    path = tmp_path / "model.ckpt"
+    model = Network()
+    model.save(path)
+
+    other = Network()
+    other.load(path)
+    with pytest.raises(ValueError):
+        other.layer1.bias.value.to_numpy()[0] = 1.0
+
+    other.load(path, mode="c")
+    other.layer1.bias.value.to_numpy()[0] = 1.0
+    assert minitorch.load_state(path)["layer1.bias"][0] == model.layer1.bias.value[0]
+
+    flat_model = Network()
+    flat = flat_model.flatten_parameters()
+    flat_model.load(path)
+    same_values(model, flat_model)
+    assert flat_model.layer1.weights.value._tensor._storage.base is flat.data
+
+
+class Mixed(minitorch.Module):
+    def __init__(self):
+        super().__init__()
+        self.weights = minitorch.Parameter(minitorch.rand((2, 3)))
+        self.scale = minitorch.Parameter(minitorch.Scalar(0.5))
+        self.count = minitorch.Parameter(3)
+
+
+@pytest.mark.task2_4
+def test_non_tensor_parameters(tmp_path):
+    "Scalar and number parameters are saved as 0-d arrays; other values are refused"
+    model = Mixed()
+    state = model.state_dict()
+    assert state["scale"].shape == () and state["count"].shape == ()
+
+    path = tmp_path / "model.ckpt"
+    model.save(path)
+    other = Mixed()
+    other.scale.update(minitorch.Scalar(2.0))
+    other.count.update(7)
+    other.load(path)
+    assert isinstance(other.scale.value, minitorch.Scalar)
+    assert other.scale.value.data == 0.5
+    assert other.count.value == 3 and isinstance(other.count.value, int)
+    assert_close(other.weights.value.to_numpy(), model.weights.value.to_numpy())
+
+    model.add_parameter("extra", None)
+    with pytest.raises(TypeError):
+        model.state_dict()
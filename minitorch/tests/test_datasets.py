@@ -0,0 +1,70 @@
+import importlib.util
+import pathlib
+import numpy as np
+import pytest
+
+# The project scripts are not a package, so load the module from its file.
+_spec = importlib.util.spec_from_file_location(
+    "datasets", pathlib.Path(__file__).parents[1] / "project" / "datasets.py"
+)
+datasets = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(datasets)
+
+RULES = {
+    datasets.Simple: lambda x_1, x_2: x_1 < 0.5,
+    datasets.Split: lambda x_1, x_2: x_1 < 0.2 or x_1 > 0.8,
+    datasets.Xor: lambda x_1, x_2: (x_1 < 0.5 and x_2 > 0.5) or (x_1 > 0.5 and x_2 < 0.5),
+}
+
+
+@pytest.mark.task2_4
+def test_make_pts_seed():
+    "Seeded points are reproducible and lie in the unit square"
+    X = datasets.make_pts(100, seed=3)
+    assert X.shape == (100, 2)
+    assert ((X >= 0.0) & (X < 1.0)).all()
+    assert np.array_equal(X, datasets.make_pts(100, seed=3))
+    assert not np.array_equal(X, datasets.make_pts(100, seed=4))
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize("dataset", list(RULES))
+def test_labels(dataset):
+    "Vectorized labels match the per-point rule"
+    data = dataset(200, seed=0)
+    expected = [int(RULES[dataset](x_1, x_2)) for x_1, x_2 in data.X]
+    assert data.y.tolist() == expected
+    assert np.array_equal(dataset(200, seed=0).X, data.X)
+
+
+@pytest.mark.task2_4
+def test_stream():
+    "Streams yield full batches, a smaller last batch and the requested total"
+    batches = list(datasets.Xor.stream(32, N=100, seed=1))
+    assert [len(X) for X, _ in batches] == [32, 32, 32, 4]
+    for X, y in batches:
+        assert np.array_equal(y, datasets.Xor.labels(X))
+
+    unbounded = datasets.Simple.stream(10, seed=1)
+    assert [len(next(unbounded)[0]) for _ in range(5)] == [10] * 5
+
+
+@pytest.mark.task2_4
+def test_save_frames(tmp_path):
+    "Frames are written to `save_dir`, with the surface on a grid of the given resolution"
+    data = datasets.Xor(20, seed=0, save_dir=tmp_path / "frames", resolution=5)
+    assert data.grid()[0].shape == (5, 5)
+    calls = []
+
+    def model(points):
+        calls.append(len(points))
+        return points[:, 0]
+
+    data.graph("first", model)
+    data.graph("second")
+    assert calls == [25]
+    assert sorted(p.name for p in (tmp_path / "frames").iterdir()) == [
+        "frame_0000.png",
+        "frame_0001.png",
+    ]
+    assert (tmp_path / "frames" / "frame_0000.png").read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
@@ -0,0 +1,221 @@
+import functools
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists
+from minitorch import operators as op
+from minitorch import fast_ops
+from .strategies import small_floats, assert_close
+
+arrays = lists(small_floats, min_size=1, max_size=20).map(np.array)
+
+UNARY = [op.id, op.neg, op.relu, op.exp, op.inv]
+BINARY = [op.add, op.mul, op.max, op.lt, op.eq, op.relu_back, op.inv_back]
+
+
+@pytest.mark.task3_1
+@pytest.mark.parametrize("fn", UNARY)
+@given(arrays)
+def test_map_dispatch(fn, a):
+    "Known primitives run through numpy and agree with the list version"
+    if fn in (op.exp,):
+        a = a / 10.0
+    if fn in (op.inv,):
+        a = a[np.abs(a) > 1e-3]
+    out = op.map(fn)(a)
+    assert isinstance(out, np.ndarray)
+    assert_close(out, op.map(fn)(list(a)))
+
+
+@pytest.mark.task3_1
+@pytest.mark.parametrize("fn", BINARY)
+@given(arrays)
+def test_zip_dispatch(fn, a):
+    b = a[::-1].copy() + 1.0
+    if fn is op.inv_back:
+        b = b[np.abs(a) > 1e-3]
+        a = a[np.abs(a) > 1e-3]
+    out = op.zipWith(fn)(a, b)
+    assert isinstance(out, np.ndarray)
+    assert_close(out, op.zipWith(fn)(list(a), list(b)))
+
+
+@pytest.mark.task3_1
+@given(arrays)
+def test_reduce_dispatch(a):
+    assert_close(op.sum(a), sum(a))
+    assert_close(op.reduce(op.max, -1e9)(a), max(a))
+    assert_close(op.prod(a[:3] / 10.0), op.prod(list(a[:3] / 10.0)))
+
+
+def square_plus(x):
+    return x * x + 1.0
+
+
+def sub(x, y):
+    return x - y
+
+
+@pytest.mark.task3_1
+@given(arrays)
+def test_compiled_fallback(a):
+    "Functions without a kernel are compiled and match the list version"
+    assert_close(op.map(square_plus)(a), op.map(square_plus)(list(a)))
+    assert_close(op.zipWith(sub)(a, a * 2), op.zipWith(sub)(list(a), list(a * 2)))
+    assert_close(op.reduce(sub, 0.0)(a), op.reduce(sub, 0.0)(list(a)))
+
+
+@pytest.mark.task3_1
+def test_compiled_loops(monkeypatch):
+    "The compiled loops match the Python loops"
+    monkeypatch.setattr(fast_ops, "COMPILE_MIN_SIZE", 0)
+    a = np.linspace(-3.0, 3.0, 7)
+    assert_close(op.map(square_plus)(a), op.map(square_plus)(list(a)))
+    assert_close(op.zipWith(sub)(a, a * 2), op.zipWith(sub)(list(a), list(a * 2)))
+    assert_close(op.reduce(sub, 0.0)(a), op.reduce(sub, 0.0)(list(a)))
+    assert fast_ops._COMPILED[("map", square_plus)].__name__ != "bound"
+
+
+@pytest.mark.task3_1
+@pytest.mark.parametrize("min_size", [0, fast_ops.COMPILE_MIN_SIZE])
+def test_python_fallback(min_size, monkeypatch):
+    "Functions numba cannot compile or type still run"
+    monkeypatch.setattr(fast_ops, "COMPILE_MIN_SIZE", min_size)
+    table = {1.0: 10.0}
+
+    def lookup(x):
+        return table.get(x, 0.0)
+
+    np.testing.assert_array_equal(op.map(lookup)(np.array([1.0, 2.0])), [10.0, 0.0])
+    np.testing.assert_array_equal(op.map(math.sqrt)(np.array([0.0, 1.0, 4.0, 9.0])), [0.0, 1.0, 2.0, 3.0])
+    assert op.zipWith(math.pow)(np.array([2.0]), np.array([3.0])) == [8.0]
+    assert op.reduce(math.hypot, 0.0)(np.array([3.0, 4.0])) == 5.0
+
+
+@pytest.mark.task3_1
+def test_small_inputs_not_compiled(monkeypatch):
+    monkeypatch.setattr(fast_ops, "_COMPILED", {})
+    op.map(lambda x: x + 1.0)(np.arange(10.0))
+    assert fast_ops._COMPILED == {}
+
+
+@pytest.mark.task3_1
+def test_compiled_cache_bounded(monkeypatch):
+    monkeypatch.setattr(fast_ops, "_COMPILED", {})
+    monkeypatch.setattr(fast_ops, "COMPILE_MIN_SIZE", 0)
+    monkeypatch.setattr(fast_ops, "COMPILED_CACHE_SIZE", 3)
+    fns = [functools.partial(math.pow, float(i)) for i in range(5)]
+    for fn in fns:
+        op.map(fn)(np.array([2.0]))
+    assert list(fast_ops._COMPILED) == [("map", fn) for fn in fns[2:]]
+
+
+@pytest.mark.task3_1
+def test_strided_kernels():
+    "Kernels read and write through strides without copying the output"
+    storage = np.arange(12, dtype=np.float64)
+    out = np.zeros(12)
+    # Transposed (4, 3) view of a (3, 4) buffer.
+    fast_ops.map_kernel(op.neg)(out, (4, 3), (3, 1), storage, (4, 3), (1, 4))
+    np.testing.assert_array_equal(out.reshape(4, 3), -storage.reshape(3, 4).T)
+
+    fast_ops.zip_kernel(op.add)(
+        out, (4, 3), (3, 1), storage, (4, 3), (1, 4), storage, (4, 3), (1, 4)
+    )
+    np.testing.assert_array_equal(out.reshape(4, 3), 2 * storage.reshape(3, 4).T)
+    assert fast_ops.reduce_kernel(op.add, 0.0)(storage, (2, 3), (6, 2)) == sum(
+        storage[[0, 2, 4, 6, 8, 10]]
+    )
+
+
+@pytest.mark.task3_1
+def test_register():
+    def cube(x):
+        return x ** 3
+
+    calls = []
+
+    def cube_kernel(a, out):
+        calls.append(a.shape)
+        return np.power(a, 3, out=out)
+
+    fast_ops.register(cube, cube_kernel)
+    try:
+        np.testing.assert_array_equal(op.map(cube)(np.array([2.0])), [8.0])
+        assert calls == [(1,)]
+    finally:
+        del fast_ops.UNARY_KERNELS[cube]
+
+
+@pytest.mark.task3_1
+def test_sigmoid_stable():
+    a = np.array([-1000.0, -1.0, 0.0, 1.0, 1000.0])
+    out = op.map(op.sigmoid)(a)
+    assert np.all(np.isfinite(out))
+    assert_close(out, [0.0, 1 / (1 + math.e), 0.5, 1 / (1 + math.exp(-1)), 1.0])
+
+
+@pytest.fixture
+def threads(monkeypatch):
+    "Four threads and tiny chunks, so small tensors take the parallel path."
+    monkeypatch.setattr(fast_ops, "PARALLEL_CHUNK", 7)
+    previous = fast_ops.get_num_threads()
+    fast_ops.set_num_threads(4)
+    yield
+    fast_ops.set_num_threads(previous)
+
+
+@pytest.mark.task3_1
+def test_parallel_kernels(threads):
+    "Chunked kernels match numpy on contiguous, permuted and broadcast inputs"
+    import minitorch
+
+    backend = minitorch.SimpleBackend
+    rng = np.random.default_rng(0)
+    a = minitorch.tensor(rng.random((5, 6, 7)))._tensor
+    b = minitorch.tensor(rng.random((6, 1)))._tensor
+    a_np, b_np = a.to_numpy(), b.to_numpy()
+
+    assert_close(backend.neg_map(a).to_numpy(), -a_np)
+    assert_close(backend.exp_map(a.permute(2, 0, 1)).to_numpy(), np.exp(a_np.transpose(2, 0, 1)))
+    assert_close(backend.mul_zip(a, b).to_numpy(), a_np * b_np)
+    for dim in range(3):
+        assert_close(backend.add_reduce(a, dim).to_numpy(), a_np.sum(dim, keepdims=True))
+    assert_close(
+        backend.mul_reduce(a.permute(1, 2, 0), 2).to_numpy(),
+        a_np.transpose(1, 2, 0).prod(2, keepdims=True),
+    )
+    assert_close(op.reduce(op.add, 1.5)(a_np.reshape(-1)), a_np.sum() + 1.5)
+
+    c = minitorch.tensor(rng.random((7, 9)))._tensor
+    assert_close(backend.matrix_multiply(a, c).to_numpy(), a_np @ c.to_numpy())
+
+
+@pytest.mark.task3_1
+def test_pool_created_once(threads, monkeypatch):
+    "Concurrent first calls share one pool"
+    created = []
+
+    class SlowPool(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            time.sleep(0.05)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(fast_ops, "ThreadPoolExecutor", SlowPool)
+    barrier = threading.Barrier(4)
+
+    def first_call():
+        barrier.wait()
+        fast_ops._run_chunks(lambda x: x, [(1,), (2,)])
+
+    callers = [threading.Thread(target=first_call) for _ in range(4)]
+    for t in callers:
+        t.start()
+    for t in callers:
+        t.join()
+    assert len(created) == 1
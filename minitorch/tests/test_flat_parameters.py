@@ -0,0 +1,105 @@
+import minitorch
+import numpy as np
+import pytest
+from .strategies import assert_close
+
+
+class Layer(minitorch.Module):
+    def __init__(self, in_size, out_size):
+        super().__init__()
+        self.weights = minitorch.Parameter(minitorch.rand((in_size, out_size)) - 0.5)
+        self.bias = minitorch.Parameter(minitorch.rand((out_size,)) - 0.5)
+
+    def forward(self, x):
+        return minitorch.linear(x, self.weights.value, self.bias.value)
+
+
+class Network(minitorch.Module):
+    def __init__(self):
+        super().__init__()
+        self.layer1 = Layer(2, 3)
+        self.layer2 = Layer(3, 1)
+
+    def forward(self, x):
+        return self.layer2(self.layer1(x).relu()).sigmoid()
+
+
+@pytest.mark.task2_4
+def test_flatten_views():
+    "Parameter values become views into one buffer"
+    model = Network()
+    before = [p.value.to_numpy().copy() for p in model.parameters()]
+    flat = model.flatten_parameters()
+    assert len(flat) == 6 + 3 + 3 + 1
+    assert_close(flat.data, np.concatenate([b.reshape(-1) for b in before]))
+
+    flat.data[...] = np.arange(len(flat))
+    assert_close(model.layer1.bias.value.to_numpy(), [6.0, 7.0, 8.0])
+
+    # Updates write through to the buffer.
+    model.layer2.bias.update(minitorch.tensor([-1.0]))
+    assert flat.data[-1] == -1.0
+    assert model.layer2.bias.value.shape == (1,)
+
+
+@pytest.mark.task2_4
+def test_flat_sgd():
+    "A flat SGD step matches the per-parameter update"
+    X = minitorch.tensor([[0.1, 0.2], [0.5, -0.3], [-0.4, 0.9]])
+    model = Network()
+    reference = Network()
+    for p, q in zip(model.parameters(), reference.parameters()):
+        q.update(p.value.detach() * 1.0)
+    flat = model.flatten_parameters()
+
+    for step in range(3):
+        flat.zero_grad()
+        model(X).sum().view(1).backward()
+        flat.sgd_step(0.5)
+
+        for q in reference.parameters():
+            q.value.zero_grad_()
+        reference(X).sum().view(1).backward()
+        for q in reference.parameters():
+            q.update(q.value.detach() - 0.5 * q.value.grad)
+
+    for p, q in zip(model.parameters(), reference.parameters()):
+        assert_close(p.value.to_numpy(), q.value.to_numpy())
+
+    # Gradients zeroed on a single tensor are folded back into the buffer.
+    model.layer1.weights.value.zero_grad_()
+    flat.zero_grad()
+    assert model.layer1.weights.value.grad is not None
+    assert not flat.grad.any()
+
+
+@pytest.mark.task2_4
+def test_flat_state():
+    "Checkpoints are one copy of the buffer"
+    model = Network()
+    flat = model.flatten_parameters()
+    state = flat.state()
+    flat.data += 1.0
+    flat.load_state(state)
+    assert_close(flat.data, state)
+    assert_close(model.layer1.weights.value.to_numpy().reshape(-1), state[:6])
+
+
+@pytest.mark.task2_4
+def test_frozen_parameters():
+    "Frozen parameters record nothing and stay frozen through updates"
+    X = minitorch.tensor([[0.1, 0.2], [0.5, -0.3]])
+    model = Network()
+    model.requires_grad_(False)
+    out = model(X)
+    assert out.history is None
+
+    model.layer1.bias.update(minitorch.tensor([0.0, 0.0, 0.0]))
+    assert model.layer1.bias.value.history is None
+    flat = model.flatten_parameters()
+    assert model(X).history is None
+
+    model.requires_grad_(True)
+    flat.zero_grad()
+    model(X).sum().view(1).backward()
+    assert flat.grad.any()
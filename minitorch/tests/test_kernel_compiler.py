@@ -0,0 +1,84 @@
+import minitorch
+import numpy as np
+import pytest
+from minitorch import operators
+from minitorch.kernel_compiler import call, parse
+from .strategies import assert_close
+
+EXPRESSIONS = [
+    "relu(add(mul(x, w), b))",
+    "sigmoid_back(x, mul(sigmoid(x), w))",
+    "log(add(exp(neg(x)), inv(add(w, 2.0))))",
+    "max(lt(x, w), eq(b, 0.5))",
+    "inv_back(add(x, 1.5), log_back(add(w, 1.0), exp_back(b, relu_back(x, w))))",
+]
+
+
+def scalar_reference(expression, inputs):
+    "The expression evaluated element by element with the scalar operators."
+    fns = {name: getattr(operators, name) for name in minitorch.kernel_compiler.PRIMITIVES}
+    code = compile(expression, "<expression>", "eval")
+    columns = np.broadcast_arrays(*inputs.values())
+    return np.array(
+        [
+            eval(code, fns, dict(zip(inputs, values)))
+            for values in zip(*[c.reshape(-1) for c in columns])
+        ]
+    ).reshape(columns[0].shape)
+
+
+@pytest.mark.task0_3
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+@pytest.mark.parametrize("mode", ["numpy", "loop"])
+def test_compiled_kernel(expression, mode):
+    "Compiled kernels match composing the scalar operators"
+    rng = np.random.default_rng(0)
+    inputs = {"x": rng.random((20, 3)), "w": rng.random(3), "b": rng.random((20, 1))}
+    kernel = minitorch.compile_kernel(expression, mode)
+    args = [inputs[name] for name in kernel.inputs]
+    expected = scalar_reference(expression, {name: inputs[name] for name in kernel.inputs})
+    assert_close(kernel(*args), expected)
+
+    out = np.empty(expected.shape)
+    assert kernel(*args, out=out) is out
+    assert_close(out, expected)
+
+
+@pytest.mark.task0_3
+def test_kernel_cache():
+    "Kernels are cached by the structure of the expression"
+    a = minitorch.compile_kernel("relu(add(mul(x, w), b))")
+    b = minitorch.compile_kernel("relu(add(mul(p, q), r))")
+    c = minitorch.compile_kernel(
+        call(operators.relu, call(operators.add, call(operators.mul, "x", "w"), "b"))
+    )
+    assert a.inputs == ("x", "w", "b") and b.inputs == ("p", "q", "r")
+    assert a.source is b.source and a._fn is b._fn and c._fn is a._fn
+    assert minitorch.compile_kernel("relu(add(mul(x, w), x))")._fn is not a._fn
+
+    # Inputs can also be given by name.
+    x = np.array([-1.0, 2.0])
+    assert_close(a(x, b=1.0, w=2.0), [0.0, 5.0])
+
+    with pytest.raises(ValueError):
+        parse("relu(x) + 1")
+    with pytest.raises(ValueError):
+        parse("softmax(x)")
+
+
+@pytest.mark.task0_3
+@pytest.mark.parametrize("mode", ["numpy", "loop"])
+def test_special_constants(mode):
+    "Infinite and nan constants compile in both modes"
+    x = np.array([-1.0, 0.5, 2.0])
+    kernel = minitorch.compile_kernel(
+        call(
+            operators.add,
+            call(operators.max, "x", float("-inf")),
+            call(operators.lt, "x", float("inf")),
+        ),
+        mode,
+    )
+    assert_close(kernel(x), x + 1.0)
+    kernel = minitorch.compile_kernel(call(operators.mul, "x", float("nan")), mode)
+    assert np.isnan(kernel(x)).all()
@@ -0,0 +1,103 @@
+import tracemalloc
+import minitorch
+import numpy as np
+import pytest
+from .strategies import assert_close
+
+
+def loss(out, y):
+    probs = (out * y) + (out - 1.0) * (y - 1.0)
+    return -probs.log().sum()
+
+
+def leaves(seed=0, n=1000):
+    rng = np.random.default_rng(seed)
+    out = minitorch.tensor(list(rng.random(n) * 0.98 + 0.01), requires_grad=True)
+    y = minitorch.tensor(list((rng.random(n) > 0.5) * 1.0))
+    return out, y
+
+
+@pytest.mark.task2_4
+def test_lazy_loss():
+    "A lazy loss matches the eager loss and its gradient"
+    out, y = leaves()
+    eager = loss(out, y)
+    eager.backward()
+    expected = out.grad.to_numpy().copy()
+
+    out.zero_grad_()
+    with minitorch.lazy_mode():
+        probs = (out * y) + (out - 1.0) * (y - 1.0)
+        assert isinstance(probs, minitorch.LazyTensor)
+        total = probs.log().sum()
+        assert not isinstance(total, minitorch.LazyTensor)
+        lazy = -total
+    assert_close(lazy.item(), eager.item())
+    lazy.backward()
+    assert_close(out.grad.to_numpy(), expected)
+
+    # Outside lazy mode operations are eager again.
+    assert not isinstance(out * y, minitorch.LazyTensor)
+
+
+@pytest.mark.task2_4
+def test_lazy_broadcast():
+    "Broadcast leaves, shared subexpressions and materialization"
+    x = minitorch.rand((50, 4), requires_grad=True)
+    b = minitorch.rand((4,), requires_grad=True)
+
+    def expression(x, b):
+        h = (x * 2.0 + b).sigmoid()
+        return h * h + (x < 0.5) * (-b).exp() + 1.0 / (h + 1.0)
+
+    eager = expression(x, b)
+    eager.sum().view(1).backward()
+    expected = [x.grad.to_numpy().copy(), b.grad.to_numpy().copy()]
+    x.zero_grad_()
+    b.zero_grad_()
+
+    with minitorch.lazy_mode():
+        lazy = expression(x, b)
+        assert lazy.shape == (50, 4)
+        # Any other operation evaluates the expression.
+        assert_close(lazy.sum(1).to_numpy(), eager.sum(1).to_numpy())
+    assert_close(lazy.materialize().to_numpy(), eager.to_numpy())
+    lazy.materialize().sum().view(1).backward()
+    assert_close(x.grad.to_numpy(), expected[0])
+    assert_close(b.grad.to_numpy(), expected[1])
+
+
+@pytest.mark.task2_4
+def test_lazy_memory():
+    "A lazy full sum allocates far less than the eager intermediates"
+    out, y = leaves(n=200000)
+
+    def peak(fn):
+        tracemalloc.start()
+        fn()
+        _, top = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return top
+
+    def lazy():
+        with minitorch.lazy_mode():
+            return loss(out, y)
+
+    eager = peak(lambda: loss(out, y))
+    assert peak(lazy) < eager / 4
+
+
+@pytest.mark.task2_4
+def test_lazy_empty():
+    "Expressions over tensors with no rows evaluate and backpropagate"
+    x = minitorch.zeros((0, 3))
+    x.requires_grad_(True)
+    b = minitorch.rand((3,), requires_grad=True)
+    with minitorch.lazy_mode():
+        out = (x * b + 1.0).exp()
+        total = out.sum()
+    assert out.materialize().shape == (0, 3)
+    assert total.item() == 0.0
+    total.view(1).backward()
+    assert x.grad.shape == (0, 3)
+    assert_close(b.grad.to_numpy(), np.zeros(3))
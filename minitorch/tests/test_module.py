@@ -69,3 +69,119 @@ def test_stacked_module():
     assert named_parameters["module_a.parameter_b"].value == VAL_B
     assert named_parameters["module_b.parameter_a"].value == VAL_A
     assert named_parameters["module_b.parameter_b"].value == VAL_B
+
+
+@pytest.mark.task0_4
+def test_parameter_registry():
+    "The parameter tuple is cached and rebuilt when the tree changes"
+    module = Module1()
+    params = module.parameters()
+    assert module.parameters() is params
+    assert list(module.named_parameters().values()) == list(params)
+
+    # Adding to a submodule invalidates the parent's registry.
+    module.module_a.add_parameter("late", 1)
+    assert len(module.parameters()) == len(params) + 1
+    assert module.named_parameters()["module_a.late"].value == 1
+
+    module.module_c = Module2()
+    named_parameters = module.named_parameters()
+    assert len(named_parameters) == len(params) + 3
+    assert named_parameters["module_c.parameter_b"].value == VAL_B
+
+    # Updating a value keeps the same Parameter objects.
+    params = module.parameters()
+    module.parameter_a.update(VAL + 1)
+    assert module.parameters() is params
+    assert module.named_parameters()["parameter_a"].value == VAL + 1
+
+
+@pytest.mark.task0_4
+def test_module_attributes():
+    "Parameters and submodules behave as plain attributes"
+    module = Module1()
+    assert module.module_a.parameter_b.value == VAL_B
+    with pytest.raises(AttributeError):
+        module.missing
+
+    module.parameter_a = 5
+    assert module.parameter_a == 5
+    assert "parameter_a" not in module.named_parameters()
+
+    del module.module_b
+    assert len(module.parameters()) == 7
+    assert "module_b" not in repr(module)
+    with pytest.raises(AttributeError):
+        module.module_b
+
+
+@pytest.mark.task0_4
+def test_plain_attributes():
+    "Parameters and submodules are ordinary instance attributes, with no `__getattr__` hook"
+    module = Module1()
+    assert not hasattr(minitorch.Module, "__getattr__")
+    assert vars(module)["parameter_a"] is module._parameters["parameter_a"]
+    assert vars(module)["module_a"] is module._modules["module_a"]
+
+
+class Scale(minitorch.Module):
+    def __init__(self, factor):
+        super().__init__()
+        self.factor = factor
+
+    def forward(self, x):
+        return x * self.factor
+
+
+class Chain(minitorch.Module):
+    def __init__(self):
+        super().__init__()
+        self.first = Scale(2.0)
+        self.second = Scale(3.0)
+
+    def forward(self, x):
+        return self.second(self.first(x))
+
+
+@pytest.mark.task0_4
+def test_forward_hooks():
+    "Pre hooks can replace the args and post hooks the output"
+    module = Chain()
+    seen = []
+    pre = module.first.register_forward_pre_hook(lambda m, args: (args[0] + 1.0,))
+    post = module.second.register_forward_hook(lambda m, args, out: seen.append(out))
+    assert module(1.0) == 12.0
+    assert seen == [12.0]
+
+    double = module.register_forward_hook(lambda m, args, out: out * 2)
+    assert module(1.0) == 24.0
+    for handle in (pre, post, double):
+        handle.remove()
+    assert module(1.0) == 6.0
+    assert seen == [12.0, 12.0]
+
+
+@pytest.mark.task0_4
+def test_profiler(tmp_path):
+    "The profile tree mirrors the modules and counts every call"
+    import json
+
+    module = Chain()
+    with module.profile() as prof:
+        for _ in range(3):
+            module(1.0)
+    module(1.0)
+
+    nodes = {node.name: node for _, node in prof.root.walk()}
+    assert list(nodes) == ["Chain", "first", "second"]
+    assert [node.calls for node in nodes.values()] == [3, 3, 3]
+    assert nodes["first"].output_size == 3
+    assert prof.root.total_time >= nodes["first"].total_time + nodes["second"].total_time
+    assert "second (Scale)" in prof.table()
+
+    path = tmp_path / "trace.json"
+    prof.chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert len(events) == 9
+    assert {e["name"] for e in events} == {"Chain", "first", "second"}
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
@@ -1,4 +1,8 @@
+import math
+import warnings
+import numpy as np
 from minitorch import operators as op
+from minitorch import array_operators as aop
 from hypothesis import given
 from hypothesis.strategies import lists
 from .strategies import small_floats, assert_close
@@ -35,6 +39,18 @@ def test_symmetric(x, y):
     assert op.eq(x, y) == op.eq(y, x)
 
 
+@pytest.mark.task0_2
+@given(small_floats, small_floats)
+def test_lt(x, y):
+    "lt is less than, for floats, arrays and the list version alike"
+    assert op.lt(x, y) == (1.0 if x < y else 0.0)
+    assert op.lt(x, x) == 0.0
+    if x != y:
+        assert op.lt(x, y) + op.lt(y, x) == 1.0
+    assert aop.lt(np.array([x]), np.array([y]))[0] == op.lt(x, y)
+    assert op.zipWith(op.lt)([x], [y]) == [op.lt(x, y)]
+
+
 @pytest.mark.task0_2
 @given(small_floats, small_floats, small_floats)
 def test_distribute(x, y, z):
@@ -84,3 +100,82 @@ def test_sum(ls):
 @given(small_floats, small_floats, small_floats)
 def test_prod(x, y, z):
     assert_close(op.prod([x, y, z]), x * y * z)
+
+
+## Array versions
+
+
+unary_arrays = [
+    ("id", lambda x: x),
+    ("neg", lambda x: x),
+    ("relu", lambda x: x),
+    ("sigmoid", lambda x: x),
+    ("exp", lambda x: x),
+    ("log", lambda x: abs(x) + 1e-3),
+    ("inv", lambda x: x if abs(x) > 1e-3 else 1.0),
+]
+
+binary_arrays = [
+    ("add", lambda x: x),
+    ("mul", lambda x: x),
+    ("lt", lambda x: x),
+    ("eq", lambda x: x),
+    ("max", lambda x: x),
+    ("relu_back", lambda x: x),
+    ("sigmoid_back", lambda x: x),
+    ("exp_back", lambda x: x),
+    ("log_back", lambda x: abs(x) + 1e-3),
+    ("inv_back", lambda x: x if abs(x) > 1e-3 else 1.0),
+]
+
+
+@pytest.mark.task0_2
+@pytest.mark.parametrize("fn", unary_arrays)
+@given(lists(small_floats, min_size=1))
+def test_array_unary(fn, ls):
+    "Array primitives match the scalar ones, also when writing in place"
+    name, domain = fn
+    xs = [domain(x) for x in ls]
+    expected = [getattr(op, name)(x) for x in xs]
+    a = np.array(xs)
+    assert_close(getattr(aop, name)(a), expected)
+    assert getattr(aop, name)(a, out=a) is a
+    assert_close(a, expected)
+
+
+@pytest.mark.task0_2
+@pytest.mark.parametrize("fn", binary_arrays)
+@given(lists(small_floats, min_size=1), small_floats)
+def test_array_binary(fn, ls, d):
+    name, domain = fn
+    xs = [domain(x) for x in ls]
+    expected = [getattr(op, name)(x, d) for x in xs]
+    a = np.array(xs)
+    b = np.full(len(xs), d)
+    assert_close(getattr(aop, name)(a, b), expected)
+    assert_close(getattr(aop, name)(a, d), expected)
+    getattr(aop, name)(a, b, out=b)
+    assert_close(b, expected)
+
+
+@pytest.mark.task0_2
+def test_array_extremes():
+    "No overflow, nan or warnings over the full float range"
+    x = np.array([-1e308, -1000.0, -1.0, 0.0, 1.0, 1000.0, 1e308])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        s = aop.sigmoid(x)
+        assert_close(s, [0.0, 0.0, op.sigmoid(-1.0), 0.5, op.sigmoid(1.0), 1.0, 1.0])
+        assert_close(aop.sigmoid_back(x, 1.0), [0.0, 0.0, 0.19661, 0.25, 0.19661, 0.0, 0.0])
+        assert np.isinf(aop.exp(x)[-1]) and aop.exp(x)[0] == 0.0
+        assert_close(aop.inv_back(np.array([1e200, -1e200]), 1e200), [-1e-200, -1e-200])
+        assert aop.relu_back(np.array([-1.0, 1.0]), np.inf).tolist() == [0.0, np.inf]
+        assert np.isinf(aop.inv(np.array([0.0]))[0])
+
+
+@pytest.mark.task0_2
+@given(small_floats)
+def test_sigmoid(a):
+    "The scalar sigmoid is 1 / (1 + e^-a) on both branches"
+    assert_close(op.sigmoid(a), 1.0 / (1.0 + math.exp(-a)))
+    assert_close(op.sigmoid(a) + op.sigmoid(-a), 1.0)
@@ -0,0 +1,100 @@
+import pytest
+from hypothesis import given
+from .strategies import scalars, small_floats, assert_close
+from minitorch import Scalar, derivative_check, central_difference, operators
+
+
+one_arg = [
+    ("neg", lambda a: -a),
+    ("add constant", lambda a: a + 2.0),
+    ("mul constant", lambda a: 5.0 * a),
+    ("sub constant", lambda a: a - 10.0),
+    ("relu", lambda a: (a + 5.3).relu()),
+    ("square", lambda a: a * a),
+    ("cube", lambda a: a * a * a),
+    ("exp", lambda a: (a - 200).exp()),
+    ("log", lambda a: (a.relu() + 100000).log()),
+    ("div", lambda a: a / 5.0),
+    ("inv", lambda a: 1.0 / (a * a + 3.5)),
+]
+
+two_arg = [
+    ("add", lambda a, b: a + b),
+    ("mul", lambda a, b: a * b),
+    ("sub", lambda a, b: a - b),
+    ("div", lambda a, b: a / (b * b + 5.5)),
+    ("mix", lambda a, b: (a * a + b * 3.0 - a * b) * 0.001),
+]
+
+
+@pytest.mark.task1_1
+def test_central_diff():
+    d = central_difference(operators.id, 5, arg=0)
+    assert_close(d, 1.0)
+
+    d = central_difference(operators.add, 5, 10, arg=0)
+    assert_close(d, 1.0)
+
+    d = central_difference(operators.mul, 5, 10, arg=0)
+    assert_close(d, 10.0)
+
+    d = central_difference(operators.mul, 5, 10, arg=1)
+    assert_close(d, 5.0)
+
+    d = central_difference(operators.exp, 2, arg=0)
+    assert_close(d, operators.exp(2))
+
+
+@pytest.mark.task1_2
+@given(small_floats, small_floats)
+def test_simple(a, b):
+    # Simple add
+    c = Scalar(a) + Scalar(b)
+    assert_close(c.data, a + b)
+
+    # Simple mul
+    c = Scalar(a) * Scalar(b)
+    assert_close(c.data, a * b)
+
+    # Simple relu
+    c = Scalar(a).relu() + Scalar(b).relu()
+    assert_close(c.data, operators.relu(a) + operators.relu(b))
+
+    # Add others
+    c = Scalar(a).relu() + Scalar(b).relu()
+    assert_close(c.data, operators.relu(a) + operators.relu(b))
+
+    assert (Scalar(a) < Scalar(b)).data == float(a < b)
+    assert (Scalar(a) > Scalar(b)).data == float(a > b)
+    assert (Scalar(a) == Scalar(b)).data == float(a == b)
+
+
+@pytest.mark.task1_4
+@pytest.mark.parametrize("fn", one_arg)
+@given(scalars(min_value=-100, max_value=100))
+def test_one_derivative(fn, t1):
+    name, f = fn
+    derivative_check(f, t1)
+
+
+@pytest.mark.task1_4
+@pytest.mark.parametrize("fn", two_arg)
+@given(scalars(min_value=-100, max_value=100), scalars(min_value=-100, max_value=100))
+def test_two_derivative(fn, t1, t2):
+    name, f = fn
+    derivative_check(f, t1, t2)
+
+
+@pytest.mark.task1_4
+def test_constants():
+    "Scalars without history are constants and get no derivative"
+    c = Scalar(3.0, None)
+    x = Scalar(2.0)
+    out = c * x + c
+    assert out.history is not None
+    out.backward()
+    assert x.derivative == 3.0
+    assert c.derivative is None
+
+    out = c * c
+    assert out.history is None
@@ -0,0 +1,204 @@
+import minitorch
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, data, permutations
+from .strategies import tensors, shaped_tensors, matmul_tensors, small_floats, assert_close
+from minitorch import grad_check, tensor
+
+
+one_arg = [
+    ("neg", lambda a: -a),
+    ("addConstant", lambda a: a + 5),
+    ("lt", lambda a: a < 2),
+    ("subConstant", lambda a: a - 5),
+    ("mult", lambda a: 5 * a),
+    ("div", lambda a: a / 5),
+    ("sig", lambda a: a.sigmoid()),
+    ("log", lambda a: (a + 100000).log()),
+    ("relu", lambda a: (a + 5.3).relu()),
+    ("exp", lambda a: (a - 200).exp()),
+]
+
+two_arg = [
+    ("add", lambda a, b: a + b),
+    ("mul", lambda a, b: a * b),
+    ("lt", lambda a, b: a < b + 0.5),
+    ("eq", lambda a, b: a == b + 0.5),
+    ("sub", lambda a, b: a - b),
+]
+
+# Comparisons have zero gradient, which central differences only
+# contradict at the step itself.
+grad_one_arg = [fn for fn in one_arg if fn[0] != "lt"]
+grad_two_arg = [fn for fn in two_arg if fn[0] not in ("lt", "eq")]
+
+red_arg = [
+    ("sum", lambda a: a.sum()),
+    ("mean", lambda a: a.mean()),
+    ("sum2", lambda a: a.sum(0)),
+    ("mean2", lambda a: a.mean(0)),
+]
+
+
+@pytest.mark.task2_3
+@given(lists(small_floats, min_size=1))
+def test_create(t1):
+    t2 = tensor(t1)
+    for i in range(len(t1)):
+        assert t1[i] == t2[i]
+    assert t2.shape == (len(t1),)
+
+
+@pytest.mark.task2_3
+@pytest.mark.parametrize("fn", one_arg)
+@given(tensors())
+def test_one_args(fn, t1):
+    name, base_fn = fn
+    t2 = base_fn(t1)
+    a = t1.to_numpy()
+    expected = {
+        "neg": lambda: -a,
+        "addConstant": lambda: a + 5,
+        "lt": lambda: (a < 2).astype(float),
+        "subConstant": lambda: a - 5,
+        "mult": lambda: 5 * a,
+        "div": lambda: a / 5,
+        "sig": lambda: 1.0 / (1.0 + np.exp(-a)),
+        "log": lambda: np.log(a + 100000 + minitorch.operators.EPS),
+        "relu": lambda: np.maximum(a + 5.3, 0),
+        "exp": lambda: np.exp(a - 200),
+    }[name]()
+    assert_close(t2.to_numpy(), expected)
+
+
+@pytest.mark.task2_3
+@pytest.mark.parametrize("fn", two_arg)
+@given(shaped_tensors(2))
+def test_two_args(fn, ts):
+    name, base_fn = fn
+    t1, t2 = ts
+    t3 = base_fn(t1, t2)
+    for ind in t3._tensor.indices():
+        assert_close(t3[ind], base_fn(minitorch.Scalar(t1[ind]), minitorch.Scalar(t2[ind])).data)
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize("fn", grad_one_arg)
+@given(tensors())
+def test_one_derivative(fn, t1):
+    name, base_fn = fn
+    grad_check(base_fn, t1)
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize("fn", grad_two_arg)
+@given(shaped_tensors(2))
+def test_two_grad(fn, ts):
+    name, base_fn = fn
+    t1, t2 = ts
+    grad_check(base_fn, t1, t2)
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize("fn", red_arg)
+@given(tensors())
+def test_reduce(fn, t1):
+    name, base_fn = fn
+    grad_check(base_fn, t1)
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize("fn", grad_two_arg)
+@given(shaped_tensors(2))
+def test_two_grad_broadcast(fn, ts):
+    "Test the grad of a two argument function"
+    name, base_fn = fn
+    t1, t2 = ts
+    grad_check(base_fn, t1, t2)
+
+    # broadcast check
+    grad_check(base_fn, t1.sum(0), t2)
+    grad_check(base_fn, t1, t2.sum(0))
+
+
+@pytest.mark.task2_4
+@given(data(), tensors())
+def test_permute(data, t1):
+    permutation = data.draw(permutations(range(len(t1.shape))))
+
+    def permute(a):
+        return a.permute(*permutation)
+
+    grad_check(permute, t1)
+
+
+@pytest.mark.task2_4
+def test_view():
+    t = tensor([[2, 3, 4], [4, 5, 7]])
+    assert t.shape == (2, 3)
+    t2 = t.view(6)
+    assert t2.shape == (6,)
+    t2 = t2.view(1, 6)
+    assert t2.shape == (1, 6)
+    t2 = t2.view(6, 1)
+    assert t2.shape == (6, 1)
+    t2 = t2.view(2, 3)
+    assert (t == t2).all().item() == 1.0
+
+    def view(a):
+        return a.permute(1, 0).contiguous().view(6)
+
+    grad_check(view, minitorch.rand((2, 3)))
+
+
+@pytest.mark.task3_2
+@given(matmul_tensors())
+def test_matmul(ts):
+    a, b = ts
+    assert_close((a @ b).to_numpy(), a.to_numpy() @ b.to_numpy())
+    grad_check(lambda a, b: a @ b, a, b)
+
+
+@pytest.mark.task3_2
+@pytest.mark.parametrize("relu", [False, True])
+@given(matmul_tensors())
+def test_fused_linear(relu, ts):
+    "The fused layer matches matmul + bias (+ relu) and its gradients"
+    x, w = ts
+    b = minitorch.rand((w.shape[1],))
+
+    def unfused(x, w, b):
+        out = x @ w + b
+        return out.relu() if relu else out
+
+    def fused(x, w, b):
+        return minitorch.linear(x, w, b, relu=relu)
+
+    assert_close(fused(x, w, b).to_numpy(), unfused(x, w, b).to_numpy())
+    grad_check(fused, x, w, b)
+
+    grads = []
+    for f in (fused, unfused):
+        for t in (x, w, b):
+            t.requires_grad_(True)
+            t.zero_grad_()
+        f(x, w, b).sum().backward()
+        grads.append([t.grad.to_numpy() for t in (x, w, b)])
+    for g1, g2 in zip(*grads):
+        assert_close(g1, g2)
+
+
+@pytest.mark.task2_4
+def test_parameter_grad():
+    "Gradients accumulate on Parameter values until zeroed"
+    p = minitorch.Parameter(tensor([1.0, 2.0]))
+    for step in range(2):
+        (p.value * p.value).sum().backward()
+        assert_close(p.value.grad.to_numpy(), [2.0 * (step + 1), 4.0 * (step + 1)])
+    p.value.zero_grad_()
+    assert p.value.grad is None
+
+    p.update(p.value - 1.0)
+    (p.value * 3.0).sum().backward()
+    assert_close(p.value.grad.to_numpy(), [3.0, 3.0])
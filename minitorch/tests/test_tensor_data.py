@@ -0,0 +1,121 @@
+import minitorch
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import data
+from .strategies import tensor_data, indices
+from minitorch import TensorData, IndexingError
+
+
+@pytest.mark.task2_1
+def test_layout():
+    "Test basis properties of layout and strides"
+    data = [0] * 3 * 5
+    tensor_data = minitorch.TensorData(data, (3, 5), (5, 1))
+
+    assert tensor_data.is_contiguous()
+    assert tensor_data.shape == (3, 5)
+    assert tensor_data.index((1, 0)) == 5
+    assert tensor_data.index((1, 2)) == 7
+
+    tensor_data = minitorch.TensorData(data, (5, 3), (1, 5))
+    assert tensor_data.shape == (5, 3)
+    assert not tensor_data.is_contiguous()
+
+    data = [0] * 4 * 2 * 2
+    tensor_data = minitorch.TensorData(data, (4, 2, 2))
+    assert tensor_data.strides == (4, 2, 1)
+
+
+@pytest.mark.task2_1
+def test_layout_bad():
+    "Test bad layouts"
+    with pytest.raises(IndexingError):
+        minitorch.TensorData([0] * 3 * 5, (3, 5), (6,))
+    with pytest.raises(IndexingError):
+        minitorch.TensorData([0] * 3 * 5, (3, 5), (6, 1))
+
+
+@pytest.mark.task2_1
+@given(tensor_data())
+def test_enumeration(tensor_data):
+    "Test enumeration of tensor_datas."
+    indices = list(tensor_data.indices())
+
+    # Check that enough positions are enumerated.
+    assert len(indices) == tensor_data.size
+
+    # Check that enough positions are enumerated only once.
+    assert len(set(tensor_data.indices())) == len(indices)
+
+    # Check that all indices are within the shape.
+    for ind in tensor_data.indices():
+        for i, p in enumerate(ind):
+            assert p >= 0 and p < tensor_data.shape[i]
+
+
+@pytest.mark.task2_1
+@given(tensor_data())
+def test_index(tensor_data):
+    "Test enumeration of tensor_data."
+    # Check that all indices are within the size.
+    for ind in tensor_data.indices():
+        pos = tensor_data.index(ind)
+        assert pos >= 0 and pos < tensor_data.size
+
+    base = [0] * tensor_data.dims
+    with pytest.raises(IndexingError):
+        base[0] = -1
+        tensor_data.index(tuple(base))
+
+    if tensor_data.dims > 1:
+        with pytest.raises(IndexingError):
+            base = [0] * (tensor_data.dims - 1)
+            tensor_data.index(tuple(base))
+
+
+@pytest.mark.task2_1
+@given(data())
+def test_permute(data):
+    td = data.draw(tensor_data())
+    ind = data.draw(indices(td))
+    td_rev = td.permute(*list(reversed(range(td.dims))))
+    assert td.index(ind) == td_rev.index(tuple(reversed(ind)))
+
+    td2 = td_rev.permute(*list(reversed(range(td_rev.dims))))
+    assert td.index(ind) == td2.index(ind)
+
+
+@pytest.mark.task2_1
+def test_views_share_storage():
+    "Permute, view and slices must not copy the underlying buffer"
+    td = TensorData(list(range(24)), (2, 3, 4))
+
+    permuted = td.permute(2, 0, 1)
+    viewed = td.view(6, 4)
+    sliced = td[1, :, 1:3]
+    for other in (permuted, viewed, sliced):
+        assert np.shares_memory(other._storage, td._storage)
+
+    assert sliced.shape == (3, 2)
+    assert sliced.get((2, 1)) == td.get((1, 2, 2))
+    assert viewed.get((5, 3)) == td.get((1, 2, 3))
+    assert permuted.get((3, 1, 2)) == td.get((1, 2, 3))
+
+    sliced.set((0, 0), -1.0)
+    assert td.get((1, 0, 1)) == -1.0
+
+    np.testing.assert_array_equal(
+        td.to_numpy()[1, :, 1:3], sliced.to_numpy(),
+    )
+
+
+@pytest.mark.task2_1
+def test_view_bad():
+    td = TensorData([0] * 6, (2, 3))
+    assert td.view(-1).shape == (6,)
+    with pytest.raises(IndexingError):
+        td.view(4, 2)
+    with pytest.raises(IndexingError):
+        td.permute(1, 0).view(6)
+    assert td.permute(1, 0).contiguous().view(6).shape == (6,)
@@ -0,0 +1,116 @@
+import minitorch
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import data, integers
+from minitorch import operators as op
+from minitorch import TensorData, IndexingError
+from minitorch.tensor_ops import TensorOps
+from .strategies import tensor_data, small_floats, assert_close
+
+
+@pytest.mark.task2_2
+def test_shape_broadcast():
+    c = minitorch.shape_broadcast((1,), (5, 5))
+    assert c == (5, 5)
+
+    c = minitorch.shape_broadcast((5, 5), (1,))
+    assert c == (5, 5)
+
+    c = minitorch.shape_broadcast((1, 5, 5), (5, 5))
+    assert c == (1, 5, 5)
+
+    c = minitorch.shape_broadcast((5, 1, 5, 1), (1, 5, 1, 5))
+    assert c == (5, 5, 5, 5)
+
+    with pytest.raises(IndexingError):
+        c = minitorch.shape_broadcast((5, 7, 5, 1), (1, 5, 1, 5))
+
+    with pytest.raises(IndexingError):
+        c = minitorch.shape_broadcast((5, 2), (5,))
+
+    c = minitorch.shape_broadcast((2, 5), (5,))
+    assert c == (2, 5)
+
+
+def reference_zip(fn, a, b):
+    "Index-by-index zip used to check the kernels."
+    shape = minitorch.shape_broadcast(a.shape, b.shape)
+    out = TensorData([0.0] * int(np.prod(shape)), shape)
+    a_index = [0] * a.dims
+    b_index = [0] * b.dims
+    for index in out.indices():
+        minitorch.broadcast_index(index, shape, a.shape, a_index)
+        minitorch.broadcast_index(index, shape, b.shape, b_index)
+        out.set(index, fn(a.get(tuple(a_index)), b.get(tuple(b_index))))
+    return out
+
+
+@pytest.mark.task2_2
+@given(data())
+def test_zip_broadcast(data):
+    a = data.draw(tensor_data(small_floats))
+    # Drop leading dims and set some of the rest to 1 to force broadcasting.
+    drop = data.draw(integers(min_value=0, max_value=a.dims - 1))
+    ones = [data.draw(integers(0, 1)) for _ in a.shape[drop:]]
+    shape = tuple(1 if o else s for o, s in zip(ones, a.shape[drop:]))
+    b = data.draw(tensor_data(small_floats, shape=shape))
+
+    for x, y in ((a, b), (b, a)):
+        out = TensorOps.zip(op.mul)(x, y)
+        assert_close(out.to_numpy(), reference_zip(op.mul, x, y).to_numpy())
+
+
+@pytest.mark.task2_2
+@given(tensor_data(small_floats))
+def test_map_permuted(td):
+    "Kernels follow the strides of permuted views"
+    order = list(reversed(range(td.dims)))
+    out = TensorOps.map(op.neg)(td.permute(*order))
+    assert_close(out.to_numpy(), -td.to_numpy().transpose(order))
+
+
+@pytest.mark.task2_2
+@given(data())
+def test_reduce_dim(data):
+    td = data.draw(tensor_data(small_floats))
+    dim = data.draw(integers(min_value=0, max_value=td.dims - 1))
+    a = td.to_numpy()
+
+    out = TensorOps.reduce(op.add, 0.0)(td, dim)
+    assert out.shape == td.shape[:dim] + (1,) + td.shape[dim + 1 :]
+    assert_close(out.to_numpy(), a.sum(axis=dim, keepdims=True))
+
+    out = TensorOps.reduce(op.max, -1e9)(td, dim)
+    assert_close(out.to_numpy(), a.max(axis=dim, keepdims=True))
+
+
+def sub(x, y):
+    return x - y
+
+
+@pytest.mark.task2_2
+def test_reduce_dim_compiled():
+    "Reduction with a function that has no ufunc keeps the list order"
+    td = TensorData(list(range(6)), (2, 3))
+    out = TensorOps.reduce(sub, 0.0)(td, 1)
+    expected = [op.reduce(sub, 0.0)([0, 1, 2]), op.reduce(sub, 0.0)([3, 4, 5])]
+    assert_close(out.to_numpy().reshape(-1), expected)
+    out = TensorOps.reduce(sub, 0.0)(td, 0)
+    assert_close(out.to_numpy().reshape(-1), [3.0, 3.0, 3.0])
+
+
+@pytest.mark.task2_2
+def test_linear_broadcast():
+    "`(N, 2) @ (2, H) + (H,)` as in a Linear layer"
+    N, H = 7, 4
+    x = np.random.rand(N, 2)
+    w = np.random.rand(2, H)
+    b = np.random.rand(H)
+    xw = TensorOps.matrix_multiply(TensorData(x, x.shape), TensorData(w, w.shape))
+    out = TensorOps.zip(op.add)(xw, TensorData(b, b.shape))
+    assert out.shape == (N, H)
+    assert_close(out.to_numpy(), x @ w + b)
+
+    with pytest.raises(IndexingError):
+        TensorOps.matrix_multiply(TensorData(w, w.shape), TensorData(w, w.shape))
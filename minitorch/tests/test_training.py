@@ -0,0 +1,109 @@
+import minitorch
+import numpy as np
+import pytest
+from .strategies import assert_close
+from .test_flat_parameters import Network
+
+
+def dataset(N=50, seed=0):
+    X = np.random.default_rng(seed).random((N, 2))
+    y = ((X[:, 0] < 0.5) != (X[:, 1] < 0.5)) * 1.0
+    return X, y
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_data_loader(prefetch):
+    "Every epoch visits each sample once, in a new order"
+    X, y = dataset()
+    loader = minitorch.DataLoader(X, y, batch_size=16, seed=1, prefetch=prefetch)
+    assert len(loader) == 4
+    orders = []
+    for epoch in range(2):
+        rows = []
+        for bx, by in loader:
+            assert bx.shape[1:] == (2,) and by.shape == (bx.shape[0],)
+            rows.append(bx.to_numpy())
+            assert_close(by.to_numpy(), ((rows[-1][:, 0] < 0.5) != (rows[-1][:, 1] < 0.5)) * 1.0)
+        rows = np.concatenate(rows)
+        assert len(rows) == len(X)
+        assert_close(np.sort(rows[:, 0]), np.sort(X[:, 0]))
+        orders.append(rows)
+    assert not np.array_equal(orders[0], orders[1])
+
+    # Prefetching does not change the batches.
+    other = minitorch.DataLoader(X, y, batch_size=16, seed=1, prefetch=2 - prefetch)
+    assert_close(np.concatenate([bx.to_numpy() for bx, _ in other]), orders[0])
+
+
+@pytest.mark.task2_4
+def test_data_loader_early_exit():
+    "Leaving an epoch early stops the prefetch thread"
+    X, y = dataset(1000)
+    loader = minitorch.DataLoader(X, y, batch_size=10, prefetch=2)
+    for epoch in range(3):
+        for i, _ in enumerate(loader):
+            if i == 2:
+                break
+
+
+def reference(optimizer, lr, steps, grads, **kwargs):
+    "The same optimizer written out with numpy, from zero parameters."
+    data = np.zeros_like(grads[0])
+    m = np.zeros_like(data)
+    v = np.zeros_like(data)
+    for t, g in enumerate(grads[:steps], 1):
+        if optimizer == "sgd":
+            m = kwargs["momentum"] * m + g
+            data = data - lr * m
+        else:
+            m = 0.9 * m + 0.1 * g
+            v = 0.999 * v + 0.001 * g ** 2
+            data = data - lr * (m / (1 - 0.9 ** t)) / (np.sqrt(v / (1 - 0.999 ** t)) + 1e-8)
+    return data
+
+
+@pytest.mark.task2_4
+@pytest.mark.parametrize(
+    "make, name, kwargs",
+    [
+        (lambda p: minitorch.SGD(p, 0.1, momentum=0.9), "sgd", {"momentum": 0.9}),
+        (lambda p: minitorch.SGD(p, 0.1), "sgd", {"momentum": 0.0}),
+        (lambda p: minitorch.Adam(p, 0.1), "adam", {}),
+    ],
+)
+def test_optimizers(make, name, kwargs):
+    "In place updates match the textbook formulas"
+    model = Network()
+    optimizer = make(model)
+    flat = optimizer.parameters
+    flat.data[...] = 0.0
+    storage = flat.data
+    grads = [np.random.default_rng(i).standard_normal(len(flat)) for i in range(3)]
+    for g in grads:
+        optimizer.zero_grad()
+        flat.grad[...] = g
+        optimizer.step()
+    assert flat.data is storage
+    assert_close(flat.data, reference(name, 0.1, 3, grads, **kwargs))
+
+
+@pytest.mark.task2_4
+def test_fit():
+    "Minibatch training lowers the loss and reports throughput"
+    X, y = dataset(100)
+    model = Network()
+    loader = minitorch.DataLoader(X, y, batch_size=20, seed=0)
+
+    def loss_fn(out, y):
+        out = out.view(y.shape[0])
+        return -((out * y) + (out - 1.0) * (y - 1.0)).log().sum()
+
+    seen = []
+    history = minitorch.fit(
+        model, loader, loss_fn, minitorch.Adam(model, 0.05), epochs=30, callback=seen.append
+    )
+    assert seen == history
+    assert [h["samples"] for h in history] == [100] * 30
+    assert all(h["samples_per_sec"] > 0 for h in history)
+    assert history[-1]["loss"] < history[0]["loss"]